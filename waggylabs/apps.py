@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class WaggyLabsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'waggylabs'
+    
+    def ready(self):
+        # connect signal receivers
+        from waggylabs import signals
+        # register system checks
+        from waggylabs import checks
@@ -1,4 +1,7 @@
+import re
 
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.blocks import StreamBlock
@@ -25,6 +28,36 @@ from waggylabs.blocks.post_category_list import PostCategoryListBlock
 from waggylabs.blocks.post_highlights import PostHighlightsBlock
 from waggylabs.blocks.post_tag_list import PostTagListBlock
 from waggylabs.blocks.table import TableBlock, TableFigureBlock
+from waggylabs.utils import markdown_to_text
+
+
+RE_REFERENCE = re.compile(r'\\(ref|eqref|cite)\{(.+?)\}')
+
+# Block types with labels and the type of the label (i.e. the numbering
+# they share), see prepareReferences in prepare-page.js
+LABEL_TYPES = {
+    'blockquote': 'blockquote',
+    'embed': 'embed',
+    'equation': 'equation',
+    'figure': 'figure',
+    'listing': 'listing',
+    'table': 'table',
+    'table_figure': 'table',
+}
+
+# Block types that list other pages, show page metadata or the cut
+# button, so their text is not a part of the page text, see search_texts
+TEXT_EXCLUDED_TYPES = [
+    'cut',
+    'page_info',
+    'post_archive',
+    'post_category',
+    'post_highlights',
+    'post_list',
+    'post_meta',
+    'post_series',
+    'post_tag_list',
+]
 
 
 class BaseBodyBlock(StreamBlock):
@@ -85,6 +118,127 @@ class BaseBodyBlock(StreamBlock):
         
         return blocks_by_types
     
+    @classmethod
+    def label_index(cls, body, pk):
+        """Returns dictionary of the element ids of the labelled blocks in
+        the body mapped to the (label type, number) tuples. The numbers are
+        the same as given by prepare-page.js, i.e. blocks of the same label
+        type and literature (label type cite) are numbered in the order of
+        appearance. Equations are numbered by MathJax, so their number
+        is None."""
+        index = {}
+        counters = {}
+        for block in cls.blocks_by_types(body, list(LABEL_TYPES)):
+            label_type = LABEL_TYPES[block.block_type]
+            counters[label_type] = counters.get(label_type, 0) + 1
+            if block.value.get('label'):
+                index['{}-{}'.format(block.value['label'], pk)] = (
+                    label_type,
+                    counters[label_type] if label_type != 'equation' else None,
+                )
+        for number, block in enumerate(cls.blocks_by_types(body, ['citation', 'document']), 1):
+            if block.block_type == 'document':
+                index[block.value['label']] = ('cite', number)
+            else:
+                index['{}-{}'.format(block.value['label'], pk)] = ('cite', number)
+        return index
+    
+    @classmethod
+    def search_texts(cls, body):
+        """Returns dictionary of the lists of clean text extracted from the
+        body for the search index: main text, captions (and other short
+        texts, such as headings and citations), table cells and code.
+        Nested blocks of accordions, collapses and columns are walked
+        through, blocks listing other pages are skipped."""
+        texts = {'text': [], 'captions': [], 'tables': [], 'code': []}
+        cls._search_texts(body or [], texts)
+        return texts
+    
+    @classmethod
+    def _search_texts(cls, blocks, texts):
+        for block in blocks:
+            block_type = block.block_type
+            value = block.value
+            if block_type in TEXT_EXCLUDED_TYPES:
+                continue
+            if block_type == 'text':
+                texts['text'].append(markdown_to_text(value))
+            elif block_type == 'blockquote':
+                texts['text'].append(markdown_to_text(value['quote']))
+                texts['captions'].extend([value['author'], value['source']])
+            elif block_type == 'citation':
+                texts['captions'].append(value['citation'])
+            elif block_type == 'card_grid':
+                for card in value['items']:
+                    texts['captions'].extend([card['title'], card['subtitle']])
+                    texts['text'].append(markdown_to_text(card['text']))
+            elif block_type == 'carousel':
+                for item in value['items']:
+                    texts['captions'].append(markdown_to_text(item['caption']))
+            elif block_type == 'accordion':
+                for item in value['items']:
+                    texts['captions'].append(item['heading'])
+                    cls._search_texts(item['body'], texts)
+            elif block_type == 'collapse':
+                texts['captions'].append(value['text'])
+                cls._search_texts(value['body'], texts)
+            elif block_type == 'columns':
+                for item in value['items']:
+                    cls._search_texts(item['body'], texts)
+            elif isinstance(value, dict):
+                # figure, embed, equation, listing, table, etc.
+                # have captions and footers
+                for name in ('caption', 'footer'):
+                    if value.get(name):
+                        texts['captions'].append(markdown_to_text(value[name]))
+                if block_type == 'listing':
+                    texts['code'].append(value['code']['code'])
+                if block_type == 'table' and value['table']:
+                    texts['tables'].extend(
+                        cell for row in value['table'].get('data') or [] for cell in row if cell
+                    )
+    
+    @staticmethod
+    def resolve_references(html, index, visible, url):
+        """Replaces references and citations in the rendered html with
+        the numbers from the label index. References to the blocks that are
+        not rendered (not in visible) link to the blocks on the page url.
+        References to visible equations are left for MathJax."""
+        def replace(match):
+            (command, labels) = match.groups()
+            if command == 'cite':
+                numbers = []
+                for label in labels.split(','):
+                    if label in index and index[label][0] == 'cite':
+                        numbers.append((index[label][1], label))
+                    else:
+                        numbers.append((None, label))
+                links = [
+                    '<span class="reference"><a href="{}#{}">{}</a></span>'.format(
+                        url, escape(label), number
+                    ) if number is not None else
+                    '<span class="reference"><a href="#">???</a></span>'
+                    for (number, label) in sorted(numbers, key=lambda n: (n[0] is None, n[0] or 0))
+                ]
+                return '[' + ','.join(links) + ']'
+            if labels not in index:
+                return match.group(0)
+            (label_type, number) = index[labels]
+            if labels in visible:
+                if label_type == 'equation':
+                    return match.group(0)
+                return '<span class="reference"><a href="#{}">{}</a></span>'.format(
+                    escape(labels), number)
+            if number is None:
+                # equation is not rendered, so its number is unknown
+                number = '&hellip;'
+            if command == 'eqref':
+                number = '({})'.format(number)
+            return '<span class="reference"><a href="{}#{}">{}</a></span>'.format(
+                url, escape(labels), number)
+        
+        return RE_REFERENCE.sub(replace, html)
+    
     def render(self, value, context):
         if type(value) is not dict:
             value = { 'body': value }
@@ -119,11 +273,9 @@ class BaseBodyBlock(StreamBlock):
         
         if 'page_in_list' in context:
             # page is rendered in the list, e.g. after search
-            # we need to display blocks in page.body only those that before cut
-            # other blocks may be rendereded truncated, for example, to avoid image 
-            # loading and use of traffic
-            # however, literature, equations and all label blocks must be rendered
-            # hidden in order to correctly generate reference and citations
+            # only blocks before cut are rendered to avoid rendering the whole
+            # post, image loading and use of traffic, references and citations
+            # are numbered on the server using the label index of the whole body
             before_cut = []
             after_cut = []
             cut_met = False
@@ -137,6 +289,16 @@ class BaseBodyBlock(StreamBlock):
             value['before_cut'] = before_cut
             value['after_cut'] = after_cut
             
+            if after_cut:
+                page = context['page']
+                html = super().render(value, context)
+                return mark_safe(BaseBodyBlock.resolve_references(
+                    html,
+                    BaseBodyBlock.label_index(value['body'], page.pk),
+                    BaseBodyBlock.label_index(before_cut, page.pk),
+                    page.get_url(context.get('request')) or '',
+                ))
+            
         return super().render(value, context)
     
     class Meta:
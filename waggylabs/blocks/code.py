@@ -3,7 +3,7 @@ from django.utils.translation import gettext_lazy as _
 
 from wagtail.blocks import ChoiceBlock, TextBlock, StructBlock
 
-from wagtailmarkdown.blocks import render_markdown
+from waggylabs.utils.markdown import render_markdown
 
 # list of pairs for code block; first value must indicate the valid
 # codemirror mode file (e.g., stex, clike, etc), https://codemirror.net/5/mode/;
@@ -4,9 +4,8 @@ from django.utils.translation import gettext_lazy as _
 
 from wagtail.blocks import TextBlock
 
-from wagtailmarkdown.blocks import render_markdown
-
 from waggylabs.utils import pk_to_markdown
+from waggylabs.utils.markdown import render_markdown
 from waggylabs.widgets import MarkdownTextarea
 
 
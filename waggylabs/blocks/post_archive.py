@@ -1,16 +1,16 @@
-from django.apps import apps
-from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.blocks import (
     ChoiceBlock, StructBlock, PageChooserBlock,
-    IntegerBlock, CharBlock
+    IntegerBlock, CharBlock, BooleanBlock
 )
 
 from waggylabs.blocks.styling import (
-   ListStyleChoiceBlock, ListItemStyleChoiceBlock
+   ListStyleChoiceBlock, ListItemStyleChoiceBlock, BadgeStyleChoiceBlock,
+   BadgeLocationChoiceBlock
 )
 from waggylabs.blocks.wrapper import WrapperBlock, FooterWrapperBlock
+from waggylabs.models.post_counts import PostArchiveCount
 
 
 class PostArchiveItemBlock(StructBlock):
@@ -71,26 +71,38 @@ class PostArchiveItemBlock(StructBlock):
                     'number of archive links to show, button to show '
                     'more links appears with the specified text.')
     )
+    show_badges = BooleanBlock(
+        required=False,
+        label=_('Show number of posts per archive link'),
+    )
+    badge_style = BadgeStyleChoiceBlock(
+        label=_('Post number style'),
+    )
+    badge_location = BadgeLocationChoiceBlock(
+        label=_('Post number location'),
+    )
         
     def render(self, value, context=None):
-        post_page_model = apps.get_model('waggylabs', 'PostPage')
-        archive_query = None
-        more_archives_query = None
+        archives = None
+        more_archives = None
         
         if not value['post_list_page'] and \
             context['page'].specific_class.__name__ == 'PostListPage':
             value['post_list_page'] = context['page']
             
         if 'post_list_page' in value and value['post_list_page']:
-            archive_query = post_page_model.objects.descendant_of(value['post_list_page'])\
-                .live().dates('first_published_at', value['archive_period'], order=value['order_by'])
+            # precomputed archive dates with numbers of posts, see PostArchiveCount
+            archives = list(PostArchiveCount.objects.filter(
+                post_list_page=value['post_list_page'],
+                period=value['archive_period'],
+            ).order_by('-date' if value['order_by'] == 'DESC' else 'date'))
         
-            if value['archives_number'] > 0 and archive_query.count() > value['archives_number']:
-                archive_query = archive_query[0:value['archives_number']]
-                more_archives_query = archive_query[value['archives_number']:]
+            if value['archives_number'] > 0 and len(archives) > value['archives_number']:
+                more_archives = archives[value['archives_number']:]
+                archives = archives[0:value['archives_number']]
             
-        value['archives'] = archive_query
-        value['more_archives'] = more_archives_query
+        value['archives'] = archives
+        value['more_archives'] = more_archives
         return super().render(value, context)
     
     class Meta:
@@ -1,5 +1,4 @@
-from django.apps import apps
-from django.db.models import Count
+from django.db.models import F
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.blocks import (
@@ -12,7 +11,7 @@ from waggylabs.blocks.styling import (
     BadgeLocationChoiceBlock
 )
 from waggylabs.blocks.wrapper import WrapperBlock
-from waggylabs.models.post_category import PostCategory, PostPagePostCategory
+from waggylabs.models.post_category import PostCategory
 
 
 class PostCategoryListItemBlock(StructBlock):
@@ -65,8 +64,6 @@ class PostCategoryListItemBlock(StructBlock):
     )
         
     def render(self, value, context):
-        # needed to avoid circular imports
-        post_page_model = apps.get_model('waggylabs', 'PostPage')
         category_query =  None
         
         if not value['post_list_page'] and \
@@ -74,21 +71,18 @@ class PostCategoryListItemBlock(StructBlock):
             value['post_list_page'] = context['page']
             
         if 'post_list_page' in value and value['post_list_page']:
+            # categories with precomputed numbers of posts, see PostCategoryCount
             category_query = PostCategory.objects.filter(
-                id__in=PostPagePostCategory.objects.filter(
-                    post_page__in=post_page_model.objects.descendant_of(value['post_list_page']).live()
-                ).values('post_category__id').distinct())
-
-            if value['show_badges']:
-                category_query = category_query.annotate(num_posts=Count('post_pages'))
+                counts__post_list_page=value['post_list_page'],
+            ).annotate(num_posts=F('counts__num_posts'))
         
             if not value['order_by']:
                 value['order_by'] = '-created_at'
-            category_query = category_query.order_by(value['order_by'])
+            category_query = category_query.order_by(value['order_by'], 'pk')
             
             if value['categories_number'] > 0:
                 category_query = category_query[0:value['categories_number']]
-                
+            category_query = list(category_query)
             
         value['categories'] = category_query
         return super().render(value, context)
@@ -1,15 +1,18 @@
+from django.http import QueryDict
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.blocks import (
     CharBlock, ChoiceBlock, StructBlock, IntegerBlock,
     BooleanBlock
 )
+from wagtail.search.backends.base import BaseSearchResults
 
 from waggylabs.blocks.icon import IconBlock, IconLocationBlock
 from waggylabs.blocks.styling import (
     HeaderStyleChoiceBlock, CardStyleChoiceBlock
 ) 
 from waggylabs.models.post_page import PostPage
+from waggylabs.utils.pagination import keyset_page
 from waggylabs.widgets import DisabledOptionSelect
 
 
@@ -111,6 +114,15 @@ class PostListBlock(StructBlock):
         default='',
         label=_('Paginator text size'),
     )
+    pagination_mode = ChoiceBlock(
+        required=False,
+        choices=[
+            ('', _('Page numbers')),
+            ('keyset', _('Previous and next pages (fast for long lists)')),
+        ],
+        default='',
+        label=_('Pagination mode'),
+    )
     posts_per_page = IntegerBlock(
         required=True,
         min_value=1,
@@ -193,16 +205,62 @@ class PostListBlock(StructBlock):
             
         if not value['order_by']:
             value['order_by'] = '-created_at'
+        order_by = value['order_by']
             
-        pinned_posts_query = pinned_posts_query.order_by(value['order_by'])
-        posts_query = posts_query.order_by(value['order_by'])
+        pinned_posts_query = pinned_posts_query.order_by(order_by)
+        posts_query = posts_query.order_by(order_by)
             
         value['pinned_posts'] = pinned_posts_query
         value['posts'] = posts_query
+        if value['pagination_mode'] == 'keyset' and isinstance(context.get('posts'), BaseSearchResults):
+            # search results are ordered by relevance, which cannot be
+            # a keyset, so they are paginated with page numbers
+            value['pagination_mode'] = ''
+        if value['pagination_mode'] == 'keyset':
+            request = context.get('request')
+            # posts filtered by PostListPage routes (date, tag, etc.)
+            if context.get('filter_term') is not None and context.get('posts') is not None:
+                posts_query = context['posts'].descendant_of(page) \
+                    .select_related('owner__wagtail_userprofile')
+                if value['show_scrollspy']:
+                    posts_query = posts_query.prefetch_related('post_categories', 'tags')
+            keyset = keyset_page(
+                posts_query,
+                order_by,
+                value['posts_per_page'],
+                request.GET.get('cursor') if request else None,
+            )
+            value['posts'] = keyset['items']
+            value['is_first_page'] = keyset['previous_cursor'] is None
+            value['first_page_url'] = self.cursor_url(request, '')
+            value['previous_page_url'] = self.cursor_url(request, keyset['previous_cursor'])
+            value['next_page_url'] = self.cursor_url(request, keyset['next_cursor'])
         value['show_footer'] = value['show_username'] or value['show_avatar'] or \
             value['show_first_published_at'] or value['show_time']
         return super().render(value, context)
     
+    def get_context(self, value, parent_context=None):
+        context = super().get_context(value, parent_context=parent_context)
+        if value['pagination_mode'] == 'keyset':
+            # the template iterates over posts, which are paginated by
+            # django-el-pagination in the page numbers mode
+            context['posts'] = value['posts']
+        return context
+    
+    @staticmethod
+    def cursor_url(request, cursor):
+        """Returns query string of the current request with the cursor
+        or None if there is no cursor. Empty cursor is removed from the
+        query string, i.e. the URL is of the first page."""
+        if cursor is None:
+            return None
+        query = request.GET.copy() if request is not None else QueryDict(mutable=True)
+        if cursor:
+            query['cursor'] = cursor
+        else:
+            query.pop('cursor', None)
+        return '?' + query.urlencode()
+    
     class Meta:
         icon = 'post-list-page'
         label = _('Post list')
@@ -1,5 +1,3 @@
-from django.apps import apps
-from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.blocks import (
@@ -11,10 +9,21 @@ from waggylabs.blocks.styling import (
     LinkStyleChoiceBlock, BadgeStyleChoiceBlock, BadgeLocationChoiceBlock
 )
 from waggylabs.blocks.wrapper import WrapperBlock
-from waggylabs.models.post_tags import PostPageTag
+from waggylabs.models.post_counts import PostTagCount
 # from waggylabs.models.post_page import PostPage
 
 
+# tags have no creation date, so creation order is the order of ids
+ORDER_BY_FIELDS = {
+    'created_at': 'tag__id',
+    '-created_at': '-tag__id',
+    'slug': 'tag__slug',
+    '-slug': '-tag__slug',
+    'num_posts': 'num_posts',
+    '-num_posts': '-num_posts',
+}
+
+
 class PostTagListItemBlock(StructBlock):
     """Item block to show post tag."""
     post_list_page = PageChooserBlock(
@@ -64,30 +73,24 @@ class PostTagListItemBlock(StructBlock):
     )
         
     def render(self, value, context):
-        # needed to avoid circular imports
-        post_page_model = apps.get_model('waggylabs', 'PostPage')
         tag_query =  None
         if not value['post_list_page'] and \
             context['page'].specific_class.__name__ == 'PostListPage':
             value['post_list_page'] = context['page']
             
         if 'post_list_page' in value and value['post_list_page']:
-            tag_query = PostPageTag.objects.filter(
-                content_object_id__in=post_page_model.objects.descendant_of(value['post_list_page']).live()
-            ).values('tag__id', 'tag__slug', 'tag__name')
-
-            if value['show_badges']:
-                tag_query = tag_query.annotate(tag__num_posts=Count('tag__id'))
+            # tags with precomputed numbers of posts, see PostTagCount
+            tag_query = PostTagCount.objects.filter(
+                post_list_page=value['post_list_page'],
+            ).values('tag__id', 'tag__slug', 'tag__name', 'num_posts')
         
             if not value['order_by']:
                 value['order_by'] = '-created_at'
-            
-            value['order_by'] = '-tag__' + value['order_by'][1:] if value['order_by'][0] == '-' else \
-                'tag__' + value['order_by']
-            tag_query = tag_query.order_by(value['order_by'])
+            tag_query = tag_query.order_by(ORDER_BY_FIELDS.get(value['order_by'], 'tag__slug'), 'tag__id')
                 
             if value['tags_number'] > 0:
                 tag_query = tag_query[0:value['tags_number']]
+            tag_query = list(tag_query)
                 
         value['tags'] = tag_query
         return super().render(value, context)
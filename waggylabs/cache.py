@@ -0,0 +1,297 @@
+import hashlib
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+
+from asgiref.local import Local
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+
+from wagtail.models import Site
+
+
+# Page output cache is opt-in, since it changes the way the pages are
+# served: anonymous requests get the HTML rendered for the previous visitor
+PAGE_CACHE = getattr(settings, 'WAGGYLABS_PAGE_CACHE', False)
+PAGE_CACHE_TIMEOUT = getattr(settings, 'WAGGYLABS_PAGE_CACHE_TIMEOUT', 60 * 60 * 24)
+
+# Cache backend for all WaggyLabs caches and buffers
+CACHE_ALIAS = getattr(settings, 'WAGGYLABS_CACHE_ALIAS', 'default')
+
+# Cache backends that keep entries in the memory of each process or do
+# not keep them at all, so they are not shared between the processes
+LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.dummy.DummyCache',
+    'django.core.cache.backends.locmem.LocMemCache',
+)
+
+# Rendered templates contain this string instead of the CSRF token,
+# it is replaced with the token of the current visitor when served
+CSRF_TOKEN_PLACEHOLDER = 'waggylabs-csrf-token-placeholder'
+
+CONTENT_GENERATION_KEY = 'waggylabs:content-generation'
+
+# Content generation read by the current request, so that it is fetched
+# from the cache once per request, see request_content_generation
+_request_generation = Local()
+
+
+def get_cache():
+    """Returns Django cache backend used for WaggyLabs caches."""
+    return caches[CACHE_ALIAS]
+
+
+def cache_is_shared():
+    """Returns True if the cache backend of the WaggyLabs caches is shared
+    between processes. Content generation kept in the local memory cache
+    is increased only in the process that changed the content, so other
+    processes keep serving the cached content that is not valid."""
+    backend = settings.CACHES.get(CACHE_ALIAS, {}).get('BACKEND')
+    return backend is not None and backend not in LOCAL_CACHE_BACKENDS
+
+
+def get_content_generation():
+    """Returns the current content generation. The generation is
+    a counter that is increased every time the published content
+    of the site changes, i.e. when a page is published, unpublished
+    or moved. All cache keys that include the generation become stale
+    at once after it is increased. During a request the generation
+    is read from the cache once and then reused."""
+    if getattr(_request_generation, 'value', None) is not None:
+        return _request_generation.value
+    cache = get_cache()
+    generation = cache.get(CONTENT_GENERATION_KEY)
+    if generation is None:
+        # never expires, otherwise stale entries may become fresh again
+        cache.add(CONTENT_GENERATION_KEY, 1, timeout=None)
+        generation = cache.get(CONTENT_GENERATION_KEY, 1)
+    if getattr(_request_generation, 'active', False):
+        _request_generation.value = generation
+    return generation
+
+
+def request_content_generation(active):
+    """Starts (active is True) or ends reusing the content generation
+    read by the current request. Called when requests start and finish
+    (see waggylabs.signals), outside of requests the generation is read
+    from the cache every time, since other processes may increase it."""
+    _request_generation.active = active
+    _request_generation.value = None
+
+
+def bump_content_generation():
+    """Increases the content generation making all the cached
+    content stale."""
+    cache = get_cache()
+    # the next read in the current request gets the new generation
+    _request_generation.value = None
+    try:
+        return cache.incr(CONTENT_GENERATION_KEY)
+    except ValueError:
+        # the key is missing, e.g. after cache has been cleared
+        cache.add(CONTENT_GENERATION_KEY, 2, timeout=None)
+        return cache.get(CONTENT_GENERATION_KEY, 2)
+
+
+def page_cache_applies(request):
+    """Checks if the response for the request can be taken from
+    (or stored to) the page cache. Only anonymous GET and HEAD requests
+    outside of the page previews are cached, since for logged in users
+    Wagtail user bar and other per-user content is rendered."""
+    if not PAGE_CACHE:
+        return False
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    if getattr(request, 'is_preview', False):
+        return False
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return False
+    return True
+
+
+def page_cache_key(page, request):
+    """Creates cache key for the rendered page. The key includes
+    page id, live revision id, site, full path of the request (i.e. the
+    routable sub-path and query string, e.g. pagination) and content
+    generation."""
+    site = Site.find_for_request(request)
+    path = hashlib.md5(request.get_full_path().encode('utf-8')).hexdigest()
+    return 'waggylabs:page:{}:{}:{}:{}:{}'.format(
+        site.pk if site else 0,
+        page.pk,
+        page.live_revision_id,
+        get_content_generation(),
+        path,
+    )
+
+
+def get_cached_page(page, request):
+    """Returns HttpResponse with the cached page or None if the page
+    has not been cached yet."""
+    cached = get_cache().get(page_cache_key(page, request))
+    if cached is None:
+        return None
+    content, content_type = cached
+    return HttpResponse(punch_in_csrf_token(content, request), content_type=content_type)
+
+
+def cache_page_response(page, request, response):
+    """Renders the TemplateResponse of the page with the placeholder
+    instead of the CSRF token, stores the result in the cache and returns
+    the response with the CSRF token of the current visitor."""
+    if hasattr(response, 'context_data') and response.context_data is not None:
+        response.context_data['csrf_token'] = CSRF_TOKEN_PLACEHOLDER
+    if hasattr(response, 'render'):
+        response.render()
+    if response.status_code == 200 and not response.streaming:
+        get_cache().set(
+            page_cache_key(page, request),
+            (response.content, response.get('Content-Type')),
+            timeout=PAGE_CACHE_TIMEOUT,
+        )
+        response.content = punch_in_csrf_token(response.content, request)
+    return response
+
+
+def punch_in_csrf_token(content, request):
+    """Replaces the CSRF token placeholder in the cached content with
+    the token for the current request."""
+    placeholder = CSRF_TOKEN_PLACEHOLDER.encode('utf-8')
+    if placeholder in content:
+        content = content.replace(placeholder, get_token(request).encode('utf-8'))
+    return content
+
+
+class CacheBuffer:
+    """Append-only buffer of items kept in the Django cache, which is
+    shared between the processes serving the site. Items are appended
+    during requests and drained in batches, e.g. by a management command.
+    Each item is stored under its own key with increasing index, so
+    appending is a single atomic increment and a set."""
+
+    def __init__(self, name, timeout=60 * 60 * 24 * 7, missing_timeout=60, lock_timeout=60 * 5):
+        self.prefix = 'waggylabs:buffer:' + name
+        self.timeout = timeout
+        self.missing_timeout = missing_timeout
+        self.lock_timeout = lock_timeout
+
+    def _key(self, suffix):
+        return '{}:{}'.format(self.prefix, suffix)
+
+    def append(self, item):
+        """Appends item to the end of the buffer."""
+        cache = get_cache()
+        index = self._next_index(cache)
+        # the tail may have been evicted and started again at the head,
+        # so the index may be taken by an item that is not drained yet
+        while not cache.add(self._key(index), item, timeout=self.timeout):
+            index = self._next_index(cache)
+
+    def _next_index(self, cache):
+        try:
+            return cache.incr(self._key('tail'))
+        except ValueError:
+            # the tail starts after the head, also when it has been
+            # evicted, so that the new items are not behind the head
+            cache.add(self._key('tail'), cache.get(self._key('head'), 0), timeout=None)
+            return cache.incr(self._key('tail'))
+
+    @contextmanager
+    def batch(self, max_items=1000):
+        """Context manager that gives up to max_items from the beginning
+        of the buffer and removes them from the buffer when the block
+        exits without exception, so the items are not lost if they fail
+        to be saved. Gives empty list if the buffer is being drained
+        by another process."""
+        cache = get_cache()
+        lock = self._key('lock')
+        if not cache.add(lock, 1, timeout=self.lock_timeout):
+            yield []
+            return
+        try:
+            (head, keys, items) = self._pending(cache, max_items)
+            yield items
+            cache.set(self._key('head'), head + len(keys), timeout=None)
+            cache.delete_many(keys)
+        finally:
+            cache.delete(lock)
+
+    def _pending(self, cache, max_items):
+        """Returns the head index, keys and items of up to max_items items
+        after the head. Items are drained in order, so they end before the
+        first missing item, which has either not been set by append yet
+        or has been lost (expired or evicted). Items that are missing for
+        longer than missing_timeout are lost and skipped."""
+        head = cache.get(self._key('head'), 0)
+        tail = cache.get(self._key('tail'), 0)
+        if tail < head:
+            # the tail has been lost and started again behind the head
+            head = 0
+        while head < tail:
+            keys = [self._key(index) for index in range(head + 1, min(tail, head + max_items) + 1)]
+            items = cache.get_many(keys)
+            count = 0
+            while count < len(keys) and keys[count] in items:
+                count = count + 1
+            if count > 0:
+                return (head, keys[:count], [items[key] for key in keys[:count]])
+            if not self._is_lost(cache, head + 1):
+                break
+            # skip the lost items till the next existing item
+            head = head + next((count for (count, key) in enumerate(keys) if key in items), len(keys))
+            cache.set(self._key('head'), head, timeout=None)
+        return (head, [], [])
+
+    def _is_lost(self, cache, index):
+        """Checks if the item with the index has been missing for longer
+        than missing_timeout. The time when the item was found missing
+        is kept in the cache."""
+        key = self._key('missing')
+        missing = cache.get(key)
+        if missing is None or missing[0] != index:
+            cache.set(key, (index, time.time()), timeout=None)
+            return False
+        return time.time() - missing[1] > self.missing_timeout
+
+
+class LRUCache:
+    """In-process cache of up to maxsize items, which drops the least
+    recently used items first. It is put in front of the shared Django
+    cache for the values that are read many times per request. Safe to
+    use from several threads."""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key, default=None):
+        """Returns the item for the key and marks it as recently used."""
+        with self.lock:
+            try:
+                self.items.move_to_end(key)
+            except KeyError:
+                return default
+            return self.items[key]
+
+    def set(self, key, value):
+        """Stores the item and drops the least recently used items
+        above maxsize."""
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            self.items[key] = value
+            self.items.move_to_end(key)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def clear(self):
+        """Removes all the items."""
+        with self.lock:
+            self.items.clear()
@@ -0,0 +1,61 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from waggylabs.cache import CACHE_ALIAS, PAGE_CACHE, cache_is_shared
+
+
+@register()
+def cache_backend_check(app_configs, **kwargs):
+    """Warns if the caches invalidated by the content generation are
+    enabled with the cache backend that is not shared between processes,
+    since the processes that did not change the content serve stale
+    cached content, and if the buffers that other processes cannot read
+    are enabled."""
+    from waggylabs.search import SEARCH_CACHE
+    from waggylabs.utils.markdown import MARKDOWN_CACHE
+    if cache_is_shared():
+        return []
+    errors = []
+    if PAGE_CACHE:
+        errors.append(Warning(
+            'WAGGYLABS_PAGE_CACHE is enabled, but the "{}" cache backend '
+            'is not shared between processes.'.format(CACHE_ALIAS),
+            hint='Use a shared cache backend (e.g. Redis or Memcached) '
+                 'if the site is served by several processes.',
+            id='waggylabs.W005',
+        ))
+    if SEARCH_CACHE:
+        errors.append(Warning(
+            'WAGGYLABS_SEARCH_CACHE is enabled, but the "{}" cache backend '
+            'is not shared between processes.'.format(CACHE_ALIAS),
+            hint='Use a shared cache backend (e.g. Redis or Memcached) '
+                 'if the site is served by several processes.',
+            id='waggylabs.W001',
+        ))
+    if MARKDOWN_CACHE:
+        errors.append(Warning(
+            'WAGGYLABS_MARKDOWN_CACHE is enabled, but the "{}" cache backend '
+            'is not shared between processes.'.format(CACHE_ALIAS),
+            hint='Use a shared cache backend (e.g. Redis or Memcached) '
+                 'if the site is served by several processes.',
+            id='waggylabs.W002',
+        ))
+    if getattr(settings, 'WAGGYLABS_HIT_COUNT_BUFFERED', False):
+        errors.append(Warning(
+            'WAGGYLABS_HIT_COUNT_BUFFERED is enabled, but the "{}" cache backend '
+            'is not shared between processes, so page hits are saved '
+            'to the database on every request.'.format(CACHE_ALIAS),
+            hint='Use a shared cache backend (e.g. Redis or Memcached), '
+                 'so that the flush_hits management command reads the buffered hits.',
+            id='waggylabs.W003',
+        ))
+    if getattr(settings, 'WAGGYLABS_SEARCH_QUERIES_BUFFERED', False):
+        errors.append(Warning(
+            'WAGGYLABS_SEARCH_QUERIES_BUFFERED is enabled, but the "{}" cache backend '
+            'is not shared between processes, so search queries are saved '
+            'to the database on every search request.'.format(CACHE_ALIAS),
+            hint='Use a shared cache backend (e.g. Redis or Memcached), so that '
+                 'the flush_search_queries management command reads the buffered queries.',
+            id='waggylabs.W004',
+        ))
+    return errors
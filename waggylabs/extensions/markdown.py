@@ -1,34 +1,231 @@
 
 import emoji
 import html
-import xml.etree.ElementTree as etree
+import re
+import unicodedata
+
+from functools import lru_cache
 
 from markdown.extensions import Extension
-from markdown.inlinepatterns import InlineProcessor, SimpleTagInlineProcessor
+from markdown.inlinepatterns import SimpleTagInlineProcessor
 from markdown.postprocessors import Postprocessor
 from markdown.preprocessors import Preprocessor
-from markdown.util import AtomicString
 
 
-class DollarSignPreprocessor(Preprocessor):
-    """Preprocessor to replace \$ symbol with '{{DOLLAR}}' to avoid its determination as LaTeX equation."""
+# Text without math is skipped in one match, i.e. all characters but
+# backticks, backslashes, $ signs, < and ], and escaped characters other
+# than \$, \\(, \\[ and \begin. The match then ends with the opener of
+# a math span (\\( and \\[ are MathJax delimiters escaped for Markdown),
+# a code span, an inline HTML tag or autolink, a link URL, an escaped
+# $ sign, a backslash, < or ], or the end of the text
+RE_MATH_START = re.compile(
+    r'(?:[^`\\$<\]]+|\\(?!begin\{)[^\\$]|\\\\(?![(\[]))*'
+    r'(?:(?P<opener>(?P<code>`+)|\\\\(?P<inline>\()|\\\\(?P<block>\[)|'
+    r'\\begin\{(?P<env>[^}\n]+)\}|(?P<dollar>\\\$)|(?P<math>\$+)|'
+    r'(?P<skip><(?:/?[a-zA-Z][^<>@ ]*(?: (?:[^<>\n]|\n(?![ \t]*\n))*)?|!--.*?--)>|'
+    r'\]\((?:[^()\s]|\([^()\s]*\))*)|'
+    r'\\.?|[<\]])|\Z)',
+    re.DOTALL
+)
+# list item, which following indented blocks are not code blocks
+RE_LIST_ITEM = re.compile(r'[ ]{0,3}(?:[*+-]|\d+\.)[ \t]')
+# inline $...$ math cannot contain new lines and unescaped $ signs
+RE_DOLLAR_MATH = re.compile(r'((?:[^$\n\\]|\\[^\n])+)\$+')
+# math and code spans cannot continue to the next paragraph
+RE_BLANK_LINE = re.compile(r'\n[ \t]*\n')
+
+# Code and preformatted blocks and HTML tags are skipped by the emoji
+# postprocessor, only the text between them is emojized. Emoji :names:
+# cannot contain < and >, so only tags with two colons can have them
+RE_EMOJI_SKIP = re.compile(r'<(?:(pre|code)\b.*?</\1\s*>|[^>:]*:[^>:]*:[^>]*>)',
+                           re.DOTALL | re.IGNORECASE)
+
+
+def math_html(tag, math):
+    """Returns HTML of the math passed to MathJax unmodified, except for
+    the new lines removed and basic entity substitutions."""
+    return '<{}>{}</{}>'.format(tag, html.escape(math.replace('\n', '')), tag)
+
+
+class MathPreprocessor(Preprocessor):
+    """Preprocessor that finds all the math in one scan of the text and
+    replaces it with placeholders of the HTML stash, so the math is not
+    processed as Markdown and is put back as is when HTML is rendered.
+    Inline math is $...$ (or $$...$$) and \\\\(...\\\\), display math is
+    \\\\[...\\\\] and \\begin{...}...\\end{...}. Escaped \\$ outside of
+    the math is a dollar sign, code spans are skipped. Fenced code is
+    already stashed by the fenced_code extension, indented code blocks,
+    inline HTML tags and link URLs are copied as is."""
+
     def run(self, lines):
-        new_lines = []
+        text = '\n'.join(lines)
+        if '$' not in text and '\\' not in text:
+            return lines
+        result = []
+        for (code, block) in self.code_blocks(lines):
+            result.extend(block if code else self.replace_math('\n'.join(block)).split('\n'))
+        return result
+
+    def code_blocks(self, lines):
+        """Splits lines into (is code, lines) blocks. Indented code block
+        starts after a blank line with a line indented by tab_length
+        spaces or a tab, unless it continues a list item, and ends with
+        the first line that is not indented."""
+        indent = ' ' * self.md.tab_length
+        blocks = []
+        (blank, in_list, code) = (True, False, False)
         for line in lines:
-            new_lines.append(line.replace('\\$', '{{DOLLAR}}'))
-        return new_lines
+            if line.strip():
+                indented = line.startswith(indent) or line.startswith('\t')
+                if blank and indented:
+                    code = code or not in_list
+                elif not indented or not code:
+                    code = False
+                    if blank:
+                        in_list = bool(RE_LIST_ITEM.match(line))
+            if not blocks or code != blocks[-1][0]:
+                blocks.append((code, []))
+            blocks[-1][1].append(line)
+            blank = not line.strip()
+        return blocks
+
+    def replace_math(self, text):
+        """Returns the text with the math replaced with placeholders."""
+        parts = []
+        position = 0
+        paragraph_end = -1
+        match = RE_MATH_START.match(text)
+        while match.group('opener') is not None:
+            (start, end) = match.span('opener')
+            if start >= paragraph_end:
+                # closing delimiters are searched only till the end of
+                # the paragraph, delimiters that are not found there are
+                # not searched again, so the scan stays linear
+                blank_line = RE_BLANK_LINE.search(text, start)
+                paragraph_end = blank_line.start() if blank_line else len(text)
+                missing = set()
+            (closer, tag, math) = (None, None, None)
+            if match.group('code'):
+                closer = match.group('code')
+            elif match.group('inline'):
+                (closer, tag) = ('\\\\)', 'span')
+            elif match.group('block'):
+                (closer, tag) = ('\\\\]', 'p')
+            elif match.group('env'):
+                (closer, tag) = ('\\end{' + match.group('env') + '}', 'p')
+            elif match.group('dollar'):
+                parts.append(text[position:start] + '$')
+                position = end
+            elif match.group('math'):
+                dollar_math = RE_DOLLAR_MATH.match(text, end)
+                if dollar_math:
+                    (tag, math) = ('span', '\\(' + dollar_math.group(1) + '\\)')
+                    end = dollar_math.end()
+
+            if closer is not None and closer not in missing:
+                close = self.find_closer(text, closer, end, paragraph_end)
+                if close < 0:
+                    missing.add(closer)
+                elif match.group('code'):
+                    end = close + len(closer)
+                elif match.group('env'):
+                    end = close + len(closer)
+                    math = text[start:end]
+                elif close > end and not (match.group('inline') and '\n' in text[end:close]):
+                    # \\(...\\) is passed to MathJax as \(...\)
+                    math = text[start + 1:end] + text[end:close] + closer[1:]
+                    end = close + len(closer)
+
+            if math is not None:
+                parts.append(text[position:start])
+                parts.append(self.md.htmlStash.store(math_html(tag, math)))
+                position = end
+            match = RE_MATH_START.match(text, end)
+        parts.append(text[position:])
+        return ''.join(parts)
+
+    @staticmethod
+    def find_closer(text, closer, start, end):
+        """Returns position of the closing delimiter in text[start:end]
+        or -1. Closing backticks of a code span are the same number
+        of backticks."""
+        if closer[0] != '`':
+            return text.find(closer, start, end)
+        position = text.find(closer, start, end)
+        while position >= 0:
+            after = position + len(closer)
+            if text[position - 1] != '`' and (after >= len(text) or text[after] != '`'):
+                return position
+            # skip the whole run of backticks
+            while after < end and text[after] == '`':
+                after = after + 1
+            position = text.find(closer, after, end)
+        return -1
+
+
+@lru_cache(maxsize=None)
+def emoji_aliases():
+    """Returns dictionary of the emoji :aliases: and :names: to emoji
+    (as emoji.emojize(..., language='alias', variant='emoji_type') converts
+    them) and compiled regular expression of the candidate :names:."""
+    emoji.load_from_json('alias')
+    data = [
+        (emj, item) for (emj, item) in emoji.EMOJI_DATA.items()
+        if item['status'] <= emoji.STATUS['fully_qualified']
+    ]
+    aliases = {}
+    # aliases are looked up before English names
+    for (emj, item) in data:
+        for alias in item.get('alias', []):
+            aliases.setdefault(alias, emj)
+    for (emj, item) in data:
+        aliases.setdefault(item['en'], emj)
+    for (name, emj) in aliases.items():
+        if 'variant' in emoji.EMOJI_DATA[emj]:
+            aliases[name] = emj.rstrip('\ufe0e\ufe0f') + '\ufe0f'
+    chars = {char for name in aliases for char in name[1:-1] if not re.match(r'\w', char)}
+    regex = re.compile(':[\\w{}]+:'.format(''.join(re.escape(char) for char in sorted(chars))))
+    return (aliases, regex)
+
+
+def emojize_text(text):
+    """Returns text with the emoji :aliases: and :names: converted
+    to unicode characters. Closing colon of the text that is not an emoji
+    may open the next :alias:, e.g. 10:30:smile:."""
+    (aliases, regex) = emoji_aliases()
+    parts = []
+    position = 0
+    match = regex.search(text)
+    while match:
+        emj = aliases.get(unicodedata.normalize('NFKC', match.group(0)))
+        if emj is None:
+            match = regex.search(text, match.end() - 1)
+            continue
+        parts.append(text[position:match.start()])
+        parts.append(emj)
+        position = match.end()
+        match = regex.search(text, position)
+    if not parts:
+        return text
+    parts.append(text[position:])
+    return ''.join(parts)
 
 
-class DollarSignPostprocessor(Postprocessor):
-    """Posprocessor to return $ signs back from {{DOLLAR}}."""
-    def run(self, text):
-        return text.replace('{{DOLLAR}}', '$')
-    
-    
 class EmojiPostprocessor(Postprocessor):
-    """Postprocessor to convert emoji text to unicode characters."""
+    """Postprocessor to convert emoji text to unicode characters. HTML
+    without :name: candidates is returned as is, text inside tags and
+    <code> and <pre> elements is never converted."""
     def run(self, text):
-        return emoji.emojize(text, language="alias", variant="emoji_type")
+        if ':' not in text or emoji_aliases()[1].search(text) is None:
+            return text
+        parts = []
+        position = 0
+        for match in RE_EMOJI_SKIP.finditer(text):
+            parts.append(emojize_text(text[position:match.start()]))
+            parts.append(match.group(0))
+            position = match.end()
+        parts.append(emojize_text(text[position:]))
+        return ''.join(parts)
 
 
 class StrikethroughExtension(Extension):
@@ -37,54 +234,15 @@ class StrikethroughExtension(Extension):
         md.inlinePatterns.register(SimpleTagInlineProcessor(r'()~~(.*?)~~', 's'), 's', 171)
 
 
-RE_INLINE = r'()\\\\\(+([^$\n]+?)\\\\\)+'
-RE_INLINE2 = r'()\$+([^$\n]+?)\$+'
-class MathJaxInlineProcessor(InlineProcessor):
-    """Processor for MathJax inline equations in Python-Markdown."""
-    def handleMatch(self, m, data):
-        # Pass the math code through, unmodified except for basic entity substitutions.
-        # Mark as Atomic String in order to prevent further processing.
-        el = etree.Element('span')
-        el.text = AtomicString(html.escape('\\(' + m.group(2).replace('\n', '') + '\\)'))
-        return el, m.start(0), m.end(0)
-
-
-RE_BLOCK = r'()\\\\\[+([\s\S]+?)\\\\\]+'
-class MathJaxBlockProcessor(InlineProcessor):
-    """Processor for MathJax block equations in Python-Markdown."""
-    def handleMatch(self, m, data):
-        # Pass the math code through, unmodified except for basic entity substitutions.
-        # Mark as Atomic String in order to prevent further processing.
-        el = etree.Element('p')
-        el.text = AtomicString(html.escape('\\[' + m.group(2).replace('\n', '') + '\\]'))
-        return el, m.start(0), m.end(0)
-
-
-RE_BEGIN = r'\\begin{(.+?)}([\s\S]*?)\\end{\1}'
-class MathJaxBeginProcessor(InlineProcessor):
-    """Processor for MathJax equations entered using \\begin{...}...\\end{...} pattern."""
-    def handleMatch(self, m, data):
-        # Pass the math code through, unmodified except for basic entity substitutions.
-        # Mark as Atomic String in order to prevent further processing.
-        el = etree.Element('p')
-        el.text = AtomicString(html.escape('\\begin{' + m.group(1) + '}' + m.group(2).replace('\n', '') + '\\end{' + m.group(1) + '}'))
-        return el, m.start(0), m.end(0)
-    
-
 class WaggyLabsMarkdownExtenstion(Extension):
     """Registers all the extensions for Python-Markdown."""
     def extendMarkdown(self, md):
         # Prepocessors
-        md.preprocessors.register(DollarSignPreprocessor(), 'dollar-pre', 19)
-        # MathJax equations, must go before escaping.
-        md.inlinePatterns.register(MathJaxInlineProcessor(RE_INLINE), 'math-inline', 185)
-        md.inlinePatterns.register(MathJaxInlineProcessor(RE_INLINE2), 'math-inline', 186)
-        md.inlinePatterns.register(MathJaxBlockProcessor(RE_BLOCK), 'math-block', 187)
-        md.inlinePatterns.register(MathJaxBeginProcessor(RE_BEGIN), 'math-begin', 189)
+        # MathJax equations, after fenced code and raw HTML are stashed
+        md.preprocessors.register(MathPreprocessor(md), 'math', 19)
         # ~~strikethrough~~ pattern.
         md.inlinePatterns.register(SimpleTagInlineProcessor(r'()~~(.*?)~~', 's'), 's', 171)
         # Postprocessors
-        md.postprocessors.register(DollarSignPostprocessor(), 'dollar-post', 18)
         md.postprocessors.register(EmojiPostprocessor(), 'emoji-post', 19)
         
         
@@ -0,0 +1,225 @@
+import hashlib
+import hmac
+import time
+
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Count, F
+
+from hitcount.models import BlacklistIP, BlacklistUserAgent, Hit, HitCount
+from hitcount.utils import get_ip
+from hitcount.views import HitCountMixin as ViewHitCountMixin
+
+from waggylabs.cache import CacheBuffer, cache_is_shared, get_cache
+
+
+# If True, hits are appended to the buffer in cache and saved to the database
+# in batches by the flush_hits management command. The command runs in its
+# own process, so hits are buffered only if the cache backend is shared
+# between processes, otherwise they are saved directly
+HIT_COUNT_BUFFERED = getattr(settings, 'WAGGYLABS_HIT_COUNT_BUFFERED', False) and cache_is_shared()
+
+# If True, anonymous visitors are identified by the keyed hash of their IP
+# address and user agent instead of the session, so that no session is created
+HIT_COUNT_SESSIONLESS = getattr(settings, 'WAGGYLABS_HIT_COUNT_SESSIONLESS', False)
+
+HIT_BUFFER = CacheBuffer('hits')
+
+
+def keep_hit_active_seconds():
+    """Returns HITCOUNT_KEEP_HIT_ACTIVE in seconds, i.e. the time
+    after which the hit from the same visitor is counted again."""
+    grace = getattr(settings, 'HITCOUNT_KEEP_HIT_ACTIVE', {'days': 7})
+    return int(timedelta(**grace).total_seconds())
+
+
+def count_hit(request, page):
+    """Counts the hit of the page for the request either immediately
+    using django-hitcount or by adding it to the hit buffer."""
+    if HIT_COUNT_SESSIONLESS:
+        hit = make_hit(request, page, visitor_key(request))
+        if is_new_hit(hit):
+            if HIT_COUNT_BUFFERED:
+                HIT_BUFFER.append(hit)
+            else:
+                save_hits([hit])
+        return
+
+    # below is needed to avoid session to be None especially on the
+    # first request
+    # otherwise the session_key is None, which is wrong for hitcount
+    # object and NOT_NULL constrain for session_key is violated
+    if not request.session.exists(request.session.session_key):
+        request.session.create()
+
+    if HIT_COUNT_BUFFERED:
+        hit = make_hit(request, page, request.session.session_key)
+        if is_new_hit(hit):
+            HIT_BUFFER.append(hit)
+    else:
+        hit_count = HitCount.objects.get_for_object(page)
+        ViewHitCountMixin.hit_count(request, hit_count)
+
+
+def visitor_key(request):
+    """Returns the key identifying anonymous visitor without session.
+    The key is HMAC of IP address and user agent with the key derived
+    from SECRET_KEY and the current time window of HITCOUNT_KEEP_HIT_ACTIVE
+    length. The key stays the same within the window and changes in the next
+    one, so visitors cannot be traced over the windows by the stored keys.
+    The key fits into the session field of the hitcount Hit model."""
+    window = keep_hit_active_seconds()
+    epoch = int(time.time()) // window if window > 0 else 0
+    secret = '{}:waggylabs-hit:{}'.format(settings.SECRET_KEY, epoch)
+    message = '{}|{}'.format(get_ip(request), request.headers.get('User-Agent', ''))
+    return hmac.new(
+        secret.encode('utf-8'),
+        message.encode('utf-8'),
+        hashlib.sha256,
+    ).hexdigest()[:40]
+
+
+def make_hit(request, page, session):
+    """Creates dictionary with the hit data that can be buffered and
+    saved by save_hits."""
+    user = request.user
+    return {
+        'content_type': ContentType.objects.get_for_model(page).pk,
+        'object_pk': page.pk,
+        'session': session,
+        'ip': get_ip(request),
+        'user_agent': request.headers.get('User-Agent', '')[:255],
+        'user': user.pk if user.is_authenticated else None,
+    }
+
+
+def is_new_hit(hit):
+    """Checks if the same visitor (user for authenticated users, session
+    or visitor key otherwise) has no active hit for the page. The check is
+    done with a cache key expiring after HITCOUNT_KEEP_HIT_ACTIVE, so
+    repeated hits are skipped before they reach the database. The hits are
+    verified against active hits again when saved."""
+    dedupe_key = 'waggylabs:hit:{}:{}:{}'.format(
+        hit['content_type'],
+        hit['object_pk'],
+        'user-{}'.format(hit['user']) if hit['user'] else hit['session'],
+    )
+    return get_cache().add(dedupe_key, 1, timeout=keep_hit_active_seconds())
+
+
+def flush_hits(batch_size=1000):
+    """Saves buffered hits to the database in batches. Hits are removed
+    from the buffer only after they are saved, so the batch that fails
+    to be saved stays in the buffer. Returns the number of the saved
+    hits."""
+    saved = 0
+    while True:
+        with HIT_BUFFER.batch(batch_size) as hits:
+            if not hits:
+                return saved
+            saved = saved + save_hits(hits)
+
+
+def save_hits(hits):
+    """Saves hits (dictionaries created by make_hit) with bulk queries.
+    The hits are filtered in the same way as django-hitcount does for every
+    single hit: blacklisted IPs and user agents, excluded user groups,
+    hits per IP limit and active hits of the same user or session are not
+    counted. Returns the number of saved hits."""
+    hits_per_ip_limit = getattr(settings, 'HITCOUNT_HITS_PER_IP_LIMIT', 0)
+    exclude_user_group = getattr(settings, 'HITCOUNT_EXCLUDE_USER_GROUP', None)
+
+    ips = {hit['ip'] for hit in hits}
+    user_agents = {hit['user_agent'] for hit in hits}
+    user_ids = {hit['user'] for hit in hits if hit['user']}
+
+    blacklisted_ips = set(BlacklistIP.objects.filter(ip__in=ips)
+                          .values_list('ip', flat=True))
+    blacklisted_user_agents = set(BlacklistUserAgent.objects.filter(user_agent__in=user_agents)
+                                  .values_list('user_agent', flat=True))
+    excluded_users = set()
+    if exclude_user_group and user_ids:
+        excluded_users = set(get_user_model().objects.filter(
+            pk__in=user_ids,
+            groups__name__in=exclude_user_group,
+        ).values_list('pk', flat=True))
+    hits = [hit for hit in hits
+            if hit['ip'] not in blacklisted_ips and
+            hit['user_agent'] not in blacklisted_user_agents and
+            hit['user'] not in excluded_users]
+    if not hits:
+        return 0
+
+    with transaction.atomic():
+        hit_counts = get_hit_counts({(hit['content_type'], hit['object_pk']) for hit in hits})
+        active_hits = Hit.objects.filter_active(hitcount__in=hit_counts.values())
+        active_users = set(active_hits.filter(user__in=user_ids)
+                           .values_list('user', 'hitcount'))
+        active_sessions = set(active_hits.filter(session__in={hit['session'] for hit in hits})
+                              .values_list('session', 'hitcount'))
+        ip_hits = Counter()
+        if hits_per_ip_limit:
+            ip_hits.update(dict(Hit.objects.filter_active(ip__in=ips)
+                                .values_list('ip').annotate(num_hits=Count('pk'))))
+
+        new_hits = []
+        for hit in hits:
+            hit_count = hit_counts[(hit['content_type'], hit['object_pk'])]
+            if hits_per_ip_limit and ip_hits[hit['ip']] >= hits_per_ip_limit:
+                continue
+            if hit['user']:
+                if (hit['user'], hit_count.pk) in active_users:
+                    continue
+                active_users.add((hit['user'], hit_count.pk))
+            else:
+                if (hit['session'], hit_count.pk) in active_sessions:
+                    continue
+                active_sessions.add((hit['session'], hit_count.pk))
+            ip_hits[hit['ip']] += 1
+            new_hits.append(Hit(
+                hitcount=hit_count,
+                session=hit['session'],
+                ip=hit['ip'],
+                user_agent=hit['user_agent'],
+                user_id=hit['user'],
+            ))
+
+        # bulk_create does not call Hit.save(), which increases HitCount.hits
+        # by one, so hits are increased with one query per page
+        Hit.objects.bulk_create(new_hits)
+        for hit_count_pk, num_hits in Counter(hit.hitcount.pk for hit in new_hits).items():
+            HitCount.objects.filter(pk=hit_count_pk).update(hits=F('hits') + num_hits)
+
+    return len(new_hits)
+
+
+def get_hit_counts(objects):
+    """Returns dictionary of HitCount objects for the set of
+    (content type id, object pk) pairs. Missing HitCount objects
+    are created."""
+    def fetch():
+        content_types = {content_type for (content_type, __) in objects}
+        object_pks = {object_pk for (__, object_pk) in objects}
+        return {
+            (hit_count.content_type_id, hit_count.object_pk): hit_count
+            for hit_count in HitCount.objects.filter(
+                content_type__in=content_types,
+                object_pk__in=object_pks,
+            )
+        }
+
+    hit_counts = fetch()
+    missing = objects - hit_counts.keys()
+    if missing:
+        HitCount.objects.bulk_create(
+            [HitCount(content_type_id=content_type, object_pk=object_pk)
+             for (content_type, object_pk) in missing],
+            ignore_conflicts=True,
+        )
+        hit_counts = fetch()
+    return hit_counts
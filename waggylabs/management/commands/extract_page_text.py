@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from waggylabs.models import BasePage
+
+
+class Command(BaseCommand):
+    help = "Extracts plain text, number of words, reading time and excerpt of the live pages."
+
+    def handle(self, *args, **options):
+        pages = BasePage.objects.live().specific()
+        for page in pages:
+            page.update_text_fields()
+        if options['verbosity'] > 0:
+            self.stdout.write('Extracted text of {} pages.'.format(len(pages)))
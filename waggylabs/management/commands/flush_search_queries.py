@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from waggylabs.search import flush_queries
+
+
+class Command(BaseCommand):
+    help = "Saves search query hits buffered in cache to the database (WAGGYLABS_SEARCH_QUERIES_BUFFERED=True)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of query hits saved with one set of queries.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='If given, keeps flushing query hits every interval seconds.',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            saved = flush_queries(batch_size=options['batch_size'])
+            if options['verbosity'] > 0:
+                self.stdout.write('Saved {} search query hits.'.format(saved))
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from waggylabs.models import (
+    PostArchiveCount, PostCategoryCount, PostPageNeighbours, PostTagCount
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuilds precomputed post indexes: previous and next posts, category, tag and archive counts."
+
+    def handle(self, *args, **options):
+        PostPageNeighbours.rebuild()
+        if options['verbosity'] > 0:
+            self.stdout.write('Rebuilt previous and next posts for {} posts.'.format(
+                PostPageNeighbours.objects.count()))
+        PostCategoryCount.rebuild()
+        PostTagCount.rebuild()
+        PostArchiveCount.rebuild()
+        if options['verbosity'] > 0:
+            self.stdout.write('Rebuilt category, tag and archive counts.')
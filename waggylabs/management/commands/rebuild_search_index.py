@@ -0,0 +1,77 @@
+import multiprocessing
+
+import django
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from wagtail.search.backends import get_search_backend
+from wagtail.search.index import get_indexed_models
+from wagtail.search.management.commands.update_index import group_models_by_index
+
+from waggylabs.search import reindex_objects
+
+
+def init_worker():
+    """Sets up Django in the worker process, which opens its own
+    database connections."""
+    django.setup()
+    connections.close_all()
+
+
+class Command(BaseCommand):
+    help = ("Rebuilds search index of all the indexed models, indexing objects in chunks "
+            "in parallel worker processes.")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--backend',
+            default='default',
+            help='Name of the search backend to rebuild.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=200,
+            help='Number of objects indexed by a worker process at once.',
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=None,
+            help='Number of worker processes, the number of CPUs by default.',
+        )
+
+    def handle(self, *args, **options):
+        backend = get_search_backend(options['backend'])
+        chunk_size = options['chunk_size']
+        # the atomic rebuilders (if enabled for the backend) build the index
+        # in a transaction or a new index, which worker processes cannot
+        # write to, so the index is rebuilt in place
+        rebuilder_class = type(backend).rebuilder_class
+
+        for (index, models) in group_models_by_index(backend, get_indexed_models()).items():
+            rebuilder = rebuilder_class(index) if rebuilder_class else None
+            if rebuilder is not None:
+                index = rebuilder.start()
+            for model in models:
+                index.add_model(model)
+
+            chunks = []
+            for model in models:
+                pks = list(model.get_indexed_objects().order_by('pk').values_list('pk', flat=True))
+                chunks.extend(
+                    (options['backend'], model._meta.label, pks[start:start + chunk_size])
+                    for start in range(0, len(pks), chunk_size)
+                )
+            # worker processes must not share the database connections
+            # of this process
+            connections.close_all()
+            with multiprocessing.Pool(options['processes'], initializer=init_worker) as pool:
+                indexed = sum(pool.starmap(reindex_objects, chunks))
+
+            if rebuilder is not None:
+                rebuilder.finish()
+            if options['verbosity'] > 0:
+                self.stdout.write('Indexed {} objects of {} in {} chunks.'.format(
+                    indexed, ', '.join(model._meta.label for model in models), len(chunks)))
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from waggylabs.models import SearchIndexTask
+
+
+class Command(BaseCommand):
+    help = "Updates search index entries of the saved pages (WAGGYLABS_SEARCH_INDEX_QUEUED=True)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Number of search index tasks processed with one set of queries.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='If given, keeps processing search index tasks every interval seconds.',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            processed = SearchIndexTask.process(batch_size=options['batch_size'])
+            if options['verbosity'] > 0:
+                self.stdout.write('Processed {} search index tasks.'.format(processed))
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,284 @@
+import emoji
+import html
+import markdown
+import random
+import re
+import timeit
+import xml.etree.ElementTree as etree
+
+from django.core.management.base import BaseCommand, CommandError
+
+from markdown.extensions import Extension
+from markdown.inlinepatterns import InlineProcessor
+from markdown.postprocessors import Postprocessor
+from markdown.preprocessors import Preprocessor
+from markdown.util import AtomicString
+
+from wagtailmarkdown.utils import _get_markdown_kwargs, render_markdown
+
+from waggylabs.extensions.markdown import EmojiPostprocessor, MathPreprocessor
+from waggylabs.models import BasePage
+from waggylabs.utils import pk_to_markdown
+from waggylabs.utils.highlight import highlight_snippets
+from waggylabs.utils.markdown import render_markdown_html
+from waggylabs.utils.utils import _pk_to_markdown
+
+
+WORDS = (
+    'the of and to in is that for with as by on are this be we which from '
+    'energy field equation model particle spin lattice quantum state wave '
+    'function boundary condition solution theorem proof lemma matrix tensor '
+    'density temperature pressure velocity figure table results method data'
+).split()
+MATH = [
+    r'\(E = mc^2\)',
+    r'\(\nabla \cdot \mathbf{B} = 0\)',
+    r'$$\int_0^\infty e^{-x^2} dx = \frac{\sqrt{\pi}}{2}$$',
+    r'\(\hat{H}\psi = E\psi\)',
+    r'see \ref{fig1} and \cite{ref1,ref2}',
+]
+
+
+def scientific_text(length, seed=0):
+    """Returns plain text of a long scientific post of about the given
+    number of characters: paragraphs of words with inline and display
+    math, references and citations."""
+    rnd = random.Random(seed)
+    parts = []
+    size = 0
+    while size < length:
+        words = [rnd.choice(WORDS) for __ in range(rnd.randint(40, 120))]
+        for __ in range(rnd.randint(0, 3)):
+            words.insert(rnd.randrange(len(words)), rnd.choice(MATH))
+        paragraph = ' '.join(words).capitalize() + '.'
+        parts.append(paragraph)
+        size = size + len(paragraph) + 1
+    return '\n'.join(parts)[:length]
+
+
+def referenced_text(length, seed=0):
+    """Returns scientific text of about the given number of characters
+    with a labeled equation, figure reference and citation in every
+    paragraph."""
+    rnd = random.Random(seed)
+    parts = []
+    for (number, paragraph) in enumerate(scientific_text(length, seed).split('\n')):
+        parts.append(
+            '{} \\begin{{equation}}\\label{{eq{}}} E_{} = mc^2 \\end{{equation}} '
+            'as in \\eqref{{eq{}}}, \\ref{{fig{}}} and \\cite{{ref{},ref{}}}.'.format(
+                paragraph, number, number, rnd.randint(0, number), rnd.randint(0, 20),
+                rnd.randint(0, 50), rnd.randint(0, 50))
+        )
+    return '\n'.join(parts)
+
+
+def stream_texts(value):
+    """Returns list of all non-empty strings of the raw StreamField data."""
+    if isinstance(value, str):
+        return [value] if value.strip() else []
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        return [text for item in value for text in stream_texts(item)]
+    return []
+
+
+def legacy_pk_to_markdown(value, pk):
+    """Previous implementation of pk_to_markdown: one regex pass
+    over the whole text per command."""
+    pk = str(pk)
+    for command in ['label', 'ref', 'eqref', 'cite']:
+        value = re.sub(
+            r'\\' + command + r'\{(.+?)\}',
+            lambda m: (
+                m.group(0).replace(
+                    m.group(1),
+                    ','.join([ref + '-' + pk for ref in m.group(1).split(',')])
+                )
+            ),
+            value,
+            flags=re.IGNORECASE,
+        )
+    return value
+
+
+class LegacyMathProcessor(InlineProcessor):
+    """Previous implementation of the math in the WaggyLabs Markdown
+    extension: one inline pattern per math delimiter."""
+    def __init__(self, pattern, tag, opening, closing):
+        super().__init__(pattern)
+        (self.tag, self.opening, self.closing) = (tag, opening, closing)
+
+    def handleMatch(self, m, data):
+        el = etree.Element(self.tag)
+        el.text = AtomicString(html.escape(
+            self.opening.format(*m.groups()) + m.group(2).replace('\n', '') +
+            self.closing.format(*m.groups())))
+        return el, m.start(0), m.end(0)
+
+
+class LegacyDollarSignProcessor(Preprocessor, Postprocessor):
+    """Previous round trip of the escaped dollar signs through
+    the {{DOLLAR}} placeholder."""
+    def run(self, value):
+        if isinstance(value, str):
+            return value.replace('{{DOLLAR}}', '$')
+        return [line.replace('\\$', '{{DOLLAR}}') for line in value]
+
+
+class LegacyMathExtension(Extension):
+    """Math of the previous WaggyLabs Markdown extension."""
+    def extendMarkdown(self, md):
+        md.preprocessors.register(LegacyDollarSignProcessor(), 'dollar-pre', 19)
+        md.inlinePatterns.register(LegacyMathProcessor(
+            r'()\$+([^$\n]+?)\$+', 'span', '\\(', '\\)'), 'math-inline', 186)
+        md.inlinePatterns.register(LegacyMathProcessor(
+            r'()\\\\\[+([\s\S]+?)\\\\\]+', 'p', '\\[', '\\]'), 'math-block', 187)
+        md.inlinePatterns.register(LegacyMathProcessor(
+            r'\\begin{(.+?)}([\s\S]*?)\\end{\1}', 'p', '\\begin{{{0}}}', '\\end{{{0}}}'),
+            'math-begin', 189)
+        md.postprocessors.register(LegacyDollarSignProcessor(), 'dollar-post', 18)
+
+
+class MathExtension(Extension):
+    """Math of the WaggyLabs Markdown extension."""
+    def extendMarkdown(self, md):
+        md.preprocessors.register(MathPreprocessor(md), 'math', 19)
+
+
+def legacy_highlight(body_text, tokens):
+    """Previous implementation of search_results_body: one regex
+    search over the whole text per token and one snippet per match."""
+    text_chunks = []
+    for token in tokens:
+        for match in re.finditer(token, body_text, flags=re.IGNORECASE):
+            (start, end) = match.span(0)
+            start = max(start - 200, 0)
+            text_chunks.append(body_text[start:end + 200 + 11].replace(
+                match.group(0), '<mark>' + match.group(0) + '</mark>'))
+    return text_chunks
+
+
+class Command(BaseCommand):
+    help = "Runs WaggyLabs microbenchmarks on generated content and prints the timings."
+
+    benchmarks = ['highlight', 'pk_to_markdown', 'math', 'markdown_parser', 'emoji']
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'benchmark',
+            nargs='*',
+            help='Names of benchmarks to run: {}. All benchmarks run by default.'.format(
+                ', '.join(self.benchmarks)),
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of runs, the best time is reported.',
+        )
+
+    def handle(self, *args, **options):
+        for benchmark in options['benchmark'] or self.benchmarks:
+            if benchmark not in self.benchmarks:
+                raise CommandError('Unknown benchmark {}.'.format(benchmark))
+            self.stdout.write(benchmark)
+            getattr(self, 'benchmark_' + benchmark)(options['repeat'])
+
+    def timing(self, label, func, repeat):
+        """Prints the best time of the function call in milliseconds."""
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        self.stdout.write('  {:<50} {:>10.3f} ms'.format(label, best * 1000))
+
+    def benchmark_highlight(self, repeat):
+        """Search result highlighting of long scientific posts."""
+        queries = [
+            ['energy'],
+            ['energy', 'field', 'quantum'],
+            ['energy', 'field', 'quantum', 'spin', 'lattice', 'wave',
+             'matrix', 'tensor', 'density', 'e'],
+        ]
+        for length in [10000, 100000, 1000000]:
+            text = scientific_text(length)
+            for tokens in queries:
+                label = '{} chars, {} tokens'.format(length, len(tokens))
+                self.timing(label + ', legacy', lambda: legacy_highlight(text, tokens), repeat)
+                self.timing(label + ', one pass', lambda: highlight_snippets(text, tokens), repeat)
+                self.timing(label + ', one pass, all snippets', lambda: highlight_snippets(
+                    text, tokens, max_snippets=len(text), max_length=len(text)), repeat)
+
+    def benchmark_pk_to_markdown(self, repeat):
+        """Rewriting of labels and references of long scientific posts."""
+        for length in [10000, 100000, 1000000]:
+            text = referenced_text(length)
+            label = '{} chars, {} commands'.format(length, text.count('\\'))
+            self.timing(label + ', legacy', lambda: legacy_pk_to_markdown(text, 1), repeat)
+            self.timing(label + ', one pass', lambda: _pk_to_markdown.__wrapped__(text, '1'), repeat)
+            pk_to_markdown(text, 1)
+            self.timing(label + ', memoized', lambda: pk_to_markdown(text, 1), repeat)
+
+    def benchmark_math(self, repeat):
+        """Markdown rendering of long scientific posts with many
+        equations: math inline patterns vs math preprocessor."""
+        for length in [10000, 100000]:
+            # inline math with $ signs, which are handled by the extension
+            text = referenced_text(length).replace('\\(', '$').replace('\\)', '$')
+            label = '{} chars, {} equations'.format(length, text.count('$') // 2)
+            self.timing(label + ', no math', lambda: markdown.markdown(
+                text, extensions=['extra']), repeat)
+            self.timing(label + ', legacy math patterns', lambda: markdown.markdown(
+                text, extensions=['extra', LegacyMathExtension()]), repeat)
+            self.timing(label + ', math preprocessor', lambda: markdown.markdown(
+                text, extensions=['extra', MathExtension()]), repeat)
+
+    def benchmark_markdown_parser(self, repeat):
+        """Markdown rendering of many short captions: new parser
+        per text (wagtail-markdown) vs parser per thread."""
+        captions = [
+            'Figure {}: the *{}* of the ${}_{}$ {} :smile:'.format(
+                number, WORDS[number % len(WORDS)], WORDS[-number % len(WORDS)], number,
+                WORDS[2 * number % len(WORDS)])
+            for number in range(200)
+        ]
+        label = '{} captions'.format(len(captions))
+        self.timing(label + ', new parser', lambda: [
+            render_markdown(caption) for caption in captions], repeat)
+        self.timing(label + ', thread parser', lambda: [
+            render_markdown_html(caption) for caption in captions], repeat)
+
+    def benchmark_emoji(self, repeat):
+        """Emoji postprocessing of HTML of the page body blocks rendered
+        without emoji: emoji.emojize of the whole HTML vs the emoji
+        postprocessor. Generated posts with code are used if there are
+        no pages. Names that are not emoji are looked up by emoji.emojize
+        in all emoji data and cached, so both cold and warm name cache
+        are timed."""
+        md = markdown.Markdown(**_get_markdown_kwargs())
+        md.postprocessors.deregister('emoji-post')
+        texts = [
+            text for page in BasePage.objects.live().specific()
+            if getattr(page, 'body', None) is not None
+            for text in stream_texts(page.body.get_prep_value())
+        ]
+        if not texts:
+            texts = [
+                referenced_text(10000, seed=seed).replace('.', '. :smile: at 10:{}:00'.format(seed), 3) +
+                '\n\n```python\nvalue = {{"a": 1, "b": 2}}[key][1:{}:2]\n```\n'.format(seed)
+                for seed in range(20)
+            ]
+        fragments = [md.reset().convert(text) for text in texts]
+        postprocessor = EmojiPostprocessor()
+        label = '{} fragments, {} chars, {} colons'.format(
+            len(fragments), sum(len(fragment) for fragment in fragments),
+            sum(fragment.count(':') for fragment in fragments))
+
+        def emojize(cold):
+            if cold:
+                emoji.unicode_codes.get_emoji_by_name.cache_clear()
+            return [emoji.emojize(fragment, language='alias', variant='emoji_type')
+                    for fragment in fragments]
+
+        self.timing(label + ', emojize, cold', lambda: emojize(True), repeat)
+        self.timing(label + ', emojize, warm', lambda: emojize(False), repeat)
+        self.timing(label + ', postprocessor', lambda: [
+            postprocessor.run(fragment) for fragment in fragments], repeat)
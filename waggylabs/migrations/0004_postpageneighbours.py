@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('waggylabs', '0003_alter_waggylabssettings_navbar_active_link_color_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostPageNeighbours',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='neighbours', serialize=False, to='waggylabs.postpage', verbose_name='Post')),
+                ('next_post', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='waggylabs.postpage', verbose_name='Next post')),
+                ('previous_post', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='waggylabs.postpage', verbose_name='Previous post')),
+            ],
+            options={
+                'verbose_name': 'Post neighbours',
+                'verbose_name_plural': 'Post neighbours',
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+# PostListPage.post_by_slug looks up posts by slug and the date range
+# of the first publication, the index lets the database do a single seek.
+# The index is added to wagtailcore_page table, so it is created with
+# the schema editor instead of the model Meta.indexes.
+INDEX = models.Index(
+    fields=['slug', 'first_published_at'],
+    name='waggylabs_page_slug_pub_idx',
+)
+
+
+def add_index(apps, schema_editor):
+    schema_editor.add_index(apps.get_model('wagtailcore', 'Page'), INDEX)
+
+
+def remove_index(apps, schema_editor):
+    schema_editor.remove_index(apps.get_model('wagtailcore', 'Page'), INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtailcore', '0083_workflowcontenttype'),
+        ('waggylabs', '0004_postpageneighbours'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_index, remove_index),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:49
+
+import wagtail.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('waggylabs', '0005_page_slug_first_published_at_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='postlistpage',
+            name='body',
+            field=wagtail.fields.StreamField([('accordion', 109), ('blockquote', 11), ('card_grid', 132), ('carousel', 21), ('collapse', 138), ('columns', 144), ('citation', 25), ('cut', 146), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('page_info', 163), ('post_archive', 73), ('post_category', 83), ('post_highlights', 89), ('post_tag_list', 96), ('table', 101), ('table_figure', 104), ('text', 164), ('post_list', 192)], blank=True, block_lookup={0: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('collapsible', 'Items collapse'), ('stays_open', 'Items stay open')], 'help_text': 'Collapse items when new items opens or keep them open', 'label': 'Item collapse style'}), 1: ('wagtail.blocks.CharBlock', (), {'form_classname': 'full subtitle', 'label': 'Item heading', 'required': True}), 2: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Header icon', 'required': False}), 3: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Header icon location', 'required': False}), 4: ('wagtail.blocks.BooleanBlock', (), {'label': 'Item is displayed expanded', 'required': False}), 5: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'label': 'Quote text.', 'max_height': '100px', 'min_height': '100px', 'required': True, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,heading,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 6: ('wagtail.blocks.CharBlock', (), {'label': 'Author of the quoted text.', 'required': False}), 7: ('wagtail.blocks.CharBlock', (), {'label': 'Source of the quoted text.', 'required': False}), 8: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-blockquote', 'max_length': 50, 'required': False}), 9: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Left'), ('text-center', 'Center'), ('text-end', 'Right')], 'label': 'Text alignment', 'required': False}), 10: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show quote icon', 'required': False}), 11: ('wagtail.blocks.StructBlock', [[('quote', 5), ('author', 6), ('source', 7), ('label', 8), ('aligntment', 9), ('show_icon', 10)]], {}), 12: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('carousel-fade', 'Fade after interval'), ('carousel', 'Change after interval'), ('false', 'Change on button'), ('false-fade', 'Fade on button')], 'label': 'Carousel switch type'}), 13: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'No controls'), ('buttons', 'Left and right buttons'), ('indicators', 'Items indicators'), ('buttons_indicators', 'Buttons and indicators')], 'label': 'Controls of the carousel', 'required': False}), 14: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Picture for carousel', 'required': True}), 15: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'label': 'Text in front of the picture', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,heading,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 16: ('wagtail.blocks.IntegerBlock', (), {'default': 1000, 'help_text': 'Enter the value in milliseconds to keep the current item during this interval', 'label': 'Interval in milliseconds to keep the item', 'min_value': 0, 'required': False}), 17: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text-light', 'Light'), ('text-dark', 'Dark')], 'label': 'Text color', 'required': False}), 18: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('fs-6', 'Normal'), ('fs-5', 'Bigger'), ('fs-4', 'Big'), ('fs-3', 'Larger'), ('fs-2', 'Large')], 'label': 'Text size', 'required': False}), 19: ('wagtail.blocks.StructBlock', [[('image', 14), ('caption', 15), ('interval', 16), ('text_justify', 9), ('text_color', 17), ('text_size', 18)]], {}), 20: ('wagtail.blocks.ListBlock', (19,), {'min_num': 1}), 21: ('wagtail.blocks.StructBlock', [[('switch', 12), ('controls', 13), ('items', 20)]], {}), 22: ('wagtail.blocks.CharBlock', (), {'label': 'Title of the citation.', 'required': False}), 23: ('wagtail.blocks.URLBlock', (), {'label': 'Citation link', 'required': False}), 24: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-cite', 'help_text': 'Cite literature using LaTeX \\cite{...} syntax in text markdown block.', 'required': False}), 25: ('wagtail.blocks.StructBlock', [[('citation', 22), ('link', 23), ('label', 24)]], {}), 26: ('wagtail.documents.blocks.DocumentChooserBlock', (), {}), 27: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-cite', 'help_text': 'Cite documents using LaTeX \\cite{...} syntax in text markdown block.', 'required': False}), 28: ('wagtail.blocks.StructBlock', [[('document', 26), ('label', 27)]], {}), 29: ('wagtail.embeds.blocks.EmbedBlock', (), {'label': 'URL of embedding'}), 30: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Embed caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 31: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-embed', 'max_length': 50, 'required': False}), 32: ('wagtail.blocks.StructBlock', [[('embed', 29), ('caption', 30), ('label', 31)]], {}), 33: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': 'Write or paste LaTeX style equation (equation, matrix, align, etc. environments are supported). ', 'max_height': '150px', 'min_height': '150px', 'required': True, 'statusbar': 'false', 'stex_combine': 'false', 'toolbar': 'subscript,superscript,equation,matrix,align,multiline,split,gather,alignat,flalign,|,preview,side-by-side,fullscreen'}), 34: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': 'Caption that will be displayed when the equation is shown in the dialog box or in the sidebar.', 'label': 'Equation caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 35: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-equation', 'help_text': 'Label for the current equation to be used in the markdown block for referencing using standard LaTeX \\ㅤref{...} syntax. This label will be added only if no \\ㅤlabel{...} is found within the \\ㅤbegin{...}...\\ㅤend{...} statement.The final reference processing is happening on the published page, which can be checked using "Preview" functionality.', 'max_length': 50, 'required': False}), 36: ('wagtail.blocks.StructBlock', [[('equation', 33), ('caption', 34), ('label', 35)]], {}), 37: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Graphic', 'required': True}), 38: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Figure caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 39: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-figure', 'max_length': 50, 'required': False}), 40: ('wagtail.blocks.StructBlock', [[('image', 37), ('caption', 38), ('label', 39)]], {}), 41: ('wagtail.blocks.CharBlock', (), {'label': 'Header text', 'required': False}), 42: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('h1', 'Header 1'), ('h2', 'Header 2'), ('h3', 'Header 3'), ('h4', 'Header 4'), ('h5', 'Header 5'), ('h6', 'Header 6'), ('display-1', 'Display header 1'), ('display-2', 'Display header 2'), ('display-3', 'Display header 3'), ('display-4', 'Display header 4'), ('display-5', 'Display header 5'), ('display-6', 'Display header 6'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic')], 'label': 'Header style', 'required': False}), 43: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('border-primary', 'Border primary'), ('border-secondary', 'Border secondary'), ('border-success', 'Border success'), ('border-danger', 'Border danger'), ('border-warning', 'Border warning'), ('border-info', 'Border info'), ('border-light', 'Border light'), ('border-dark', 'Border dark'), ('border-0', 'No border'), ('border-0 mp-0', 'No border, no margin')], 'label': 'Card style', 'required': False}), 44: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Link list style', 'required': False}), 45: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark')], 'label': 'Link item style', 'required': False}), 46: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Text wrap'), ('text-nowrap', 'No text wrapping')], 'label': 'Text wrapping', 'required': False}), 47: ('wagtail.blocks.URLBlock', (), {'label': 'Link to external site', 'required': True}), 48: ('wagtail.blocks.CharBlock', (), {'label': 'Text of the link', 'required': False}), 49: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Link icon', 'required': False}), 50: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Link icon location', 'required': False}), 51: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Link style', 'required': False}), 52: ('wagtail.blocks.StructBlock', [[('link', 47), ('text', 48), ('icon', 49), ('icon_location', 50), ('style', 51)]], {}), 53: ('wagtail.blocks.PageChooserBlock', (), {'label': 'Link to a page of this site'}), 54: ('wagtail.blocks.CharBlock', (), {'label': 'Text instead of page title', 'required': False}), 55: ('wagtail.blocks.StructBlock', [[('link', 53), ('text', 54), ('icon', 49), ('icon_location', 50), ('style', 51)]], {}), 56: ('wagtail.blocks.StreamBlock', [[('external_link', 52), ('internal_link', 55)]], {'use_json_field': True}), 57: ('wagtail.blocks.StructBlock', [[('link_list_style', 44), ('link_style', 45), ('text_wrap', 46), ('items', 56)]], {'label': 'List of links'}), 58: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 57)]], {}), 59: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text/x-python', 'Python'), ('text/x-csrc', 'C'), ('text/x-c++src', 'C++'), ('text/x-java', 'Java/Kotlin'), ('text/x-csharp', 'C#'), ('text/x-objectivec', 'Objective C'), ('text/x-scala', 'Scala'), ('application/xml', 'XML'), ('text/html', 'HTML'), ('text/javascript', 'Javascipt'), ('text/json', 'JSON'), ('text/typescript', 'TypeScript'), ('text/x-mathematica', 'Mathematica'), ('text/x-octave', 'Matlab'), ('application/x-powershell', 'Powershell'), ('text/x-sh', 'Bach/Shell'), ('text/x-swift', 'Swift'), ('text/x-sql', 'SQL')], 'help_text': 'Choose the programming language.', 'label': 'Code language'}), 60: ('wagtail.blocks.TextBlock', (), {'help_text': 'Write or paste code.', 'label': 'Code snippet', 'required': True}), 61: ('wagtail.blocks.StructBlock', [[('mode', 59), ('code', 60)]], {'label': None}), 62: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Listing caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 63: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-listing', 'max_length': 50, 'required': False}), 64: ('wagtail.blocks.StructBlock', [[('code', 61), ('caption', 62), ('label', 63)]], {}), 65: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows only posts that are descendant of this page. If left empty, posts selected from all the posts are shown.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 66: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Archive links list style', 'required': False}), 67: ('wagtail.blocks.IntegerBlock', (), {'default': 0, 'help_text': 'If zero, all links are shown.', 'label': 'Number of archive links to show', 'min_value': 0, 'required': True}), 68: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Archive link style', 'required': False}), 69: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('day', 'By day'), ('month', 'By month'), ('year', 'By year')], 'label': 'Period of archive link'}), 70: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('DESC', 'Descneding'), ('ASC', 'Ascending')], 'label': 'Archive links order'}), 71: ('wagtail.blocks.CharBlock', (), {'help_text': 'When number of archive links is larger than number of archive links to show, button to show more links appears with the specified text.', 'label': 'More archives button text', 'required': False}), 72: ('wagtail.blocks.StructBlock', [[('post_list_page', 65), ('list_style', 66), ('archives_number', 67), ('list_item_style', 68), ('text_wrap', 46), ('archive_period', 69), ('order_by', 70), ('more_archive_text', 71)]], {}), 73: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 72)]], {}), 74: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows post categories for the posts, which are children of the selected post list page. If left empty, the currently browsed post list page will be used. Otherwise, no categories will be displayed.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 75: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Categories style', 'required': False}), 76: ('wagtail.blocks.IntegerBlock', (), {'default': 10, 'help_text': 'Depends on the selected order. If equals to zero, then all categories are shown.', 'label': 'Number of categories to show', 'min_value': 0, 'required': True}), 77: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Category item style', 'required': False}), 78: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending'), ('num_posts', 'By post number acsending'), ('-num_posts', 'By post number descending')], 'label': 'Categories ordering', 'required': False}), 79: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per category', 'required': False}), 80: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('rounded-pill text-bg-primary', 'Rounded primary'), ('rounded-pill text-bg-secondary', 'Rounded secondary'), ('rounded-pill text-bg-success', 'Rounded success'), ('rounded-pill text-bg-danger', 'Rounded danger'), ('rounded-pill text-bg-warning', 'Rounded warning'), ('rounded-pill text-bg-info', 'Rounded info'), ('rounded-pill text-bg-light', 'Rounded light'), ('rounded-pill text-bg-dark', 'Rounded dark')], 'label': 'Post number style', 'required': False}), 81: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('position-absolute top-0 start-100 translate-middle', 'Top right corner'), ('position-absolute top-0 start-0 translate-middle', 'Top left corner'), ('position-absolute top-100 start-100 translate-middle', 'Bottom right corner'), ('position-absolute top-100 start-0 translate-middle', 'Bottom left corner')], 'label': 'Post number location', 'required': False}), 82: ('wagtail.blocks.StructBlock', [[('post_list_page', 74), ('categories_style', 75), ('categories_number', 76), ('category_style', 77), ('order_by', 78), ('show_badges', 79), ('badge_style', 80), ('badge_location', 81)]], {}), 83: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 82)]], {}), 84: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Post list style', 'required': False}), 85: ('wagtail.blocks.IntegerBlock', (), {'help_text': 'If zero, all post are shown.', 'label': 'Number of posts to show', 'min_value': 0, 'required': True}), 86: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Post title item style', 'required': False}), 87: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('title', 'By title acsending'), ('-title', 'By title descending'), ('owner__username', 'By author ascending'), ('-owner__username', 'By author descending')], 'label': 'Posts ordering', 'required': False}), 88: ('wagtail.blocks.StructBlock', [[('post_list_page', 65), ('posts_style', 84), ('posts_number', 85), ('post_style', 86), ('text_wrap', 46), ('order_by', 87)]], {}), 89: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 88)]], {}), 90: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows post tags for the posts, which are children of the selected post list page. If left empty, the currently browsed post list page will be used. Otherwise, no categories will be displayed.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 91: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Tags style', 'required': False}), 92: ('wagtail.blocks.IntegerBlock', (), {'default': 10, 'help_text': 'Depends on the selected order. If equals to zero, then all tags are shown.', 'label': 'Number of tags to show', 'min_value': 0, 'required': True}), 93: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending'), ('num_posts', 'By post number acsending'), ('-num_posts', 'By post number descending')], 'label': 'Tags ordering', 'required': False}), 94: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per tag', 'required': False}), 95: ('wagtail.blocks.StructBlock', [[('post_list_page', 90), ('tags_style', 91), ('tags_number', 92), ('order_by', 93), ('show_badges', 94), ('badge_style', 80), ('badge_location', 81)]], {}), 96: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 95)]], {}), 97: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 98: ('waggylabs.blocks.table.BareTableBlock', (), {'help_text': 'Columns and rows can be added via context menu appearing on the right click. Markdown inside cells is supported. Inline LateX equations can be added using $...$ pattern.', 'keep_table_tag': False, 'label': 'Table data', 'required': True}), 99: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table footer', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 100: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-table', 'max_length': 50, 'required': False}), 101: ('wagtail.blocks.StructBlock', [[('caption', 97), ('table', 98), ('footer', 99), ('label', 100)]], {}), 102: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table caption', 'max_height': '150px', 'min_height': '150px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 103: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Table image', 'required': True}), 104: ('wagtail.blocks.StructBlock', [[('caption', 102), ('image', 103), ('footer', 99), ('label', 100)]], {}), 105: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'max_height': '150px', 'min_height': '150px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 106: ('wagtail.blocks.StreamBlock', [[('blockquote', 11), ('carousel', 21), ('citation', 25), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 73), ('post_category', 83), ('post_highlights', 89), ('post_tag_list', 96), ('table', 101), ('table_figure', 104), ('text', 105)]], {'required': False}), 107: ('wagtail.blocks.StructBlock', [[('heading', 1), ('header_icon', 2), ('header_icon_location', 3), ('is_open', 4), ('body', 106)]], {}), 108: ('wagtail.blocks.ListBlock', (107,), {}), 109: ('wagtail.blocks.StructBlock', [[('style', 0), ('items', 108)]], {}), 110: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('h-100', 'Equal height'), ('', 'Height wraps to content')], 'label': 'Card height style', 'required': False}), 111: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('separate', 'Separate'), ('grouped', 'Grouped')], 'label': 'Card grouping style', 'required': False}), 112: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('vertical', 'Vertical'), ('horizontal', 'Horizontal')], 'label': 'Card orientation', 'required': False}), 113: ('wagtail.blocks.ChoiceBlock', [], {'choices': [(1, '1 column'), (2, '2 columns'), (3, '3 columns')], 'label': 'Number of columns', 'required': False}), 114: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Image', 'required': False}), 115: ('wagtail.blocks.CharBlock', (), {'label': 'Card title', 'required': True}), 116: ('wagtail.blocks.CharBlock', (), {'label': 'Card subtitle', 'required': False}), 117: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 118: ('wagtail.blocks.EmailBlock', (), {'label': 'Email address', 'required': True}), 119: ('wagtail.blocks.CharBlock', (), {'label': 'Text instead of email', 'required': False}), 120: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Email icon', 'required': False}), 121: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Email icon location', 'required': False}), 122: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Email style', 'required': False}), 123: ('wagtail.blocks.StructBlock', [[('email', 118), ('text', 119), ('icon', 120), ('icon_location', 121), ('style', 122)]], {}), 124: ('wagtail.blocks.CharBlock', (), {'label': 'Phone, address, etc.', 'required': True}), 125: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Style', 'required': False}), 126: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Icon', 'required': False}), 127: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Icon location', 'required': False}), 128: ('wagtail.blocks.StructBlock', [[('text', 124), ('style', 125), ('icon', 126), ('icon_location', 127)]], {}), 129: ('wagtail.blocks.StreamBlock', [[('external_link', 52), ('internal_link', 55), ('email', 123), ('info_text', 128)]], {'required': False}), 130: ('wagtail.blocks.StructBlock', [[('image', 114), ('style', 43), ('title', 115), ('subtitle', 116), ('alignment', 9), ('text', 117), ('links', 129)]], {}), 131: ('wagtail.blocks.ListBlock', (130,), {}), 132: ('wagtail.blocks.StructBlock', [[('height_style', 110), ('grouping_style', 111), ('orientation_style', 112), ('columns', 113), ('items', 131)]], {}), 133: ('wagtail.blocks.CharBlock', (), {'label': 'Text on the button', 'required': False}), 134: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Button icon', 'required': False}), 135: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Button icon location', 'required': False}), 136: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('border-primary', 'Border primary'), ('border-secondary', 'Border secondary'), ('border-success', 'Border success'), ('border-danger', 'Border danger'), ('border-warning', 'Border warning'), ('border-info', 'Border info'), ('border-light', 'Border light'), ('border-dark', 'Border dark'), ('border-0', 'No border'), ('border-0 mp-0', 'No border, no margin')], 'label': 'Block style', 'required': False}), 137: ('wagtail.blocks.StreamBlock', [[('blockquote', 11), ('carousel', 21), ('citation', 25), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 73), ('post_category', 83), ('post_highlights', 89), ('post_tag_list', 96), ('table', 101), ('table_figure', 104), ('text', 105)]], {'requred': True}), 138: ('wagtail.blocks.StructBlock', [[('text', 133), ('icon', 134), ('icon_location', 135), ('button_style', 51), ('style', 136), ('alignment', 9), ('body', 137)]], {}), 139: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('align-self-start', 'Top'), ('align-self-center', 'Center'), ('align-self-end', 'Bottom')], 'label': 'Column content vertical alignment'}), 140: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': ''}), 141: ('wagtail.blocks.StreamBlock', [[('accordion', 109), ('blockquote', 11), ('carousel', 21), ('citation', 25), ('collapse', 138), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 73), ('post_category', 83), ('post_highlights', 89), ('post_tag_list', 96), ('table', 101), ('table_figure', 104), ('text', 140)]], {'required': False}), 142: ('wagtail.blocks.StructBlock', [[('vertical_align', 139), ('body', 141)]], {}), 143: ('wagtail.blocks.ListBlock', (142,), {'max_num': 3, 'min_num': 1}), 144: ('wagtail.blocks.StructBlock', [[('items', 143)]], {}), 145: ('wagtail.blocks.CharBlock', (), {'label': 'Text on the cut button', 'required': False}), 146: ('wagtail.blocks.StructBlock', [[('text', 145), ('style', 51), ('icon', 134), ('icon_location', 135)]], {}), 147: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show the name of the page creator', 'required': False}), 148: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page creator name is displayed.', 'label': 'Header of the page creator row', 'required': False}), 149: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show avatar', 'required': False}), 150: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('start', 'Before username'), ('end', 'After username')], 'label': 'Avatar location', 'required': False}), 151: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show the email of page creator', 'required': False}), 152: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page creator email is displayed.', 'label': 'Header of the page creator email row', 'required': False}), 153: ('wagtail.blocks.BooleanBlock', (), {'label': 'Date of page publication', 'required': False}), 154: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page publciation date is displayed.', 'label': 'Header of the page publication date', 'required': False}), 155: ('wagtail.blocks.BooleanBlock', (), {'label': 'Date of last page update', 'required': False}), 156: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the last page update is displayed.', 'label': 'Header of last page update', 'required': False}), 157: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('date', 'Only date'), ('datetime', 'Date and time'), ('timesince', 'Time since')], 'label': 'Date style'}), 158: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('G:i', '24-hour format'), ('g:i A', '12-hour format')], 'label': 'Time format'}), 159: ('wagtail.blocks.CharBlock', (), {'label': 'Time since text, e.g. ago', 'required': False}), 160: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Row header style', 'required': False}), 161: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Row style', 'required': False}), 162: ('wagtail.blocks.StructBlock', [[('show_user', 147), ('user_header', 148), ('show_avatar', 149), ('avatar_location', 150), ('show_email', 151), ('email_header', 152), ('show_first_published_at', 153), ('first_published_at_header', 154), ('show_last_published_at', 155), ('last_published_at_header', 156), ('datetime_style', 157), ('time_format', 158), ('timesince_text', 159), ('alignment', 9), ('row_header_style', 160), ('row_data_style', 161)]], {}), 163: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 162)]], {}), 164: ('waggylabs.blocks.markdown.MarkdownBlock', (), {}), 165: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show pinned posts', 'required': False}), 166: ('wagtail.blocks.CharBlock', (), {'label': 'Pinned posts header', 'required': False}), 167: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Pinned posts icon', 'required': False}), 168: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Pinned posts icon location', 'required': False}), 169: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('h1', 'Header 1'), ('h2', 'Header 2'), ('h3', 'Header 3'), ('h4', 'Header 4'), ('h5', 'Header 5'), ('h6', 'Header 6'), ('display-1', 'Display header 1'), ('display-2', 'Display header 2'), ('display-3', 'Display header 3'), ('display-4', 'Display header 4'), ('display-5', 'Display header 5'), ('display-6', 'Display header 6'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic')], 'label': 'Pinned posts header style', 'required': False}), 170: ('wagtail.blocks.CharBlock', (), {'label': 'Post list header', 'required': False}), 171: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Post list icon', 'required': False}), 172: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Post list icon location', 'required': False}), 173: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('h1', 'Header 1'), ('h2', 'Header 2'), ('h3', 'Header 3'), ('h4', 'Header 4'), ('h5', 'Header 5'), ('h6', 'Header 6'), ('display-1', 'Display header 1'), ('display-2', 'Display header 2'), ('display-3', 'Display header 3'), ('display-4', 'Display header 4'), ('display-5', 'Display header 5'), ('display-6', 'Display header 6'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic')], 'label': 'Post list header style', 'required': False}), 174: ('wagtail.blocks.CharBlock', (), {'label': 'First page button text', 'required': False}), 175: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'First page button icon', 'required': False}), 176: ('wagtail.blocks.CharBlock', (), {'label': 'Previous page button text', 'required': False}), 177: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Previous page button icon', 'required': False}), 178: ('wagtail.blocks.CharBlock', (), {'label': 'Next page button text', 'required': False}), 179: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Next page button icon', 'required': False}), 180: ('wagtail.blocks.CharBlock', (), {'label': 'Last page button text', 'required': False}), 181: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Last page button icon', 'required': False}), 182: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('border-primary', 'Border primary'), ('border-secondary', 'Border secondary'), ('border-success', 'Border success'), ('border-danger', 'Border danger'), ('border-warning', 'Border warning'), ('border-info', 'Border info'), ('border-light', 'Border light'), ('border-dark', 'Border dark'), ('border-0', 'No border'), ('border-0 mp-0', 'No border, no margin')], 'label': 'Post style in the list', 'required': False}), 183: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('h1', 'Header 1'), ('h2', 'Header 2'), ('h3', 'Header 3'), ('h4', 'Header 4'), ('h5', 'Header 5'), ('h6', 'Header 6'), ('display-1', 'Display header 1'), ('display-2', 'Display header 2'), ('display-3', 'Display header 3'), ('display-4', 'Display header 4'), ('display-5', 'Display header 5'), ('display-6', 'Display header 6'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic')], 'label': 'Post title style', 'required': False}), 184: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('justify-content-start', 'Left'), ('justify-content-center', 'Center'), ('justify-content-end', 'Right')], 'label': 'Paginator alignment'}), 185: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Normal'), ('pagination-sm', 'Small'), ('pagination-lg', 'Large')], 'label': 'Paginator text size', 'required': False}), 186: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Page numbers'), ('keyset', 'Previous and next pages (fast for long lists)')], 'label': 'Pagination mode', 'required': False}), 187: ('wagtail.blocks.IntegerBlock', (), {'label': 'Posts per page', 'min_value': 1, 'required': True}), 188: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending')], 'label': 'Categories ordering'}), 189: ('wagtail.blocks.BooleanBlock', (), {'label': 'Highlight post categories and tags when corresponding sidebar blocks are present', 'required': False}), 190: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show username', 'required': False}), 191: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show time in the date fields', 'required': False}), 192: ('wagtail.blocks.StructBlock', [[('show_pinned_posts', 165), ('pinned_posts_header', 166), ('pinned_posts_icon', 167), ('pinned_posts_icon_location', 168), ('pinned_posts_header_style', 169), ('posts_header', 170), ('posts_icon', 171), ('posts_icon_location', 172), ('posts_header_style', 173), ('first_page_text', 174), ('first_page_icon', 175), ('previous_page_text', 176), ('previous_page_icon', 177), ('next_page_text', 178), ('next_page_icon', 179), ('last_page_text', 180), ('last_page_icon', 181), ('post_style', 182), ('post_title_style', 183), ('page_alignment', 184), ('page_size', 185), ('pagination_mode', 186), ('posts_per_page', 187), ('order_by', 188), ('show_scrollspy', 189), ('show_username', 190), ('show_avatar', 149), ('show_first_published_at', 153), ('datetime_style', 157), ('show_time', 191), ('time_format', 158), ('timesince_text', 159)]], {})}),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+        ('waggylabs', '0006_postlistblock_pagination_mode'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostCategoryCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('num_posts', models.PositiveIntegerField(default=0, verbose_name='Number of posts')),
+                ('post_category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='counts', to='waggylabs.postcategory', verbose_name='Category')),
+                ('post_list_page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='waggylabs.postlistpage', verbose_name='Post list page')),
+            ],
+            options={
+                'verbose_name': 'Post category count',
+                'verbose_name_plural': 'Post category counts',
+                'unique_together': {('post_list_page', 'post_category')},
+            },
+        ),
+        migrations.CreateModel(
+            name='PostTagCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('num_posts', models.PositiveIntegerField(default=0, verbose_name='Number of posts')),
+                ('post_list_page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='waggylabs.postlistpage', verbose_name='Post list page')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='taggit.tag', verbose_name='Tag')),
+            ],
+            options={
+                'verbose_name': 'Post tag count',
+                'verbose_name_plural': 'Post tag counts',
+                'unique_together': {('post_list_page', 'tag')},
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:51
+
+import django.db.models.deletion
+import wagtail.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('waggylabs', '0007_postcategorycount_posttagcount'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='basepage',
+            name='sidebar',
+            field=wagtail.fields.StreamField([('sidebar', 99)], blank=True, block_lookup={0: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Fixed'), ('sticky-top', 'Sticky')], 'label': 'Style of the sidebar', 'required': False}), 1: ('wagtail.blocks.CharBlock', (), {'label': 'Header text', 'required': False}), 2: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Header icon', 'required': False}), 3: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Header icon location', 'required': False}), 4: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('h1', 'Header 1'), ('h2', 'Header 2'), ('h3', 'Header 3'), ('h4', 'Header 4'), ('h5', 'Header 5'), ('h6', 'Header 6'), ('display-1', 'Display header 1'), ('display-2', 'Display header 2'), ('display-3', 'Display header 3'), ('display-4', 'Display header 4'), ('display-5', 'Display header 5'), ('display-6', 'Display header 6'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic')], 'label': 'Header style', 'required': False}), 5: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('border-primary', 'Border primary'), ('border-secondary', 'Border secondary'), ('border-success', 'Border success'), ('border-danger', 'Border danger'), ('border-warning', 'Border warning'), ('border-info', 'Border info'), ('border-light', 'Border light'), ('border-dark', 'Border dark'), ('border-0', 'No border'), ('border-0 mp-0', 'No border, no margin')], 'label': 'Card style', 'required': False}), 6: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Left'), ('text-center', 'Center'), ('text-end', 'Right')], 'label': 'Text alignment', 'required': False}), 7: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Text', 'max_height': '100px', 'min_height': '100px', 'required': True, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 8: ('wagtail.blocks.StructBlock', [[('header', 1), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 4), ('block_style', 5), ('block_alignment', 6), ('item', 7)]], {}), 9: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Text wrap'), ('text-nowrap', 'No text wrapping')], 'label': 'Text wrapping', 'required': False}), 10: ('wagtail.blocks.StructBlock', [[('text_wrap', 9)]], {}), 11: ('wagtail.blocks.StructBlock', [[('header', 1), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 4), ('block_style', 5), ('block_alignment', 6), ('item', 10)]], {}), 12: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Link list style', 'required': False}), 13: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark')], 'label': 'Link item style', 'required': False}), 14: ('wagtail.blocks.URLBlock', (), {'label': 'Link to external site', 'required': True}), 15: ('wagtail.blocks.CharBlock', (), {'label': 'Text of the link', 'required': False}), 16: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Link icon', 'required': False}), 17: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Link icon location', 'required': False}), 18: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Link style', 'required': False}), 19: ('wagtail.blocks.StructBlock', [[('link', 14), ('text', 15), ('icon', 16), ('icon_location', 17), ('style', 18)]], {}), 20: ('wagtail.blocks.PageChooserBlock', (), {'label': 'Link to a page of this site'}), 21: ('wagtail.blocks.CharBlock', (), {'label': 'Text instead of page title', 'required': False}), 22: ('wagtail.blocks.StructBlock', [[('link', 20), ('text', 21), ('icon', 16), ('icon_location', 17), ('style', 18)]], {}), 23: ('wagtail.blocks.StreamBlock', [[('external_link', 19), ('internal_link', 22)]], {'use_json_field': True}), 24: ('wagtail.blocks.StructBlock', [[('link_list_style', 12), ('link_style', 13), ('text_wrap', 9), ('items', 23)]], {'label': 'List of links'}), 25: ('wagtail.blocks.StructBlock', [[('header', 1), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 4), ('block_style', 5), ('block_alignment', 6), ('item', 24)]], {}), 26: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show the name of the page creator', 'required': False}), 27: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page creator name is displayed.', 'label': 'Header of the page creator row', 'required': False}), 28: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show avatar', 'required': False}), 29: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('start', 'Before username'), ('end', 'After username')], 'label': 'Avatar location', 'required': False}), 30: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show the email of page creator', 'required': False}), 31: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page creator email is displayed.', 'label': 'Header of the page creator email row', 'required': False}), 32: ('wagtail.blocks.BooleanBlock', (), {'label': 'Date of page publication', 'required': False}), 33: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page publciation date is displayed.', 'label': 'Header of the page publication date', 'required': False}), 34: ('wagtail.blocks.BooleanBlock', (), {'label': 'Date of last page update', 'required': False}), 35: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the last page update is displayed.', 'label': 'Header of last page update', 'required': False}), 36: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('date', 'Only date'), ('datetime', 'Date and time'), ('timesince', 'Time since')], 'label': 'Date style'}), 37: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('G:i', '24-hour format'), ('g:i A', '12-hour format')], 'label': 'Time format'}), 38: ('wagtail.blocks.CharBlock', (), {'label': 'Time since text, e.g. ago', 'required': False}), 39: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Row header style', 'required': False}), 40: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Row style', 'required': False}), 41: ('wagtail.blocks.StructBlock', [[('show_user', 26), ('user_header', 27), ('show_avatar', 28), ('avatar_location', 29), ('show_email', 30), ('email_header', 31), ('show_first_published_at', 32), ('first_published_at_header', 33), ('show_last_published_at', 34), ('last_published_at_header', 35), ('datetime_style', 36), ('time_format', 37), ('timesince_text', 38), ('alignment', 6), ('row_header_style', 39), ('row_data_style', 40)]], {}), 42: ('wagtail.blocks.StructBlock', [[('header', 1), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 4), ('block_style', 5), ('block_alignment', 6), ('item', 41)]], {}), 43: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows only posts that are descendant of this page. If left empty, posts selected from all the posts are shown.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 44: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Archive links list style', 'required': False}), 45: ('wagtail.blocks.IntegerBlock', (), {'default': 0, 'help_text': 'If zero, all links are shown.', 'label': 'Number of archive links to show', 'min_value': 0, 'required': True}), 46: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Archive link style', 'required': False}), 47: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('day', 'By day'), ('month', 'By month'), ('year', 'By year')], 'label': 'Period of archive link'}), 48: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('DESC', 'Descneding'), ('ASC', 'Ascending')], 'label': 'Archive links order'}), 49: ('wagtail.blocks.CharBlock', (), {'help_text': 'When number of archive links is larger than number of archive links to show, button to show more links appears with the specified text.', 'label': 'More archives button text', 'required': False}), 50: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per archive link', 'required': False}), 51: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('rounded-pill text-bg-primary', 'Rounded primary'), ('rounded-pill text-bg-secondary', 'Rounded secondary'), ('rounded-pill text-bg-success', 'Rounded success'), ('rounded-pill text-bg-danger', 'Rounded danger'), ('rounded-pill text-bg-warning', 'Rounded warning'), ('rounded-pill text-bg-info', 'Rounded info'), ('rounded-pill text-bg-light', 'Rounded light'), ('rounded-pill text-bg-dark', 'Rounded dark')], 'label': 'Post number style', 'required': False}), 52: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('position-absolute top-0 start-100 translate-middle', 'Top right corner'), ('position-absolute top-0 start-0 translate-middle', 'Top left corner'), ('position-absolute top-100 start-100 translate-middle', 'Bottom right corner'), ('position-absolute top-100 start-0 translate-middle', 'Bottom left corner')], 'label': 'Post number location', 'required': False}), 53: ('wagtail.blocks.StructBlock', [[('post_list_page', 43), ('list_style', 44), ('archives_number', 45), ('list_item_style', 46), ('text_wrap', 9), ('archive_period', 47), ('order_by', 48), ('more_archive_text', 49), ('show_badges', 50), ('badge_style', 51), ('badge_location', 52)]], {}), 54: ('wagtail.blocks.StructBlock', [[('header', 1), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 4), ('block_style', 5), ('block_alignment', 6), ('item', 53)]], {}), 55: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows post categories for the posts, which are children of the selected post list page. If left empty, the currently browsed post list page will be used. Otherwise, no categories will be displayed.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 56: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Categories style', 'required': False}), 57: ('wagtail.blocks.IntegerBlock', (), {'default': 10, 'help_text': 'Depends on the selected order. If equals to zero, then all categories are shown.', 'label': 'Number of categories to show', 'min_value': 0, 'required': True}), 58: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Category item style', 'required': False}), 59: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending'), ('num_posts', 'By post number acsending'), ('-num_posts', 'By post number descending')], 'label': 'Categories ordering', 'required': False}), 60: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per category', 'required': False}), 61: ('wagtail.blocks.StructBlock', [[('post_list_page', 55), ('categories_style', 56), ('categories_number', 57), ('category_style', 58), ('order_by', 59), ('show_badges', 60), ('badge_style', 51), ('badge_location', 52)]], {}), 62: ('wagtail.blocks.StructBlock', [[('header', 1), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 4), ('block_style', 5), ('block_alignment', 6), ('item', 61)]], {}), 63: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Post list style', 'required': False}), 64: ('wagtail.blocks.IntegerBlock', (), {'help_text': 'If zero, all post are shown.', 'label': 'Number of posts to show', 'min_value': 0, 'required': True}), 65: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Post title item style', 'required': False}), 66: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('title', 'By title acsending'), ('-title', 'By title descending'), ('owner__username', 'By author ascending'), ('-owner__username', 'By author descending')], 'label': 'Posts ordering', 'required': False}), 67: ('wagtail.blocks.StructBlock', [[('post_list_page', 43), ('posts_style', 63), ('posts_number', 64), ('post_style', 65), ('text_wrap', 9), ('order_by', 66)]], {}), 68: ('wagtail.blocks.StructBlock', [[('header', 1), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 4), ('block_style', 5), ('block_alignment', 6), ('item', 67)]], {}), 69: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('active', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Current post style'}), 70: ('wagtail.blocks.StructBlock', [[('posts_style', 63), ('post_style', 65), ('text_wrap', 9), ('current_post_style', 69)]], {}), 71: ('wagtail.blocks.StructBlock', [[('header', 1), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 4), ('block_style', 5), ('block_alignment', 6), ('item', 70)]], {}), 72: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows post tags for the posts, which are children of the selected post list page. If left empty, the currently browsed post list page will be used. Otherwise, no categories will be displayed.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 73: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Tags style', 'required': False}), 74: ('wagtail.blocks.IntegerBlock', (), {'default': 10, 'help_text': 'Depends on the selected order. If equals to zero, then all tags are shown.', 'label': 'Number of tags to show', 'min_value': 0, 'required': True}), 75: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending'), ('num_posts', 'By post number acsending'), ('-num_posts', 'By post number descending')], 'label': 'Tags ordering', 'required': False}), 76: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per tag', 'required': False}), 77: ('wagtail.blocks.StructBlock', [[('post_list_page', 72), ('tags_style', 73), ('tags_number', 74), ('order_by', 75), ('show_badges', 76), ('badge_style', 51), ('badge_location', 52)]], {}), 78: ('wagtail.blocks.StructBlock', [[('header', 1), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 4), ('block_style', 5), ('block_alignment', 6), ('item', 77)]], {}), 79: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('nav nav-tabs', 'Tabs'), ('nav nav-pills', 'Pills'), ('nav nav-pills nav-fill', 'Wide pills')], 'label': 'Tabs style', 'required': False}), 80: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Tab buttons style', 'required': False}), 81: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fs-6', 'Normal'), ('fs-5', 'Bigger'), ('fs-4', 'Big'), ('fs-3', 'Larger'), ('fs-2', 'Large')], 'label': 'Tabs font size', 'required': False}), 82: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Horizontal'), ('flex-column', 'Vertical')], 'label': 'Tabs orientation', 'required': False}), 83: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('justify-content-start', 'Align left'), ('justify-content-center', 'Align center'), ('justify-content-end', 'Align right')], 'label': 'Tabs horizontal alignment'}), 84: ('wagtail.blocks.CharBlock', (), {'label': 'Preview buttons text', 'required': False}), 85: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Preview buttons icon', 'required': False}), 86: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Preview buttons icon location', 'required': False}), 87: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Preview buttons style', 'required': False}), 88: ('wagtail.blocks.BooleanBlock', (), {'label': 'Include embeds', 'required': False}), 89: ('wagtail.blocks.BooleanBlock', (), {'label': 'Include equations', 'required': False}), 90: ('wagtail.blocks.BooleanBlock', (), {'label': 'Include figures', 'required': False}), 91: ('wagtail.blocks.BooleanBlock', (), {'label': 'Include listings', 'required': False}), 92: ('wagtail.blocks.BooleanBlock', (), {'label': 'Include tables', 'required': False}), 93: ('wagtail.blocks.StructBlock', [[('preview_buttons_text', 84), ('preview_buttons_icon', 85), ('preview_buttons_icon_location', 86), ('preview_buttons_style', 87), ('include_embeds', 88), ('include_equations', 89), ('include_figures', 90), ('include_listings', 91), ('include_tables', 92)]], {}), 94: ('wagtail.blocks.StructBlock', [[('header', 1), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 4), ('block_style', 5), ('block_alignment', 6), ('item', 93)]], {}), 95: ('wagtail.blocks.StreamBlock', [[('text', 8), ('citations', 11), ('link_list', 25), ('page_info', 42), ('post_archive', 54), ('post_category_list', 62), ('post_highlights', 68), ('post_series', 71), ('post_tag_list', 78), ('toc', 11), ('visuals', 94)]], {}), 96: ('wagtail.blocks.StructBlock', [[('tabs_style', 79), ('buttons_style', 80), ('tabs_font_size', 81), ('tabs_orientation', 82), ('tabs_justify', 83), ('items', 95)]], {}), 97: ('wagtail.blocks.StructBlock', [[('header', 1), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 4), ('block_style', 5), ('block_alignment', 6), ('item', 96)]], {}), 98: ('wagtail.blocks.StreamBlock', [[('text', 8), ('citations', 11), ('link_list', 25), ('page_info', 42), ('post_archive', 54), ('post_category_list', 62), ('post_highlights', 68), ('post_series', 71), ('post_tag_list', 78), ('tabs', 97), ('toc', 11), ('visuals', 94)]], {}), 99: ('wagtail.blocks.StructBlock', [[('style', 0), ('items', 98)]], {})}),
+        ),
+        migrations.AlterField(
+            model_name='postlistpage',
+            name='body',
+            field=wagtail.fields.StreamField([('accordion', 110), ('blockquote', 11), ('card_grid', 133), ('carousel', 21), ('collapse', 139), ('columns', 145), ('citation', 25), ('cut', 147), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('page_info', 164), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 165), ('post_list', 193)], blank=True, block_lookup={0: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('collapsible', 'Items collapse'), ('stays_open', 'Items stay open')], 'help_text': 'Collapse items when new items opens or keep them open', 'label': 'Item collapse style'}), 1: ('wagtail.blocks.CharBlock', (), {'form_classname': 'full subtitle', 'label': 'Item heading', 'required': True}), 2: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Header icon', 'required': False}), 3: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Header icon location', 'required': False}), 4: ('wagtail.blocks.BooleanBlock', (), {'label': 'Item is displayed expanded', 'required': False}), 5: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'label': 'Quote text.', 'max_height': '100px', 'min_height': '100px', 'required': True, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,heading,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 6: ('wagtail.blocks.CharBlock', (), {'label': 'Author of the quoted text.', 'required': False}), 7: ('wagtail.blocks.CharBlock', (), {'label': 'Source of the quoted text.', 'required': False}), 8: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-blockquote', 'max_length': 50, 'required': False}), 9: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Left'), ('text-center', 'Center'), ('text-end', 'Right')], 'label': 'Text alignment', 'required': False}), 10: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show quote icon', 'required': False}), 11: ('wagtail.blocks.StructBlock', [[('quote', 5), ('author', 6), ('source', 7), ('label', 8), ('aligntment', 9), ('show_icon', 10)]], {}), 12: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('carousel-fade', 'Fade after interval'), ('carousel', 'Change after interval'), ('false', 'Change on button'), ('false-fade', 'Fade on button')], 'label': 'Carousel switch type'}), 13: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'No controls'), ('buttons', 'Left and right buttons'), ('indicators', 'Items indicators'), ('buttons_indicators', 'Buttons and indicators')], 'label': 'Controls of the carousel', 'required': False}), 14: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Picture for carousel', 'required': True}), 15: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'label': 'Text in front of the picture', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,heading,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 16: ('wagtail.blocks.IntegerBlock', (), {'default': 1000, 'help_text': 'Enter the value in milliseconds to keep the current item during this interval', 'label': 'Interval in milliseconds to keep the item', 'min_value': 0, 'required': False}), 17: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text-light', 'Light'), ('text-dark', 'Dark')], 'label': 'Text color', 'required': False}), 18: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('fs-6', 'Normal'), ('fs-5', 'Bigger'), ('fs-4', 'Big'), ('fs-3', 'Larger'), ('fs-2', 'Large')], 'label': 'Text size', 'required': False}), 19: ('wagtail.blocks.StructBlock', [[('image', 14), ('caption', 15), ('interval', 16), ('text_justify', 9), ('text_color', 17), ('text_size', 18)]], {}), 20: ('wagtail.blocks.ListBlock', (19,), {'min_num': 1}), 21: ('wagtail.blocks.StructBlock', [[('switch', 12), ('controls', 13), ('items', 20)]], {}), 22: ('wagtail.blocks.CharBlock', (), {'label': 'Title of the citation.', 'required': False}), 23: ('wagtail.blocks.URLBlock', (), {'label': 'Citation link', 'required': False}), 24: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-cite', 'help_text': 'Cite literature using LaTeX \\cite{...} syntax in text markdown block.', 'required': False}), 25: ('wagtail.blocks.StructBlock', [[('citation', 22), ('link', 23), ('label', 24)]], {}), 26: ('wagtail.documents.blocks.DocumentChooserBlock', (), {}), 27: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-cite', 'help_text': 'Cite documents using LaTeX \\cite{...} syntax in text markdown block.', 'required': False}), 28: ('wagtail.blocks.StructBlock', [[('document', 26), ('label', 27)]], {}), 29: ('wagtail.embeds.blocks.EmbedBlock', (), {'label': 'URL of embedding'}), 30: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Embed caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 31: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-embed', 'max_length': 50, 'required': False}), 32: ('wagtail.blocks.StructBlock', [[('embed', 29), ('caption', 30), ('label', 31)]], {}), 33: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': 'Write or paste LaTeX style equation (equation, matrix, align, etc. environments are supported). ', 'max_height': '150px', 'min_height': '150px', 'required': True, 'statusbar': 'false', 'stex_combine': 'false', 'toolbar': 'subscript,superscript,equation,matrix,align,multiline,split,gather,alignat,flalign,|,preview,side-by-side,fullscreen'}), 34: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': 'Caption that will be displayed when the equation is shown in the dialog box or in the sidebar.', 'label': 'Equation caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 35: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-equation', 'help_text': 'Label for the current equation to be used in the markdown block for referencing using standard LaTeX \\ㅤref{...} syntax. This label will be added only if no \\ㅤlabel{...} is found within the \\ㅤbegin{...}...\\ㅤend{...} statement.The final reference processing is happening on the published page, which can be checked using "Preview" functionality.', 'max_length': 50, 'required': False}), 36: ('wagtail.blocks.StructBlock', [[('equation', 33), ('caption', 34), ('label', 35)]], {}), 37: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Graphic', 'required': True}), 38: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Figure caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 39: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-figure', 'max_length': 50, 'required': False}), 40: ('wagtail.blocks.StructBlock', [[('image', 37), ('caption', 38), ('label', 39)]], {}), 41: ('wagtail.blocks.CharBlock', (), {'label': 'Header text', 'required': False}), 42: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('h1', 'Header 1'), ('h2', 'Header 2'), ('h3', 'Header 3'), ('h4', 'Header 4'), ('h5', 'Header 5'), ('h6', 'Header 6'), ('display-1', 'Display header 1'), ('display-2', 'Display header 2'), ('display-3', 'Display header 3'), ('display-4', 'Display header 4'), ('display-5', 'Display header 5'), ('display-6', 'Display header 6'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic')], 'label': 'Header style', 'required': False}), 43: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('border-primary', 'Border primary'), ('border-secondary', 'Border secondary'), ('border-success', 'Border success'), ('border-danger', 'Border danger'), ('border-warning', 'Border warning'), ('border-info', 'Border info'), ('border-light', 'Border light'), ('border-dark', 'Border dark'), ('border-0', 'No border'), ('border-0 mp-0', 'No border, no margin')], 'label': 'Card style', 'required': False}), 44: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Link list style', 'required': False}), 45: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark')], 'label': 'Link item style', 'required': False}), 46: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Text wrap'), ('text-nowrap', 'No text wrapping')], 'label': 'Text wrapping', 'required': False}), 47: ('wagtail.blocks.URLBlock', (), {'label': 'Link to external site', 'required': True}), 48: ('wagtail.blocks.CharBlock', (), {'label': 'Text of the link', 'required': False}), 49: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Link icon', 'required': False}), 50: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Link icon location', 'required': False}), 51: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Link style', 'required': False}), 52: ('wagtail.blocks.StructBlock', [[('link', 47), ('text', 48), ('icon', 49), ('icon_location', 50), ('style', 51)]], {}), 53: ('wagtail.blocks.PageChooserBlock', (), {'label': 'Link to a page of this site'}), 54: ('wagtail.blocks.CharBlock', (), {'label': 'Text instead of page title', 'required': False}), 55: ('wagtail.blocks.StructBlock', [[('link', 53), ('text', 54), ('icon', 49), ('icon_location', 50), ('style', 51)]], {}), 56: ('wagtail.blocks.StreamBlock', [[('external_link', 52), ('internal_link', 55)]], {'use_json_field': True}), 57: ('wagtail.blocks.StructBlock', [[('link_list_style', 44), ('link_style', 45), ('text_wrap', 46), ('items', 56)]], {'label': 'List of links'}), 58: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 57)]], {}), 59: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text/x-python', 'Python'), ('text/x-csrc', 'C'), ('text/x-c++src', 'C++'), ('text/x-java', 'Java/Kotlin'), ('text/x-csharp', 'C#'), ('text/x-objectivec', 'Objective C'), ('text/x-scala', 'Scala'), ('application/xml', 'XML'), ('text/html', 'HTML'), ('text/javascript', 'Javascipt'), ('text/json', 'JSON'), ('text/typescript', 'TypeScript'), ('text/x-mathematica', 'Mathematica'), ('text/x-octave', 'Matlab'), ('application/x-powershell', 'Powershell'), ('text/x-sh', 'Bach/Shell'), ('text/x-swift', 'Swift'), ('text/x-sql', 'SQL')], 'help_text': 'Choose the programming language.', 'label': 'Code language'}), 60: ('wagtail.blocks.TextBlock', (), {'help_text': 'Write or paste code.', 'label': 'Code snippet', 'required': True}), 61: ('wagtail.blocks.StructBlock', [[('mode', 59), ('code', 60)]], {'label': None}), 62: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Listing caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 63: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-listing', 'max_length': 50, 'required': False}), 64: ('wagtail.blocks.StructBlock', [[('code', 61), ('caption', 62), ('label', 63)]], {}), 65: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows only posts that are descendant of this page. If left empty, posts selected from all the posts are shown.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 66: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Archive links list style', 'required': False}), 67: ('wagtail.blocks.IntegerBlock', (), {'default': 0, 'help_text': 'If zero, all links are shown.', 'label': 'Number of archive links to show', 'min_value': 0, 'required': True}), 68: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Archive link style', 'required': False}), 69: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('day', 'By day'), ('month', 'By month'), ('year', 'By year')], 'label': 'Period of archive link'}), 70: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('DESC', 'Descneding'), ('ASC', 'Ascending')], 'label': 'Archive links order'}), 71: ('wagtail.blocks.CharBlock', (), {'help_text': 'When number of archive links is larger than number of archive links to show, button to show more links appears with the specified text.', 'label': 'More archives button text', 'required': False}), 72: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per archive link', 'required': False}), 73: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('rounded-pill text-bg-primary', 'Rounded primary'), ('rounded-pill text-bg-secondary', 'Rounded secondary'), ('rounded-pill text-bg-success', 'Rounded success'), ('rounded-pill text-bg-danger', 'Rounded danger'), ('rounded-pill text-bg-warning', 'Rounded warning'), ('rounded-pill text-bg-info', 'Rounded info'), ('rounded-pill text-bg-light', 'Rounded light'), ('rounded-pill text-bg-dark', 'Rounded dark')], 'label': 'Post number style', 'required': False}), 74: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('position-absolute top-0 start-100 translate-middle', 'Top right corner'), ('position-absolute top-0 start-0 translate-middle', 'Top left corner'), ('position-absolute top-100 start-100 translate-middle', 'Bottom right corner'), ('position-absolute top-100 start-0 translate-middle', 'Bottom left corner')], 'label': 'Post number location', 'required': False}), 75: ('wagtail.blocks.StructBlock', [[('post_list_page', 65), ('list_style', 66), ('archives_number', 67), ('list_item_style', 68), ('text_wrap', 46), ('archive_period', 69), ('order_by', 70), ('more_archive_text', 71), ('show_badges', 72), ('badge_style', 73), ('badge_location', 74)]], {}), 76: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 75)]], {}), 77: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows post categories for the posts, which are children of the selected post list page. If left empty, the currently browsed post list page will be used. Otherwise, no categories will be displayed.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 78: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Categories style', 'required': False}), 79: ('wagtail.blocks.IntegerBlock', (), {'default': 10, 'help_text': 'Depends on the selected order. If equals to zero, then all categories are shown.', 'label': 'Number of categories to show', 'min_value': 0, 'required': True}), 80: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Category item style', 'required': False}), 81: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending'), ('num_posts', 'By post number acsending'), ('-num_posts', 'By post number descending')], 'label': 'Categories ordering', 'required': False}), 82: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per category', 'required': False}), 83: ('wagtail.blocks.StructBlock', [[('post_list_page', 77), ('categories_style', 78), ('categories_number', 79), ('category_style', 80), ('order_by', 81), ('show_badges', 82), ('badge_style', 73), ('badge_location', 74)]], {}), 84: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 83)]], {}), 85: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Post list style', 'required': False}), 86: ('wagtail.blocks.IntegerBlock', (), {'help_text': 'If zero, all post are shown.', 'label': 'Number of posts to show', 'min_value': 0, 'required': True}), 87: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Post title item style', 'required': False}), 88: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('title', 'By title acsending'), ('-title', 'By title descending'), ('owner__username', 'By author ascending'), ('-owner__username', 'By author descending')], 'label': 'Posts ordering', 'required': False}), 89: ('wagtail.blocks.StructBlock', [[('post_list_page', 65), ('posts_style', 85), ('posts_number', 86), ('post_style', 87), ('text_wrap', 46), ('order_by', 88)]], {}), 90: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 89)]], {}), 91: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows post tags for the posts, which are children of the selected post list page. If left empty, the currently browsed post list page will be used. Otherwise, no categories will be displayed.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 92: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Tags style', 'required': False}), 93: ('wagtail.blocks.IntegerBlock', (), {'default': 10, 'help_text': 'Depends on the selected order. If equals to zero, then all tags are shown.', 'label': 'Number of tags to show', 'min_value': 0, 'required': True}), 94: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending'), ('num_posts', 'By post number acsending'), ('-num_posts', 'By post number descending')], 'label': 'Tags ordering', 'required': False}), 95: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per tag', 'required': False}), 96: ('wagtail.blocks.StructBlock', [[('post_list_page', 91), ('tags_style', 92), ('tags_number', 93), ('order_by', 94), ('show_badges', 95), ('badge_style', 73), ('badge_location', 74)]], {}), 97: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 96)]], {}), 98: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 99: ('waggylabs.blocks.table.BareTableBlock', (), {'help_text': 'Columns and rows can be added via context menu appearing on the right click. Markdown inside cells is supported. Inline LateX equations can be added using $...$ pattern.', 'keep_table_tag': False, 'label': 'Table data', 'required': True}), 100: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table footer', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 101: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-table', 'max_length': 50, 'required': False}), 102: ('wagtail.blocks.StructBlock', [[('caption', 98), ('table', 99), ('footer', 100), ('label', 101)]], {}), 103: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table caption', 'max_height': '150px', 'min_height': '150px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 104: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Table image', 'required': True}), 105: ('wagtail.blocks.StructBlock', [[('caption', 103), ('image', 104), ('footer', 100), ('label', 101)]], {}), 106: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'max_height': '150px', 'min_height': '150px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 107: ('wagtail.blocks.StreamBlock', [[('blockquote', 11), ('carousel', 21), ('citation', 25), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 106)]], {'required': False}), 108: ('wagtail.blocks.StructBlock', [[('heading', 1), ('header_icon', 2), ('header_icon_location', 3), ('is_open', 4), ('body', 107)]], {}), 109: ('wagtail.blocks.ListBlock', (108,), {}), 110: ('wagtail.blocks.StructBlock', [[('style', 0), ('items', 109)]], {}), 111: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('h-100', 'Equal height'), ('', 'Height wraps to content')], 'label': 'Card height style', 'required': False}), 112: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('separate', 'Separate'), ('grouped', 'Grouped')], 'label': 'Card grouping style', 'required': False}), 113: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('vertical', 'Vertical'), ('horizontal', 'Horizontal')], 'label': 'Card orientation', 'required': False}), 114: ('wagtail.blocks.ChoiceBlock', [], {'choices': [(1, '1 column'), (2, '2 columns'), (3, '3 columns')], 'label': 'Number of columns', 'required': False}), 115: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Image', 'required': False}), 116: ('wagtail.blocks.CharBlock', (), {'label': 'Card title', 'required': True}), 117: ('wagtail.blocks.CharBlock', (), {'label': 'Card subtitle', 'required': False}), 118: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 119: ('wagtail.blocks.EmailBlock', (), {'label': 'Email address', 'required': True}), 120: ('wagtail.blocks.CharBlock', (), {'label': 'Text instead of email', 'required': False}), 121: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Email icon', 'required': False}), 122: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Email icon location', 'required': False}), 123: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Email style', 'required': False}), 124: ('wagtail.blocks.StructBlock', [[('email', 119), ('text', 120), ('icon', 121), ('icon_location', 122), ('style', 123)]], {}), 125: ('wagtail.blocks.CharBlock', (), {'label': 'Phone, address, etc.', 'required': True}), 126: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Style', 'required': False}), 127: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Icon', 'required': False}), 128: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Icon location', 'required': False}), 129: ('wagtail.blocks.StructBlock', [[('text', 125), ('style', 126), ('icon', 127), ('icon_location', 128)]], {}), 130: ('wagtail.blocks.StreamBlock', [[('external_link', 52), ('internal_link', 55), ('email', 124), ('info_text', 129)]], {'required': False}), 131: ('wagtail.blocks.StructBlock', [[('image', 115), ('style', 43), ('title', 116), ('subtitle', 117), ('alignment', 9), ('text', 118), ('links', 130)]], {}), 132: ('wagtail.blocks.ListBlock', (131,), {}), 133: ('wagtail.blocks.StructBlock', [[('height_style', 111), ('grouping_style', 112), ('orientation_style', 113), ('columns', 114), ('items', 132)]], {}), 134: ('wagtail.blocks.CharBlock', (), {'label': 'Text on the button', 'required': False}), 135: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Button icon', 'required': False}), 136: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Button icon location', 'required': False}), 137: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('border-primary', 'Border primary'), ('border-secondary', 'Border secondary'), ('border-success', 'Border success'), ('border-danger', 'Border danger'), ('border-warning', 'Border warning'), ('border-info', 'Border info'), ('border-light', 'Border light'), ('border-dark', 'Border dark'), ('border-0', 'No border'), ('border-0 mp-0', 'No border, no margin')], 'label': 'Block style', 'required': False}), 138: ('wagtail.blocks.StreamBlock', [[('blockquote', 11), ('carousel', 21), ('citation', 25), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 106)]], {'requred': True}), 139: ('wagtail.blocks.StructBlock', [[('text', 134), ('icon', 135), ('icon_location', 136), ('button_style', 51), ('style', 137), ('alignment', 9), ('body', 138)]], {}), 140: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('align-self-start', 'Top'), ('align-self-center', 'Center'), ('align-self-end', 'Bottom')], 'label': 'Column content vertical alignment'}), 141: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': ''}), 142: ('wagtail.blocks.StreamBlock', [[('accordion', 110), ('blockquote', 11), ('carousel', 21), ('citation', 25), ('collapse', 139), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 141)]], {'required': False}), 143: ('wagtail.blocks.StructBlock', [[('vertical_align', 140), ('body', 142)]], {}), 144: ('wagtail.blocks.ListBlock', (143,), {'max_num': 3, 'min_num': 1}), 145: ('wagtail.blocks.StructBlock', [[('items', 144)]], {}), 146: ('wagtail.blocks.CharBlock', (), {'label': 'Text on the cut button', 'required': False}), 147: ('wagtail.blocks.StructBlock', [[('text', 146), ('style', 51), ('icon', 135), ('icon_location', 136)]], {}), 148: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show the name of the page creator', 'required': False}), 149: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page creator name is displayed.', 'label': 'Header of the page creator row', 'required': False}), 150: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show avatar', 'required': False}), 151: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('start', 'Before username'), ('end', 'After username')], 'label': 'Avatar location', 'required': False}), 152: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show the email of page creator', 'required': False}), 153: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page creator email is displayed.', 'label': 'Header of the page creator email row', 'required': False}), 154: ('wagtail.blocks.BooleanBlock', (), {'label': 'Date of page publication', 'required': False}), 155: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page publciation date is displayed.', 'label': 'Header of the page publication date', 'required': False}), 156: ('wagtail.blocks.BooleanBlock', (), {'label': 'Date of last page update', 'required': False}), 157: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the last page update is displayed.', 'label': 'Header of last page update', 'required': False}), 158: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('date', 'Only date'), ('datetime', 'Date and time'), ('timesince', 'Time since')], 'label': 'Date style'}), 159: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('G:i', '24-hour format'), ('g:i A', '12-hour format')], 'label': 'Time format'}), 160: ('wagtail.blocks.CharBlock', (), {'label': 'Time since text, e.g. ago', 'required': False}), 161: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Row header style', 'required': False}), 162: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Row style', 'required': False}), 163: ('wagtail.blocks.StructBlock', [[('show_user', 148), ('user_header', 149), ('show_avatar', 150), ('avatar_location', 151), ('show_email', 152), ('email_header', 153), ('show_first_published_at', 154), ('first_published_at_header', 155), ('show_last_published_at', 156), ('last_published_at_header', 157), ('datetime_style', 158), ('time_format', 159), ('timesince_text', 160), ('alignment', 9), ('row_header_style', 161), ('row_data_style', 162)]], {}), 164: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 163)]], {}), 165: ('waggylabs.blocks.markdown.MarkdownBlock', (), {}), 166: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show pinned posts', 'required': False}), 167: ('wagtail.blocks.CharBlock', (), {'label': 'Pinned posts header', 'required': False}), 168: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Pinned posts icon', 'required': False}), 169: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Pinned posts icon location', 'required': False}), 170: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('h1', 'Header 1'), ('h2', 'Header 2'), ('h3', 'Header 3'), ('h4', 'Header 4'), ('h5', 'Header 5'), ('h6', 'Header 6'), ('display-1', 'Display header 1'), ('display-2', 'Display header 2'), ('display-3', 'Display header 3'), ('display-4', 'Display header 4'), ('display-5', 'Display header 5'), ('display-6', 'Display header 6'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic')], 'label': 'Pinned posts header style', 'required': False}), 171: ('wagtail.blocks.CharBlock', (), {'label': 'Post list header', 'required': False}), 172: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Post list icon', 'required': False}), 173: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Post list icon location', 'required': False}), 174: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('h1', 'Header 1'), ('h2', 'Header 2'), ('h3', 'Header 3'), ('h4', 'Header 4'), ('h5', 'Header 5'), ('h6', 'Header 6'), ('display-1', 'Display header 1'), ('display-2', 'Display header 2'), ('display-3', 'Display header 3'), ('display-4', 'Display header 4'), ('display-5', 'Display header 5'), ('display-6', 'Display header 6'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic')], 'label': 'Post list header style', 'required': False}), 175: ('wagtail.blocks.CharBlock', (), {'label': 'First page button text', 'required': False}), 176: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'First page button icon', 'required': False}), 177: ('wagtail.blocks.CharBlock', (), {'label': 'Previous page button text', 'required': False}), 178: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Previous page button icon', 'required': False}), 179: ('wagtail.blocks.CharBlock', (), {'label': 'Next page button text', 'required': False}), 180: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Next page button icon', 'required': False}), 181: ('wagtail.blocks.CharBlock', (), {'label': 'Last page button text', 'required': False}), 182: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Last page button icon', 'required': False}), 183: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('border-primary', 'Border primary'), ('border-secondary', 'Border secondary'), ('border-success', 'Border success'), ('border-danger', 'Border danger'), ('border-warning', 'Border warning'), ('border-info', 'Border info'), ('border-light', 'Border light'), ('border-dark', 'Border dark'), ('border-0', 'No border'), ('border-0 mp-0', 'No border, no margin')], 'label': 'Post style in the list', 'required': False}), 184: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('h1', 'Header 1'), ('h2', 'Header 2'), ('h3', 'Header 3'), ('h4', 'Header 4'), ('h5', 'Header 5'), ('h6', 'Header 6'), ('display-1', 'Display header 1'), ('display-2', 'Display header 2'), ('display-3', 'Display header 3'), ('display-4', 'Display header 4'), ('display-5', 'Display header 5'), ('display-6', 'Display header 6'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic')], 'label': 'Post title style', 'required': False}), 185: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('justify-content-start', 'Left'), ('justify-content-center', 'Center'), ('justify-content-end', 'Right')], 'label': 'Paginator alignment'}), 186: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Normal'), ('pagination-sm', 'Small'), ('pagination-lg', 'Large')], 'label': 'Paginator text size', 'required': False}), 187: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Page numbers'), ('keyset', 'Previous and next pages (fast for long lists)')], 'label': 'Pagination mode', 'required': False}), 188: ('wagtail.blocks.IntegerBlock', (), {'label': 'Posts per page', 'min_value': 1, 'required': True}), 189: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending')], 'label': 'Categories ordering'}), 190: ('wagtail.blocks.BooleanBlock', (), {'label': 'Highlight post categories and tags when corresponding sidebar blocks are present', 'required': False}), 191: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show username', 'required': False}), 192: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show time in the date fields', 'required': False}), 193: ('wagtail.blocks.StructBlock', [[('show_pinned_posts', 166), ('pinned_posts_header', 167), ('pinned_posts_icon', 168), ('pinned_posts_icon_location', 169), ('pinned_posts_header_style', 170), ('posts_header', 171), ('posts_icon', 172), ('posts_icon_location', 173), ('posts_header_style', 174), ('first_page_text', 175), ('first_page_icon', 176), ('previous_page_text', 177), ('previous_page_icon', 178), ('next_page_text', 179), ('next_page_icon', 180), ('last_page_text', 181), ('last_page_icon', 182), ('post_style', 183), ('post_title_style', 184), ('page_alignment', 185), ('page_size', 186), ('pagination_mode', 187), ('posts_per_page', 188), ('order_by', 189), ('show_scrollspy', 190), ('show_username', 191), ('show_avatar', 150), ('show_first_published_at', 154), ('datetime_style', 158), ('show_time', 192), ('time_format', 159), ('timesince_text', 160)]], {})}),
+        ),
+        migrations.AlterField(
+            model_name='postpage',
+            name='body',
+            field=wagtail.fields.StreamField([('accordion', 110), ('blockquote', 11), ('card_grid', 133), ('carousel', 21), ('collapse', 139), ('columns', 145), ('citation', 25), ('cut', 147), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('page_info', 164), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 165), ('post_meta', 181), ('post_series', 184)], blank=True, block_lookup={0: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('collapsible', 'Items collapse'), ('stays_open', 'Items stay open')], 'help_text': 'Collapse items when new items opens or keep them open', 'label': 'Item collapse style'}), 1: ('wagtail.blocks.CharBlock', (), {'form_classname': 'full subtitle', 'label': 'Item heading', 'required': True}), 2: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Header icon', 'required': False}), 3: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Header icon location', 'required': False}), 4: ('wagtail.blocks.BooleanBlock', (), {'label': 'Item is displayed expanded', 'required': False}), 5: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'label': 'Quote text.', 'max_height': '100px', 'min_height': '100px', 'required': True, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,heading,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 6: ('wagtail.blocks.CharBlock', (), {'label': 'Author of the quoted text.', 'required': False}), 7: ('wagtail.blocks.CharBlock', (), {'label': 'Source of the quoted text.', 'required': False}), 8: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-blockquote', 'max_length': 50, 'required': False}), 9: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Left'), ('text-center', 'Center'), ('text-end', 'Right')], 'label': 'Text alignment', 'required': False}), 10: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show quote icon', 'required': False}), 11: ('wagtail.blocks.StructBlock', [[('quote', 5), ('author', 6), ('source', 7), ('label', 8), ('aligntment', 9), ('show_icon', 10)]], {}), 12: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('carousel-fade', 'Fade after interval'), ('carousel', 'Change after interval'), ('false', 'Change on button'), ('false-fade', 'Fade on button')], 'label': 'Carousel switch type'}), 13: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'No controls'), ('buttons', 'Left and right buttons'), ('indicators', 'Items indicators'), ('buttons_indicators', 'Buttons and indicators')], 'label': 'Controls of the carousel', 'required': False}), 14: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Picture for carousel', 'required': True}), 15: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'label': 'Text in front of the picture', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,heading,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 16: ('wagtail.blocks.IntegerBlock', (), {'default': 1000, 'help_text': 'Enter the value in milliseconds to keep the current item during this interval', 'label': 'Interval in milliseconds to keep the item', 'min_value': 0, 'required': False}), 17: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text-light', 'Light'), ('text-dark', 'Dark')], 'label': 'Text color', 'required': False}), 18: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('fs-6', 'Normal'), ('fs-5', 'Bigger'), ('fs-4', 'Big'), ('fs-3', 'Larger'), ('fs-2', 'Large')], 'label': 'Text size', 'required': False}), 19: ('wagtail.blocks.StructBlock', [[('image', 14), ('caption', 15), ('interval', 16), ('text_justify', 9), ('text_color', 17), ('text_size', 18)]], {}), 20: ('wagtail.blocks.ListBlock', (19,), {'min_num': 1}), 21: ('wagtail.blocks.StructBlock', [[('switch', 12), ('controls', 13), ('items', 20)]], {}), 22: ('wagtail.blocks.CharBlock', (), {'label': 'Title of the citation.', 'required': False}), 23: ('wagtail.blocks.URLBlock', (), {'label': 'Citation link', 'required': False}), 24: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-cite', 'help_text': 'Cite literature using LaTeX \\cite{...} syntax in text markdown block.', 'required': False}), 25: ('wagtail.blocks.StructBlock', [[('citation', 22), ('link', 23), ('label', 24)]], {}), 26: ('wagtail.documents.blocks.DocumentChooserBlock', (), {}), 27: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-cite', 'help_text': 'Cite documents using LaTeX \\cite{...} syntax in text markdown block.', 'required': False}), 28: ('wagtail.blocks.StructBlock', [[('document', 26), ('label', 27)]], {}), 29: ('wagtail.embeds.blocks.EmbedBlock', (), {'label': 'URL of embedding'}), 30: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Embed caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 31: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-embed', 'max_length': 50, 'required': False}), 32: ('wagtail.blocks.StructBlock', [[('embed', 29), ('caption', 30), ('label', 31)]], {}), 33: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': 'Write or paste LaTeX style equation (equation, matrix, align, etc. environments are supported). ', 'max_height': '150px', 'min_height': '150px', 'required': True, 'statusbar': 'false', 'stex_combine': 'false', 'toolbar': 'subscript,superscript,equation,matrix,align,multiline,split,gather,alignat,flalign,|,preview,side-by-side,fullscreen'}), 34: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': 'Caption that will be displayed when the equation is shown in the dialog box or in the sidebar.', 'label': 'Equation caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 35: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-equation', 'help_text': 'Label for the current equation to be used in the markdown block for referencing using standard LaTeX \\ㅤref{...} syntax. This label will be added only if no \\ㅤlabel{...} is found within the \\ㅤbegin{...}...\\ㅤend{...} statement.The final reference processing is happening on the published page, which can be checked using "Preview" functionality.', 'max_length': 50, 'required': False}), 36: ('wagtail.blocks.StructBlock', [[('equation', 33), ('caption', 34), ('label', 35)]], {}), 37: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Graphic', 'required': True}), 38: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Figure caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 39: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-figure', 'max_length': 50, 'required': False}), 40: ('wagtail.blocks.StructBlock', [[('image', 37), ('caption', 38), ('label', 39)]], {}), 41: ('wagtail.blocks.CharBlock', (), {'label': 'Header text', 'required': False}), 42: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('h1', 'Header 1'), ('h2', 'Header 2'), ('h3', 'Header 3'), ('h4', 'Header 4'), ('h5', 'Header 5'), ('h6', 'Header 6'), ('display-1', 'Display header 1'), ('display-2', 'Display header 2'), ('display-3', 'Display header 3'), ('display-4', 'Display header 4'), ('display-5', 'Display header 5'), ('display-6', 'Display header 6'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic')], 'label': 'Header style', 'required': False}), 43: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('border-primary', 'Border primary'), ('border-secondary', 'Border secondary'), ('border-success', 'Border success'), ('border-danger', 'Border danger'), ('border-warning', 'Border warning'), ('border-info', 'Border info'), ('border-light', 'Border light'), ('border-dark', 'Border dark'), ('border-0', 'No border'), ('border-0 mp-0', 'No border, no margin')], 'label': 'Card style', 'required': False}), 44: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Link list style', 'required': False}), 45: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark')], 'label': 'Link item style', 'required': False}), 46: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Text wrap'), ('text-nowrap', 'No text wrapping')], 'label': 'Text wrapping', 'required': False}), 47: ('wagtail.blocks.URLBlock', (), {'label': 'Link to external site', 'required': True}), 48: ('wagtail.blocks.CharBlock', (), {'label': 'Text of the link', 'required': False}), 49: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Link icon', 'required': False}), 50: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Link icon location', 'required': False}), 51: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Link style', 'required': False}), 52: ('wagtail.blocks.StructBlock', [[('link', 47), ('text', 48), ('icon', 49), ('icon_location', 50), ('style', 51)]], {}), 53: ('wagtail.blocks.PageChooserBlock', (), {'label': 'Link to a page of this site'}), 54: ('wagtail.blocks.CharBlock', (), {'label': 'Text instead of page title', 'required': False}), 55: ('wagtail.blocks.StructBlock', [[('link', 53), ('text', 54), ('icon', 49), ('icon_location', 50), ('style', 51)]], {}), 56: ('wagtail.blocks.StreamBlock', [[('external_link', 52), ('internal_link', 55)]], {'use_json_field': True}), 57: ('wagtail.blocks.StructBlock', [[('link_list_style', 44), ('link_style', 45), ('text_wrap', 46), ('items', 56)]], {'label': 'List of links'}), 58: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 57)]], {}), 59: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text/x-python', 'Python'), ('text/x-csrc', 'C'), ('text/x-c++src', 'C++'), ('text/x-java', 'Java/Kotlin'), ('text/x-csharp', 'C#'), ('text/x-objectivec', 'Objective C'), ('text/x-scala', 'Scala'), ('application/xml', 'XML'), ('text/html', 'HTML'), ('text/javascript', 'Javascipt'), ('text/json', 'JSON'), ('text/typescript', 'TypeScript'), ('text/x-mathematica', 'Mathematica'), ('text/x-octave', 'Matlab'), ('application/x-powershell', 'Powershell'), ('text/x-sh', 'Bach/Shell'), ('text/x-swift', 'Swift'), ('text/x-sql', 'SQL')], 'help_text': 'Choose the programming language.', 'label': 'Code language'}), 60: ('wagtail.blocks.TextBlock', (), {'help_text': 'Write or paste code.', 'label': 'Code snippet', 'required': True}), 61: ('wagtail.blocks.StructBlock', [[('mode', 59), ('code', 60)]], {'label': None}), 62: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Listing caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 63: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-listing', 'max_length': 50, 'required': False}), 64: ('wagtail.blocks.StructBlock', [[('code', 61), ('caption', 62), ('label', 63)]], {}), 65: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows only posts that are descendant of this page. If left empty, posts selected from all the posts are shown.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 66: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Archive links list style', 'required': False}), 67: ('wagtail.blocks.IntegerBlock', (), {'default': 0, 'help_text': 'If zero, all links are shown.', 'label': 'Number of archive links to show', 'min_value': 0, 'required': True}), 68: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Archive link style', 'required': False}), 69: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('day', 'By day'), ('month', 'By month'), ('year', 'By year')], 'label': 'Period of archive link'}), 70: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('DESC', 'Descneding'), ('ASC', 'Ascending')], 'label': 'Archive links order'}), 71: ('wagtail.blocks.CharBlock', (), {'help_text': 'When number of archive links is larger than number of archive links to show, button to show more links appears with the specified text.', 'label': 'More archives button text', 'required': False}), 72: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per archive link', 'required': False}), 73: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('rounded-pill text-bg-primary', 'Rounded primary'), ('rounded-pill text-bg-secondary', 'Rounded secondary'), ('rounded-pill text-bg-success', 'Rounded success'), ('rounded-pill text-bg-danger', 'Rounded danger'), ('rounded-pill text-bg-warning', 'Rounded warning'), ('rounded-pill text-bg-info', 'Rounded info'), ('rounded-pill text-bg-light', 'Rounded light'), ('rounded-pill text-bg-dark', 'Rounded dark')], 'label': 'Post number style', 'required': False}), 74: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('position-absolute top-0 start-100 translate-middle', 'Top right corner'), ('position-absolute top-0 start-0 translate-middle', 'Top left corner'), ('position-absolute top-100 start-100 translate-middle', 'Bottom right corner'), ('position-absolute top-100 start-0 translate-middle', 'Bottom left corner')], 'label': 'Post number location', 'required': False}), 75: ('wagtail.blocks.StructBlock', [[('post_list_page', 65), ('list_style', 66), ('archives_number', 67), ('list_item_style', 68), ('text_wrap', 46), ('archive_period', 69), ('order_by', 70), ('more_archive_text', 71), ('show_badges', 72), ('badge_style', 73), ('badge_location', 74)]], {}), 76: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 75)]], {}), 77: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows post categories for the posts, which are children of the selected post list page. If left empty, the currently browsed post list page will be used. Otherwise, no categories will be displayed.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 78: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Categories style', 'required': False}), 79: ('wagtail.blocks.IntegerBlock', (), {'default': 10, 'help_text': 'Depends on the selected order. If equals to zero, then all categories are shown.', 'label': 'Number of categories to show', 'min_value': 0, 'required': True}), 80: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Category item style', 'required': False}), 81: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending'), ('num_posts', 'By post number acsending'), ('-num_posts', 'By post number descending')], 'label': 'Categories ordering', 'required': False}), 82: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per category', 'required': False}), 83: ('wagtail.blocks.StructBlock', [[('post_list_page', 77), ('categories_style', 78), ('categories_number', 79), ('category_style', 80), ('order_by', 81), ('show_badges', 82), ('badge_style', 73), ('badge_location', 74)]], {}), 84: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 83)]], {}), 85: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Post list style', 'required': False}), 86: ('wagtail.blocks.IntegerBlock', (), {'help_text': 'If zero, all post are shown.', 'label': 'Number of posts to show', 'min_value': 0, 'required': True}), 87: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Post title item style', 'required': False}), 88: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('title', 'By title acsending'), ('-title', 'By title descending'), ('owner__username', 'By author ascending'), ('-owner__username', 'By author descending')], 'label': 'Posts ordering', 'required': False}), 89: ('wagtail.blocks.StructBlock', [[('post_list_page', 65), ('posts_style', 85), ('posts_number', 86), ('post_style', 87), ('text_wrap', 46), ('order_by', 88)]], {}), 90: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 89)]], {}), 91: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows post tags for the posts, which are children of the selected post list page. If left empty, the currently browsed post list page will be used. Otherwise, no categories will be displayed.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 92: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Tags style', 'required': False}), 93: ('wagtail.blocks.IntegerBlock', (), {'default': 10, 'help_text': 'Depends on the selected order. If equals to zero, then all tags are shown.', 'label': 'Number of tags to show', 'min_value': 0, 'required': True}), 94: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending'), ('num_posts', 'By post number acsending'), ('-num_posts', 'By post number descending')], 'label': 'Tags ordering', 'required': False}), 95: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per tag', 'required': False}), 96: ('wagtail.blocks.StructBlock', [[('post_list_page', 91), ('tags_style', 92), ('tags_number', 93), ('order_by', 94), ('show_badges', 95), ('badge_style', 73), ('badge_location', 74)]], {}), 97: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 96)]], {}), 98: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 99: ('waggylabs.blocks.table.BareTableBlock', (), {'help_text': 'Columns and rows can be added via context menu appearing on the right click. Markdown inside cells is supported. Inline LateX equations can be added using $...$ pattern.', 'keep_table_tag': False, 'label': 'Table data', 'required': True}), 100: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table footer', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 101: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-table', 'max_length': 50, 'required': False}), 102: ('wagtail.blocks.StructBlock', [[('caption', 98), ('table', 99), ('footer', 100), ('label', 101)]], {}), 103: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table caption', 'max_height': '150px', 'min_height': '150px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 104: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Table image', 'required': True}), 105: ('wagtail.blocks.StructBlock', [[('caption', 103), ('image', 104), ('footer', 100), ('label', 101)]], {}), 106: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'max_height': '150px', 'min_height': '150px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 107: ('wagtail.blocks.StreamBlock', [[('blockquote', 11), ('carousel', 21), ('citation', 25), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 106)]], {'required': False}), 108: ('wagtail.blocks.StructBlock', [[('heading', 1), ('header_icon', 2), ('header_icon_location', 3), ('is_open', 4), ('body', 107)]], {}), 109: ('wagtail.blocks.ListBlock', (108,), {}), 110: ('wagtail.blocks.StructBlock', [[('style', 0), ('items', 109)]], {}), 111: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('h-100', 'Equal height'), ('', 'Height wraps to content')], 'label': 'Card height style', 'required': False}), 112: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('separate', 'Separate'), ('grouped', 'Grouped')], 'label': 'Card grouping style', 'required': False}), 113: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('vertical', 'Vertical'), ('horizontal', 'Horizontal')], 'label': 'Card orientation', 'required': False}), 114: ('wagtail.blocks.ChoiceBlock', [], {'choices': [(1, '1 column'), (2, '2 columns'), (3, '3 columns')], 'label': 'Number of columns', 'required': False}), 115: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Image', 'required': False}), 116: ('wagtail.blocks.CharBlock', (), {'label': 'Card title', 'required': True}), 117: ('wagtail.blocks.CharBlock', (), {'label': 'Card subtitle', 'required': False}), 118: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 119: ('wagtail.blocks.EmailBlock', (), {'label': 'Email address', 'required': True}), 120: ('wagtail.blocks.CharBlock', (), {'label': 'Text instead of email', 'required': False}), 121: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Email icon', 'required': False}), 122: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Email icon location', 'required': False}), 123: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Email style', 'required': False}), 124: ('wagtail.blocks.StructBlock', [[('email', 119), ('text', 120), ('icon', 121), ('icon_location', 122), ('style', 123)]], {}), 125: ('wagtail.blocks.CharBlock', (), {'label': 'Phone, address, etc.', 'required': True}), 126: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Style', 'required': False}), 127: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Icon', 'required': False}), 128: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Icon location', 'required': False}), 129: ('wagtail.blocks.StructBlock', [[('text', 125), ('style', 126), ('icon', 127), ('icon_location', 128)]], {}), 130: ('wagtail.blocks.StreamBlock', [[('external_link', 52), ('internal_link', 55), ('email', 124), ('info_text', 129)]], {'required': False}), 131: ('wagtail.blocks.StructBlock', [[('image', 115), ('style', 43), ('title', 116), ('subtitle', 117), ('alignment', 9), ('text', 118), ('links', 130)]], {}), 132: ('wagtail.blocks.ListBlock', (131,), {}), 133: ('wagtail.blocks.StructBlock', [[('height_style', 111), ('grouping_style', 112), ('orientation_style', 113), ('columns', 114), ('items', 132)]], {}), 134: ('wagtail.blocks.CharBlock', (), {'label': 'Text on the button', 'required': False}), 135: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Button icon', 'required': False}), 136: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Button icon location', 'required': False}), 137: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('border-primary', 'Border primary'), ('border-secondary', 'Border secondary'), ('border-success', 'Border success'), ('border-danger', 'Border danger'), ('border-warning', 'Border warning'), ('border-info', 'Border info'), ('border-light', 'Border light'), ('border-dark', 'Border dark'), ('border-0', 'No border'), ('border-0 mp-0', 'No border, no margin')], 'label': 'Block style', 'required': False}), 138: ('wagtail.blocks.StreamBlock', [[('blockquote', 11), ('carousel', 21), ('citation', 25), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 106)]], {'requred': True}), 139: ('wagtail.blocks.StructBlock', [[('text', 134), ('icon', 135), ('icon_location', 136), ('button_style', 51), ('style', 137), ('alignment', 9), ('body', 138)]], {}), 140: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('align-self-start', 'Top'), ('align-self-center', 'Center'), ('align-self-end', 'Bottom')], 'label': 'Column content vertical alignment'}), 141: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': ''}), 142: ('wagtail.blocks.StreamBlock', [[('accordion', 110), ('blockquote', 11), ('carousel', 21), ('citation', 25), ('collapse', 139), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 141)]], {'required': False}), 143: ('wagtail.blocks.StructBlock', [[('vertical_align', 140), ('body', 142)]], {}), 144: ('wagtail.blocks.ListBlock', (143,), {'max_num': 3, 'min_num': 1}), 145: ('wagtail.blocks.StructBlock', [[('items', 144)]], {}), 146: ('wagtail.blocks.CharBlock', (), {'label': 'Text on the cut button', 'required': False}), 147: ('wagtail.blocks.StructBlock', [[('text', 146), ('style', 51), ('icon', 135), ('icon_location', 136)]], {}), 148: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show the name of the page creator', 'required': False}), 149: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page creator name is displayed.', 'label': 'Header of the page creator row', 'required': False}), 150: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show avatar', 'required': False}), 151: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('start', 'Before username'), ('end', 'After username')], 'label': 'Avatar location', 'required': False}), 152: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show the email of page creator', 'required': False}), 153: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page creator email is displayed.', 'label': 'Header of the page creator email row', 'required': False}), 154: ('wagtail.blocks.BooleanBlock', (), {'label': 'Date of page publication', 'required': False}), 155: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page publciation date is displayed.', 'label': 'Header of the page publication date', 'required': False}), 156: ('wagtail.blocks.BooleanBlock', (), {'label': 'Date of last page update', 'required': False}), 157: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the last page update is displayed.', 'label': 'Header of last page update', 'required': False}), 158: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('date', 'Only date'), ('datetime', 'Date and time'), ('timesince', 'Time since')], 'label': 'Date style'}), 159: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('G:i', '24-hour format'), ('g:i A', '12-hour format')], 'label': 'Time format'}), 160: ('wagtail.blocks.CharBlock', (), {'label': 'Time since text, e.g. ago', 'required': False}), 161: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Row header style', 'required': False}), 162: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Row style', 'required': False}), 163: ('wagtail.blocks.StructBlock', [[('show_user', 148), ('user_header', 149), ('show_avatar', 150), ('avatar_location', 151), ('show_email', 152), ('email_header', 153), ('show_first_published_at', 154), ('first_published_at_header', 155), ('show_last_published_at', 156), ('last_published_at_header', 157), ('datetime_style', 158), ('time_format', 159), ('timesince_text', 160), ('alignment', 9), ('row_header_style', 161), ('row_data_style', 162)]], {}), 164: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 163)]], {}), 165: ('waggylabs.blocks.markdown.MarkdownBlock', (), {}), 166: ('wagtail.blocks.CharBlock', (), {'label': 'Header', 'required': False}), 167: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Header icon'}), 168: ('wagtail.blocks.BooleanBlock', (), {'default': True, 'label': 'Show post categories', 'required': False}), 169: ('wagtail.blocks.CharBlock', (), {'help_text': 'Text to display before categories list.', 'label': 'Categories header', 'required': False}), 170: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Categories header style', 'required': False}), 171: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Categories link style', 'required': False}), 172: ('wagtail.blocks.BooleanBlock', (), {'default': True, 'label': 'Show post tags', 'required': False}), 173: ('wagtail.blocks.CharBlock', (), {'help_text': 'Text to display before tag list.', 'label': 'Tags header', 'required': False}), 174: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Tags header style', 'required': False}), 175: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Tags link style', 'required': False}), 176: ('wagtail.blocks.BooleanBlock', (), {'default': True, 'help_text': 'Shows previous and next posts for the current post. Previous means either previously (chronologically) published or previous post from the series. Next means either (chronologically) published next or next post from the series.', 'label': 'Show previous and next posts', 'required': False}), 177: ('wagtail.blocks.CharBlock', (), {'label': 'Header: e.g. "Next post"', 'required': False}), 178: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Post link style', 'required': False}), 179: ('wagtail.blocks.StructBlock', [[('style', 137), ('header', 177), ('header_icon', 167), ('header_icon_location', 3), ('alignment', 9), ('post_link_style', 178)]], {'label': 'Previous post'}), 180: ('wagtail.blocks.StructBlock', [[('style', 137), ('header', 177), ('header_icon', 167), ('header_icon_location', 3), ('alignment', 9), ('post_link_style', 178)]], {'label': 'Next post'}), 181: ('wagtail.blocks.StructBlock', [[('header', 166), ('header_style', 42), ('header_icon', 167), ('header_icon_location', 3), ('style', 137), ('alignment', 9), ('show_categories', 168), ('categories_header', 169), ('categories_header_style', 170), ('categories_style', 171), ('show_tags', 172), ('tags_header', 173), ('tags_header_style', 174), ('tags_style', 175), ('show_sibling_posts', 176), ('previous_post', 179), ('next_post', 180)]], {}), 182: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('active', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Current post style'}), 183: ('wagtail.blocks.StructBlock', [[('posts_style', 85), ('post_style', 87), ('text_wrap', 46), ('current_post_style', 182)]], {}), 184: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 183)]], {})}),
+        ),
+        migrations.AlterField(
+            model_name='sitepage',
+            name='body',
+            field=wagtail.fields.StreamField([('accordion', 110), ('blockquote', 11), ('card_grid', 133), ('carousel', 21), ('collapse', 139), ('columns', 145), ('citation', 25), ('cut', 147), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('page_info', 164), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 165)], block_lookup={0: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('collapsible', 'Items collapse'), ('stays_open', 'Items stay open')], 'help_text': 'Collapse items when new items opens or keep them open', 'label': 'Item collapse style'}), 1: ('wagtail.blocks.CharBlock', (), {'form_classname': 'full subtitle', 'label': 'Item heading', 'required': True}), 2: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Header icon', 'required': False}), 3: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Header icon location', 'required': False}), 4: ('wagtail.blocks.BooleanBlock', (), {'label': 'Item is displayed expanded', 'required': False}), 5: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'label': 'Quote text.', 'max_height': '100px', 'min_height': '100px', 'required': True, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,heading,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 6: ('wagtail.blocks.CharBlock', (), {'label': 'Author of the quoted text.', 'required': False}), 7: ('wagtail.blocks.CharBlock', (), {'label': 'Source of the quoted text.', 'required': False}), 8: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-blockquote', 'max_length': 50, 'required': False}), 9: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Left'), ('text-center', 'Center'), ('text-end', 'Right')], 'label': 'Text alignment', 'required': False}), 10: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show quote icon', 'required': False}), 11: ('wagtail.blocks.StructBlock', [[('quote', 5), ('author', 6), ('source', 7), ('label', 8), ('aligntment', 9), ('show_icon', 10)]], {}), 12: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('carousel-fade', 'Fade after interval'), ('carousel', 'Change after interval'), ('false', 'Change on button'), ('false-fade', 'Fade on button')], 'label': 'Carousel switch type'}), 13: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'No controls'), ('buttons', 'Left and right buttons'), ('indicators', 'Items indicators'), ('buttons_indicators', 'Buttons and indicators')], 'label': 'Controls of the carousel', 'required': False}), 14: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Picture for carousel', 'required': True}), 15: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'label': 'Text in front of the picture', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,heading,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 16: ('wagtail.blocks.IntegerBlock', (), {'default': 1000, 'help_text': 'Enter the value in milliseconds to keep the current item during this interval', 'label': 'Interval in milliseconds to keep the item', 'min_value': 0, 'required': False}), 17: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text-light', 'Light'), ('text-dark', 'Dark')], 'label': 'Text color', 'required': False}), 18: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('fs-6', 'Normal'), ('fs-5', 'Bigger'), ('fs-4', 'Big'), ('fs-3', 'Larger'), ('fs-2', 'Large')], 'label': 'Text size', 'required': False}), 19: ('wagtail.blocks.StructBlock', [[('image', 14), ('caption', 15), ('interval', 16), ('text_justify', 9), ('text_color', 17), ('text_size', 18)]], {}), 20: ('wagtail.blocks.ListBlock', (19,), {'min_num': 1}), 21: ('wagtail.blocks.StructBlock', [[('switch', 12), ('controls', 13), ('items', 20)]], {}), 22: ('wagtail.blocks.CharBlock', (), {'label': 'Title of the citation.', 'required': False}), 23: ('wagtail.blocks.URLBlock', (), {'label': 'Citation link', 'required': False}), 24: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-cite', 'help_text': 'Cite literature using LaTeX \\cite{...} syntax in text markdown block.', 'required': False}), 25: ('wagtail.blocks.StructBlock', [[('citation', 22), ('link', 23), ('label', 24)]], {}), 26: ('wagtail.documents.blocks.DocumentChooserBlock', (), {}), 27: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-cite', 'help_text': 'Cite documents using LaTeX \\cite{...} syntax in text markdown block.', 'required': False}), 28: ('wagtail.blocks.StructBlock', [[('document', 26), ('label', 27)]], {}), 29: ('wagtail.embeds.blocks.EmbedBlock', (), {'label': 'URL of embedding'}), 30: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Embed caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 31: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-embed', 'max_length': 50, 'required': False}), 32: ('wagtail.blocks.StructBlock', [[('embed', 29), ('caption', 30), ('label', 31)]], {}), 33: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': 'Write or paste LaTeX style equation (equation, matrix, align, etc. environments are supported). ', 'max_height': '150px', 'min_height': '150px', 'required': True, 'statusbar': 'false', 'stex_combine': 'false', 'toolbar': 'subscript,superscript,equation,matrix,align,multiline,split,gather,alignat,flalign,|,preview,side-by-side,fullscreen'}), 34: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': 'Caption that will be displayed when the equation is shown in the dialog box or in the sidebar.', 'label': 'Equation caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 35: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-equation', 'help_text': 'Label for the current equation to be used in the markdown block for referencing using standard LaTeX \\ㅤref{...} syntax. This label will be added only if no \\ㅤlabel{...} is found within the \\ㅤbegin{...}...\\ㅤend{...} statement.The final reference processing is happening on the published page, which can be checked using "Preview" functionality.', 'max_length': 50, 'required': False}), 36: ('wagtail.blocks.StructBlock', [[('equation', 33), ('caption', 34), ('label', 35)]], {}), 37: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Graphic', 'required': True}), 38: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Figure caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 39: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-figure', 'max_length': 50, 'required': False}), 40: ('wagtail.blocks.StructBlock', [[('image', 37), ('caption', 38), ('label', 39)]], {}), 41: ('wagtail.blocks.CharBlock', (), {'label': 'Header text', 'required': False}), 42: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('h1', 'Header 1'), ('h2', 'Header 2'), ('h3', 'Header 3'), ('h4', 'Header 4'), ('h5', 'Header 5'), ('h6', 'Header 6'), ('display-1', 'Display header 1'), ('display-2', 'Display header 2'), ('display-3', 'Display header 3'), ('display-4', 'Display header 4'), ('display-5', 'Display header 5'), ('display-6', 'Display header 6'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic')], 'label': 'Header style', 'required': False}), 43: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('border-primary', 'Border primary'), ('border-secondary', 'Border secondary'), ('border-success', 'Border success'), ('border-danger', 'Border danger'), ('border-warning', 'Border warning'), ('border-info', 'Border info'), ('border-light', 'Border light'), ('border-dark', 'Border dark'), ('border-0', 'No border'), ('border-0 mp-0', 'No border, no margin')], 'label': 'Card style', 'required': False}), 44: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Link list style', 'required': False}), 45: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark')], 'label': 'Link item style', 'required': False}), 46: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Text wrap'), ('text-nowrap', 'No text wrapping')], 'label': 'Text wrapping', 'required': False}), 47: ('wagtail.blocks.URLBlock', (), {'label': 'Link to external site', 'required': True}), 48: ('wagtail.blocks.CharBlock', (), {'label': 'Text of the link', 'required': False}), 49: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Link icon', 'required': False}), 50: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Link icon location', 'required': False}), 51: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Link style', 'required': False}), 52: ('wagtail.blocks.StructBlock', [[('link', 47), ('text', 48), ('icon', 49), ('icon_location', 50), ('style', 51)]], {}), 53: ('wagtail.blocks.PageChooserBlock', (), {'label': 'Link to a page of this site'}), 54: ('wagtail.blocks.CharBlock', (), {'label': 'Text instead of page title', 'required': False}), 55: ('wagtail.blocks.StructBlock', [[('link', 53), ('text', 54), ('icon', 49), ('icon_location', 50), ('style', 51)]], {}), 56: ('wagtail.blocks.StreamBlock', [[('external_link', 52), ('internal_link', 55)]], {'use_json_field': True}), 57: ('wagtail.blocks.StructBlock', [[('link_list_style', 44), ('link_style', 45), ('text_wrap', 46), ('items', 56)]], {'label': 'List of links'}), 58: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 57)]], {}), 59: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text/x-python', 'Python'), ('text/x-csrc', 'C'), ('text/x-c++src', 'C++'), ('text/x-java', 'Java/Kotlin'), ('text/x-csharp', 'C#'), ('text/x-objectivec', 'Objective C'), ('text/x-scala', 'Scala'), ('application/xml', 'XML'), ('text/html', 'HTML'), ('text/javascript', 'Javascipt'), ('text/json', 'JSON'), ('text/typescript', 'TypeScript'), ('text/x-mathematica', 'Mathematica'), ('text/x-octave', 'Matlab'), ('application/x-powershell', 'Powershell'), ('text/x-sh', 'Bach/Shell'), ('text/x-swift', 'Swift'), ('text/x-sql', 'SQL')], 'help_text': 'Choose the programming language.', 'label': 'Code language'}), 60: ('wagtail.blocks.TextBlock', (), {'help_text': 'Write or paste code.', 'label': 'Code snippet', 'required': True}), 61: ('wagtail.blocks.StructBlock', [[('mode', 59), ('code', 60)]], {'label': None}), 62: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Listing caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 63: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-listing', 'max_length': 50, 'required': False}), 64: ('wagtail.blocks.StructBlock', [[('code', 61), ('caption', 62), ('label', 63)]], {}), 65: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows only posts that are descendant of this page. If left empty, posts selected from all the posts are shown.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 66: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Archive links list style', 'required': False}), 67: ('wagtail.blocks.IntegerBlock', (), {'default': 0, 'help_text': 'If zero, all links are shown.', 'label': 'Number of archive links to show', 'min_value': 0, 'required': True}), 68: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Archive link style', 'required': False}), 69: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('day', 'By day'), ('month', 'By month'), ('year', 'By year')], 'label': 'Period of archive link'}), 70: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('DESC', 'Descneding'), ('ASC', 'Ascending')], 'label': 'Archive links order'}), 71: ('wagtail.blocks.CharBlock', (), {'help_text': 'When number of archive links is larger than number of archive links to show, button to show more links appears with the specified text.', 'label': 'More archives button text', 'required': False}), 72: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per archive link', 'required': False}), 73: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('rounded-pill text-bg-primary', 'Rounded primary'), ('rounded-pill text-bg-secondary', 'Rounded secondary'), ('rounded-pill text-bg-success', 'Rounded success'), ('rounded-pill text-bg-danger', 'Rounded danger'), ('rounded-pill text-bg-warning', 'Rounded warning'), ('rounded-pill text-bg-info', 'Rounded info'), ('rounded-pill text-bg-light', 'Rounded light'), ('rounded-pill text-bg-dark', 'Rounded dark')], 'label': 'Post number style', 'required': False}), 74: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('position-absolute top-0 start-100 translate-middle', 'Top right corner'), ('position-absolute top-0 start-0 translate-middle', 'Top left corner'), ('position-absolute top-100 start-100 translate-middle', 'Bottom right corner'), ('position-absolute top-100 start-0 translate-middle', 'Bottom left corner')], 'label': 'Post number location', 'required': False}), 75: ('wagtail.blocks.StructBlock', [[('post_list_page', 65), ('list_style', 66), ('archives_number', 67), ('list_item_style', 68), ('text_wrap', 46), ('archive_period', 69), ('order_by', 70), ('more_archive_text', 71), ('show_badges', 72), ('badge_style', 73), ('badge_location', 74)]], {}), 76: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 75)]], {}), 77: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows post categories for the posts, which are children of the selected post list page. If left empty, the currently browsed post list page will be used. Otherwise, no categories will be displayed.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 78: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Categories style', 'required': False}), 79: ('wagtail.blocks.IntegerBlock', (), {'default': 10, 'help_text': 'Depends on the selected order. If equals to zero, then all categories are shown.', 'label': 'Number of categories to show', 'min_value': 0, 'required': True}), 80: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Category item style', 'required': False}), 81: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending'), ('num_posts', 'By post number acsending'), ('-num_posts', 'By post number descending')], 'label': 'Categories ordering', 'required': False}), 82: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per category', 'required': False}), 83: ('wagtail.blocks.StructBlock', [[('post_list_page', 77), ('categories_style', 78), ('categories_number', 79), ('category_style', 80), ('order_by', 81), ('show_badges', 82), ('badge_style', 73), ('badge_location', 74)]], {}), 84: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 83)]], {}), 85: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Post list style', 'required': False}), 86: ('wagtail.blocks.IntegerBlock', (), {'help_text': 'If zero, all post are shown.', 'label': 'Number of posts to show', 'min_value': 0, 'required': True}), 87: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Post title item style', 'required': False}), 88: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('title', 'By title acsending'), ('-title', 'By title descending'), ('owner__username', 'By author ascending'), ('-owner__username', 'By author descending')], 'label': 'Posts ordering', 'required': False}), 89: ('wagtail.blocks.StructBlock', [[('post_list_page', 65), ('posts_style', 85), ('posts_number', 86), ('post_style', 87), ('text_wrap', 46), ('order_by', 88)]], {}), 90: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 89)]], {}), 91: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows post tags for the posts, which are children of the selected post list page. If left empty, the currently browsed post list page will be used. Otherwise, no categories will be displayed.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 92: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Tags style', 'required': False}), 93: ('wagtail.blocks.IntegerBlock', (), {'default': 10, 'help_text': 'Depends on the selected order. If equals to zero, then all tags are shown.', 'label': 'Number of tags to show', 'min_value': 0, 'required': True}), 94: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('slug', 'By slug acsending'), ('-slug', 'By slug descending'), ('num_posts', 'By post number acsending'), ('-num_posts', 'By post number descending')], 'label': 'Tags ordering', 'required': False}), 95: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per tag', 'required': False}), 96: ('wagtail.blocks.StructBlock', [[('post_list_page', 91), ('tags_style', 92), ('tags_number', 93), ('order_by', 94), ('show_badges', 95), ('badge_style', 73), ('badge_location', 74)]], {}), 97: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 96)]], {}), 98: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table caption', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 99: ('waggylabs.blocks.table.BareTableBlock', (), {'help_text': 'Columns and rows can be added via context menu appearing on the right click. Markdown inside cells is supported. Inline LateX equations can be added using $...$ pattern.', 'keep_table_tag': False, 'label': 'Table data', 'required': True}), 100: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table footer', 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 101: ('waggylabs.blocks.label.LabelBlock', (), {'form_classname': 'waggylabs-label-table', 'max_length': 50, 'required': False}), 102: ('wagtail.blocks.StructBlock', [[('caption', 98), ('table', 99), ('footer', 100), ('label', 101)]], {}), 103: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'label': 'Table caption', 'max_height': '150px', 'min_height': '150px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 104: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Table image', 'required': True}), 105: ('wagtail.blocks.StructBlock', [[('caption', 103), ('image', 104), ('footer', 100), ('label', 101)]], {}), 106: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': '', 'max_height': '150px', 'min_height': '150px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 107: ('wagtail.blocks.StreamBlock', [[('blockquote', 11), ('carousel', 21), ('citation', 25), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 106)]], {'required': False}), 108: ('wagtail.blocks.StructBlock', [[('heading', 1), ('header_icon', 2), ('header_icon_location', 3), ('is_open', 4), ('body', 107)]], {}), 109: ('wagtail.blocks.ListBlock', (108,), {}), 110: ('wagtail.blocks.StructBlock', [[('style', 0), ('items', 109)]], {}), 111: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('h-100', 'Equal height'), ('', 'Height wraps to content')], 'label': 'Card height style', 'required': False}), 112: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('separate', 'Separate'), ('grouped', 'Grouped')], 'label': 'Card grouping style', 'required': False}), 113: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('vertical', 'Vertical'), ('horizontal', 'Horizontal')], 'label': 'Card orientation', 'required': False}), 114: ('wagtail.blocks.ChoiceBlock', [], {'choices': [(1, '1 column'), (2, '2 columns'), (3, '3 columns')], 'label': 'Number of columns', 'required': False}), 115: ('wagtail.images.blocks.ImageChooserBlock', (), {'label': 'Image', 'required': False}), 116: ('wagtail.blocks.CharBlock', (), {'label': 'Card title', 'required': True}), 117: ('wagtail.blocks.CharBlock', (), {'label': 'Card subtitle', 'required': False}), 118: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': None, 'max_height': '100px', 'min_height': '100px', 'required': False, 'statusbar': 'false', 'stex_combine': 'true', 'toolbar': 'bold,italic,strikethrough,|,unordered-list,ordered-list,link,|,code,subscript,superscript,|,preview,side-by-side,fullscreen,guide'}), 119: ('wagtail.blocks.EmailBlock', (), {'label': 'Email address', 'required': True}), 120: ('wagtail.blocks.CharBlock', (), {'label': 'Text instead of email', 'required': False}), 121: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Email icon', 'required': False}), 122: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Email icon location', 'required': False}), 123: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Email style', 'required': False}), 124: ('wagtail.blocks.StructBlock', [[('email', 119), ('text', 120), ('icon', 121), ('icon_location', 122), ('style', 123)]], {}), 125: ('wagtail.blocks.CharBlock', (), {'label': 'Phone, address, etc.', 'required': True}), 126: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Style', 'required': False}), 127: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Icon', 'required': False}), 128: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Icon location', 'required': False}), 129: ('wagtail.blocks.StructBlock', [[('text', 125), ('style', 126), ('icon', 127), ('icon_location', 128)]], {}), 130: ('wagtail.blocks.StreamBlock', [[('external_link', 52), ('internal_link', 55), ('email', 124), ('info_text', 129)]], {'required': False}), 131: ('wagtail.blocks.StructBlock', [[('image', 115), ('style', 43), ('title', 116), ('subtitle', 117), ('alignment', 9), ('text', 118), ('links', 130)]], {}), 132: ('wagtail.blocks.ListBlock', (131,), {}), 133: ('wagtail.blocks.StructBlock', [[('height_style', 111), ('grouping_style', 112), ('orientation_style', 113), ('columns', 114), ('items', 132)]], {}), 134: ('wagtail.blocks.CharBlock', (), {'label': 'Text on the button', 'required': False}), 135: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Button icon', 'required': False}), 136: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Button icon location', 'required': False}), 137: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('border-primary', 'Border primary'), ('border-secondary', 'Border secondary'), ('border-success', 'Border success'), ('border-danger', 'Border danger'), ('border-warning', 'Border warning'), ('border-info', 'Border info'), ('border-light', 'Border light'), ('border-dark', 'Border dark'), ('border-0', 'No border'), ('border-0 mp-0', 'No border, no margin')], 'label': 'Block style', 'required': False}), 138: ('wagtail.blocks.StreamBlock', [[('blockquote', 11), ('carousel', 21), ('citation', 25), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 106)]], {'requred': True}), 139: ('wagtail.blocks.StructBlock', [[('text', 134), ('icon', 135), ('icon_location', 136), ('button_style', 51), ('style', 137), ('alignment', 9), ('body', 138)]], {}), 140: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('align-self-start', 'Top'), ('align-self-center', 'Center'), ('align-self-end', 'Bottom')], 'label': 'Column content vertical alignment'}), 141: ('waggylabs.blocks.markdown.MarkdownBlock', (), {'help_text': ''}), 142: ('wagtail.blocks.StreamBlock', [[('accordion', 110), ('blockquote', 11), ('carousel', 21), ('citation', 25), ('collapse', 139), ('document', 28), ('embed', 32), ('equation', 36), ('figure', 40), ('link_list', 58), ('listing', 64), ('post_archive', 76), ('post_category', 84), ('post_highlights', 90), ('post_tag_list', 97), ('table', 102), ('table_figure', 105), ('text', 141)]], {'required': False}), 143: ('wagtail.blocks.StructBlock', [[('vertical_align', 140), ('body', 142)]], {}), 144: ('wagtail.blocks.ListBlock', (143,), {'max_num': 3, 'min_num': 1}), 145: ('wagtail.blocks.StructBlock', [[('items', 144)]], {}), 146: ('wagtail.blocks.CharBlock', (), {'label': 'Text on the cut button', 'required': False}), 147: ('wagtail.blocks.StructBlock', [[('text', 146), ('style', 51), ('icon', 135), ('icon_location', 136)]], {}), 148: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show the name of the page creator', 'required': False}), 149: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page creator name is displayed.', 'label': 'Header of the page creator row', 'required': False}), 150: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show avatar', 'required': False}), 151: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('start', 'Before username'), ('end', 'After username')], 'label': 'Avatar location', 'required': False}), 152: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show the email of page creator', 'required': False}), 153: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page creator email is displayed.', 'label': 'Header of the page creator email row', 'required': False}), 154: ('wagtail.blocks.BooleanBlock', (), {'label': 'Date of page publication', 'required': False}), 155: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the page publciation date is displayed.', 'label': 'Header of the page publication date', 'required': False}), 156: ('wagtail.blocks.BooleanBlock', (), {'label': 'Date of last page update', 'required': False}), 157: ('wagtail.blocks.CharBlock', (), {'help_text': 'Displays the header of the row in which the last page update is displayed.', 'label': 'Header of last page update', 'required': False}), 158: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('date', 'Only date'), ('datetime', 'Date and time'), ('timesince', 'Time since')], 'label': 'Date style'}), 159: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('G:i', '24-hour format'), ('g:i A', '12-hour format')], 'label': 'Time format'}), 160: ('wagtail.blocks.CharBlock', (), {'label': 'Time since text, e.g. ago', 'required': False}), 161: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Row header style', 'required': False}), 162: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('fw-bold', 'Bold'), ('fw-bolder', 'Bolder'), ('fw-semibold', 'Semibold'), ('fw-normal', 'Normal'), ('fw-light', 'Light'), ('fw-lighter', 'Lighter'), ('fst-italic', 'Italic'), ('fw-bold fst-italic', 'Bold italic'), ('fw-bolder fst-italic', 'Bolder italic'), ('fw-semibold fst-italic', 'Semibold italic'), ('fw-light fst-italic', 'Light italic'), ('fw-lighter fst-italic', 'Lighter italic'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Row style', 'required': False}), 163: ('wagtail.blocks.StructBlock', [[('show_user', 148), ('user_header', 149), ('show_avatar', 150), ('avatar_location', 151), ('show_email', 152), ('email_header', 153), ('show_first_published_at', 154), ('first_published_at_header', 155), ('show_last_published_at', 156), ('last_published_at_header', 157), ('datetime_style', 158), ('time_format', 159), ('timesince_text', 160), ('alignment', 9), ('row_header_style', 161), ('row_data_style', 162)]], {}), 164: ('wagtail.blocks.StructBlock', [[('header', 41), ('header_icon', 2), ('header_icon_location', 3), ('header_style', 42), ('block_style', 43), ('block_alignment', 9), ('item', 163)]], {}), 165: ('waggylabs.blocks.markdown.MarkdownBlock', (), {})}),
+        ),
+        migrations.AlterField(
+            model_name='waggylabssettings',
+            name='footer',
+            field=wagtail.fields.StreamField([('footer_menu', 7), ('link_list', 21), ('post_archive', 33), ('post_highlights', 39)], blank=True, block_lookup={0: ('wagtail.blocks.CharBlock', (), {'label': 'Header text', 'required': False}), 1: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Header icon', 'required': False}), 2: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Header icon location', 'required': False}), 3: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'No offset'), ('offset-lg-1', 'Narrow'), ('offset-lg-2', 'Medium'), ('offset-lg-3', 'Wide')], 'label': 'Offset', 'required': False}), 4: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('col-lg-2', 'Narrow'), ('col-lg-3', 'Medium'), ('col-lg-4', 'Wide')], 'label': 'Width'}), 5: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Text wrap'), ('text-nowrap', 'No text wrapping')], 'label': 'Text wrapping', 'required': False}), 6: ('wagtail.blocks.StructBlock', [[('text_wrap', 5)]], {}), 7: ('wagtail.blocks.StructBlock', [[('header', 0), ('header_icon', 1), ('header_icon_location', 2), ('col_offset', 3), ('col_width', 4), ('item', 6)]], {}), 8: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Link list style', 'required': False}), 9: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark')], 'label': 'Link item style', 'required': False}), 10: ('wagtail.blocks.URLBlock', (), {'label': 'Link to external site', 'required': True}), 11: ('wagtail.blocks.CharBlock', (), {'label': 'Text of the link', 'required': False}), 12: ('waggylabs.blocks.icon.IconBlock', (), {'label': 'Link icon', 'required': False}), 13: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Before text'), ('end', 'After text')], 'label': 'Link icon location', 'required': False}), 14: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info')], 'label': 'Link style', 'required': False}), 15: ('wagtail.blocks.StructBlock', [[('link', 10), ('text', 11), ('icon', 12), ('icon_location', 13), ('style', 14)]], {}), 16: ('wagtail.blocks.PageChooserBlock', (), {'label': 'Link to a page of this site'}), 17: ('wagtail.blocks.CharBlock', (), {'label': 'Text instead of page title', 'required': False}), 18: ('wagtail.blocks.StructBlock', [[('link', 16), ('text', 17), ('icon', 12), ('icon_location', 13), ('style', 14)]], {}), 19: ('wagtail.blocks.StreamBlock', [[('external_link', 15), ('internal_link', 18)]], {'use_json_field': True}), 20: ('wagtail.blocks.StructBlock', [[('link_list_style', 8), ('link_style', 9), ('text_wrap', 5), ('items', 19)]], {'label': 'List of links'}), 21: ('wagtail.blocks.StructBlock', [[('header', 0), ('header_icon', 1), ('header_icon_location', 2), ('col_offset', 3), ('col_width', 4), ('item', 20)]], {}), 22: ('wagtail.blocks.PageChooserBlock', (), {'help_text': 'Shows only posts that are descendant of this page. If left empty, posts selected from all the posts are shown.', 'label': 'Root post list page', 'page_type': ['waggylabs.PostListPage'], 'required': False}), 23: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Archive links list style', 'required': False}), 24: ('wagtail.blocks.IntegerBlock', (), {'default': 0, 'help_text': 'If zero, all links are shown.', 'label': 'Number of archive links to show', 'min_value': 0, 'required': True}), 25: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Archive link style', 'required': False}), 26: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('day', 'By day'), ('month', 'By month'), ('year', 'By year')], 'label': 'Period of archive link'}), 27: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('DESC', 'Descneding'), ('ASC', 'Ascending')], 'label': 'Archive links order'}), 28: ('wagtail.blocks.CharBlock', (), {'help_text': 'When number of archive links is larger than number of archive links to show, button to show more links appears with the specified text.', 'label': 'More archives button text', 'required': False}), 29: ('wagtail.blocks.BooleanBlock', (), {'label': 'Show number of posts per archive link', 'required': False}), 30: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('text-bg-primary', 'Primary'), ('text-bg-secondary', 'Secondary'), ('text-bg-success', 'Success'), ('text-bg-danger', 'Danger'), ('text-bg-warning', 'Warning'), ('text-bg-info', 'Info'), ('text-bg-light', 'Light'), ('text-bg-dark', 'Dark'), ('rounded-pill text-bg-primary', 'Rounded primary'), ('rounded-pill text-bg-secondary', 'Rounded secondary'), ('rounded-pill text-bg-success', 'Rounded success'), ('rounded-pill text-bg-danger', 'Rounded danger'), ('rounded-pill text-bg-warning', 'Rounded warning'), ('rounded-pill text-bg-info', 'Rounded info'), ('rounded-pill text-bg-light', 'Rounded light'), ('rounded-pill text-bg-dark', 'Rounded dark')], 'label': 'Post number style', 'required': False}), 31: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default'), ('position-absolute top-0 start-100 translate-middle', 'Top right corner'), ('position-absolute top-0 start-0 translate-middle', 'Top left corner'), ('position-absolute top-100 start-100 translate-middle', 'Bottom right corner'), ('position-absolute top-100 start-0 translate-middle', 'Bottom left corner')], 'label': 'Post number location', 'required': False}), 32: ('wagtail.blocks.StructBlock', [[('post_list_page', 22), ('list_style', 23), ('archives_number', 24), ('list_item_style', 25), ('text_wrap', 5), ('archive_period', 26), ('order_by', 27), ('more_archive_text', 28), ('show_badges', 29), ('badge_style', 30), ('badge_location', 31)]], {}), 33: ('wagtail.blocks.StructBlock', [[('header', 0), ('header_icon', 1), ('header_icon_location', 2), ('col_offset', 3), ('col_width', 4), ('item', 32)]], {}), 34: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list'), ('list-unstyled', 'Unstyled list'), ('list-numbered', 'Numbered list'), ('list-group', 'List group'), ('list-group list-group-flush', 'List group, no outer borders'), ('list-group list-group-numbered', 'Numbered list group'), ('list-group list-group-numbered list-group-flush', 'Numbered list group, no outer borders')], 'label': 'Post list style', 'required': False}), 35: ('wagtail.blocks.IntegerBlock', (), {'help_text': 'If zero, all post are shown.', 'label': 'Number of posts to show', 'min_value': 0, 'required': True}), 36: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('', 'Default list item'), ('list-group-item list-group-item-action', 'List group item'), ('list-group-item list-group-item-action list-group-item-primary', 'List group item primary'), ('list-group-item list-group-item-action list-group-item-secondary', 'List group item secondary'), ('list-group-item list-group-item-action list-group-item-success', 'List group item success'), ('list-group-item list-group-item-action list-group-item-danger', 'List group item danger'), ('list-group-item list-group-item-action list-group-item-warning', 'List group item warning'), ('list-group-item list-group-item-action list-group-item-info', 'List group item info'), ('list-group-item list-group-item-action list-group-item-light', 'List group item light'), ('list-group-item list-group-item-action list-group-item-dark', 'List group item dark'), ('btn btn-primary', 'Button primary'), ('btn btn-secondary', 'Button secondary'), ('btn btn-success', 'Button success'), ('btn btn-danger', 'Button danger'), ('btn btn-warning', 'Button warning'), ('btn btn-info', 'Button info'), ('btn btn-outline-primary', 'Button outline primary'), ('btn btn-outline-secondary', 'Button outline secondary'), ('btn btn-outline-success', 'Button outline success'), ('btn btn-outline-danger', 'Button outline danger'), ('btn btn-outline-warning', 'Button outline warning'), ('btn btn-outline-info', 'Button outline info'), ('card-link', 'Card link'), ('nav-link', 'Navigation bar link'), ('nav-link active', 'Navigation bar active link'), ('link-primary', 'Primary link'), ('link-secondary', 'Secondary link'), ('link-success', 'Success link'), ('link-danger', 'Danger link'), ('link-warning', 'Warning link'), ('link-info', 'Info link'), ('link-light', 'Light link'), ('link-dark', 'Dark link'), ('nav-link link-primary', 'Primary link, no underline'), ('nav-link link-secondary', 'Secondary link, no underline'), ('nav-link link-success', 'Success link, no underline'), ('nav-link link-danger', 'Danger link, no underline'), ('nav-link link-warning', 'Warning link, no underline'), ('nav-link link-info', 'Info link, no underline'), ('nav-link link-light', 'Light link, no underline'), ('nav-link link-dark', 'Dark link, no underline')], 'label': 'Post title item style', 'required': False}), 37: ('wagtail.blocks.ChoiceBlock', [], {'choices': [('created_at', 'Older first'), ('-created_at', 'Newer first'), ('title', 'By title acsending'), ('-title', 'By title descending'), ('owner__username', 'By author ascending'), ('-owner__username', 'By author descending')], 'label': 'Posts ordering', 'required': False}), 38: ('wagtail.blocks.StructBlock', [[('post_list_page', 22), ('posts_style', 34), ('posts_number', 35), ('post_style', 36), ('text_wrap', 5), ('order_by', 37)]], {}), 39: ('wagtail.blocks.StructBlock', [[('header', 0), ('header_icon', 1), ('header_icon_location', 2), ('col_offset', 3), ('col_width', 4), ('item', 38)]], {})}),
+        ),
+        migrations.CreateModel(
+            name='PostArchiveCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('num_posts', models.PositiveIntegerField(default=0, verbose_name='Number of posts')),
+                ('period', models.CharField(choices=[('day', 'Day'), ('month', 'Month'), ('year', 'Year')], max_length=5, verbose_name='Period')),
+                ('date', models.DateField(verbose_name='Date')),
+                ('post_list_page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='waggylabs.postlistpage', verbose_name='Post list page')),
+            ],
+            options={
+                'verbose_name': 'Post archive count',
+                'verbose_name_plural': 'Post archive counts',
+                'unique_together': {('post_list_page', 'period', 'date')},
+            },
+        ),
+    ]
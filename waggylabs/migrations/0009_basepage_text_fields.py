@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('waggylabs', '0008_postarchivecount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='basepage',
+            name='excerpt',
+            field=models.TextField(blank=True, editable=False, verbose_name='Excerpt'),
+        ),
+        migrations.AddField(
+            model_name='basepage',
+            name='plain_text',
+            field=models.TextField(blank=True, editable=False, verbose_name='Plain text of the body'),
+        ),
+        migrations.AddField(
+            model_name='basepage',
+            name='reading_time',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Reading time in minutes'),
+        ),
+        migrations.AddField(
+            model_name='basepage',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Number of words'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('waggylabs', '0009_basepage_text_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.CharField(max_length=255, verbose_name='Object id')),
+                ('enqueued_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Enqueued at')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype', verbose_name='Content type')),
+            ],
+            options={
+                'verbose_name': 'Search index task',
+                'verbose_name_plural': 'Search index tasks',
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id'), name='waggylabs_unique_search_index_task')],
+            },
+        ),
+    ]
@@ -1,7 +1,10 @@
 from .base_page import BasePage
 from .post_category import PostCategory, PostPagePostCategory
+from .post_counts import PostArchiveCount, PostCategoryCount, PostTagCount
 from .post_list_page import PostListPage
+from .post_neighbours import PostPageNeighbours
 from .post_page import PostPage
 from .post_tags import PostPageTag
+from .search_index import SearchIndexTask
 from .site_page import SitePage
 from .site_settings import WaggyLabsSettings
\ No newline at end of file
@@ -1,5 +1,10 @@
+import math
+
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
 from django.db import models
+from django.utils.functional import cached_property
+from django.utils.text import Truncator
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.admin import widgets
@@ -9,16 +14,25 @@ from wagtail.fields import StreamField
 from wagtail.search import index
 
 from hitcount.models import HitCountMixin, HitCount
-from hitcount.views import HitCountMixin as ViewHitCountMixin
 
 from wagtailmetadata.models import MetadataPageMixin
 
 # from waggylabs.blocks.body import BaseBodyBlock
 from waggylabs.blocks.sidebar import SidebarBlock
+from waggylabs.cache import (
+    cache_page_response, get_cached_page, page_cache_applies
+)
+from waggylabs.hits import count_hit
 from waggylabs.panels import ReadOnlyPanel
+from waggylabs.search import SEARCH_INDEX_QUEUED
+from waggylabs.utils import markdown_to_text
 from waggylabs.widgets import DisabledOptionSelect
 
 
+WORDS_PER_MINUTE = getattr(settings, 'WAGGYLABS_WORDS_PER_MINUTE', 200)
+EXCERPT_LENGTH = getattr(settings, 'WAGGYLABS_EXCERPT_LENGTH', 200)
+
+
 class BasePage(MetadataPageMixin, Page, HitCountMixin):
     """BasePage class for the all the specific pages of WaggyLabs.
     Specific pages are SitePage, PostPage, etc. BasePage instances
@@ -124,6 +138,29 @@ class BasePage(MetadataPageMixin, Page, HitCountMixin):
         use_json_field=True
     )
     
+    # Text fields extracted from the body when the page is published,
+    # see update_text_fields
+    plain_text = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name=_('Plain text of the body'),
+    )
+    word_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_('Number of words'),
+    )
+    reading_time = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_('Reading time in minutes'),
+    )
+    excerpt = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name=_('Excerpt'),
+    )
+    
 
     # Search index configuration
 
@@ -131,6 +168,18 @@ class BasePage(MetadataPageMixin, Page, HitCountMixin):
         index.SearchField('title', partial_match=True, boost=2),
         index.AutocompleteField('title', boost=2),
     ]
+    # text extracted from the body for the search index, instead of
+    # indexing the raw body with Markdown, LaTeX and block settings
+    body_search_fields = [
+        index.SearchField('search_text', boost=2),
+        index.AutocompleteField('search_text'),
+        index.SearchField('search_captions', boost=1.5),
+        index.SearchField('search_tables'),
+        index.SearchField('search_code', boost=0.5),
+    ]
+    # with the queued search index updates, saved pages are indexed by
+    # the search_index_worker management command (see SearchIndexTask)
+    search_auto_update = not SEARCH_INDEX_QUEUED
 
     # Widgets for panels
   
@@ -163,6 +212,8 @@ class BasePage(MetadataPageMixin, Page, HitCountMixin):
                 FieldPanel('first_published_at', heading='First published at', read_only=True),
                 FieldPanel('last_published_at', heading='Last published at', read_only=True),
                 ReadOnlyPanel('hit_counts', heading='Number of views'),
+                ReadOnlyPanel('word_count', heading='Number of words'),
+                ReadOnlyPanel('reading_time', heading='Reading time in minutes'),
             ],
             heading=_('General information'),
         ),
@@ -206,13 +257,77 @@ class BasePage(MetadataPageMixin, Page, HitCountMixin):
         else:
             return 0
 
+    @cached_property
+    def body_search_texts(self):
+        """Clean text of the body for the search index split into
+        main text, captions, table cells and code, see
+        BaseBodyBlock.search_texts. The body is walked once for all
+        the search fields and text fields, the texts are extracted
+        again when the page is saved."""
+        body = getattr(self, 'body', None)
+        if body is None:
+            return {'text': [], 'captions': [], 'tables': [], 'code': []}
+        return body.stream_block.search_texts(body)
+
+    def search_text(self):
+        return ' '.join(filter(None, self.body_search_texts['text']))
+
+    def search_captions(self):
+        return ' '.join(filter(None, self.body_search_texts['captions']))
+
+    def search_tables(self):
+        return ' '.join(filter(None, self.body_search_texts['tables']))
+
+    def search_code(self):
+        return ' '.join(filter(None, self.body_search_texts['code']))
+
+    def get_meta_description(self):
+        return self.search_description or self.excerpt
+
+    def compute_text_fields(self):
+        """Returns dictionary with the plain text of the body, number
+        of words, reading time and excerpt. The text is extracted from
+        the body without rendering it (see body_search_texts), so it has
+        no math, references and labels, and starts with the main text."""
+        texts = self.body_search_texts
+        plain_text = ' '.join(filter(None, [
+            markdown_to_text(' '.join(filter(None, texts['text'] + texts['captions'] + texts['tables']))),
+            ' '.join(' '.join(filter(None, texts['code'])).split()),
+        ]))
+        word_count = len(plain_text.split())
+        return {
+            'plain_text': plain_text,
+            'word_count': word_count,
+            'reading_time': math.ceil(word_count / WORDS_PER_MINUTE),
+            'excerpt': Truncator(plain_text).chars(EXCERPT_LENGTH, truncate='...'),
+        }
+
+    def update_text_fields(self):
+        """Saves the text fields extracted from the body, so that
+        search results, excerpts and meta description do not need to
+        render the body. Called when the page is published
+        (see waggylabs.signals) and by the extract_page_text
+        management command."""
+        fields = self.compute_text_fields()
+        BasePage.objects.filter(pk=self.pk).update(**fields)
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def save(self, *args, **kwargs):
+        self.__dict__.pop('body_search_texts', None)
+        return super().save(*args, **kwargs)
+
     def serve(self, request, *args, **kwargs):
-        hit_count = HitCount.objects.get_for_object(self)
-        # below is needed to avoid session to be None especially on the
-        # first request
-        # otherwise the session_key is None, which is wrong for hitcount
-        # object and NOT_NULL constrain for session_key is violated
-        if not request.session.exists(request.session.session_key):
-            request.session.create()
-        ViewHitCountMixin.hit_count(request, hit_count)
-        return super().serve(request, *args, **kwargs)
\ No newline at end of file
+        count_hit(request, self)
+        
+        if not page_cache_applies(request):
+            return super().serve(request, *args, **kwargs)
+        # the rendered page is cached for anonymous visitors
+        response = get_cached_page(self, request)
+        if response is None:
+            response = cache_page_response(
+                self,
+                request,
+                super().serve(request, *args, **kwargs)
+            )
+        return response
\ No newline at end of file
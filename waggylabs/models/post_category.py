@@ -6,9 +6,8 @@ from modelcluster.fields import ParentalKey
 
 from wagtail.admin.panels import FieldPanel
 
-from wagtailmarkdown.utils import render_markdown
-
 from waggylabs.fields import MarkdownField
+from waggylabs.utils.markdown import render_markdown
 
 
 class PostCategory(models.Model):
@@ -0,0 +1,146 @@
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import Count
+from django.db.models.functions import Trunc
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from taggit.models import Tag
+
+from waggylabs.models.post_category import PostPagePostCategory
+from waggylabs.models.post_tags import PostPageTag
+
+
+class PostCountBase(models.Model):
+    """Base class for the numbers of the live posts under the post list
+    page grouped by some key, e.g. by category or tag. The counts are
+    updated when posts are published, unpublished or moved
+    (see waggylabs.signals) and can be rebuilt with the rebuild_post_indexes
+    management command."""
+
+    post_list_page = models.ForeignKey(
+        'waggylabs.PostListPage',
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_('Post list page'),
+    )
+    num_posts = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Number of posts'),
+    )
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def compute_counts(cls, posts):
+        """Returns list of unsaved instances (without post_list_page)
+        with the counts for the queryset of posts."""
+        raise NotImplementedError
+
+    @classmethod
+    def update_for(cls, post_list_page):
+        """Recomputes the counts for the post list page."""
+        post_page_model = apps.get_model('waggylabs', 'PostPage')
+        counts = cls.compute_counts(post_page_model.objects.descendant_of(post_list_page).live())
+        for count in counts:
+            count.post_list_page = post_list_page
+        with transaction.atomic():
+            cls.objects.filter(post_list_page=post_list_page).delete()
+            cls.objects.bulk_create(counts)
+
+    @classmethod
+    def rebuild(cls):
+        """Recomputes the counts for all post list pages."""
+        post_list_page_model = apps.get_model('waggylabs', 'PostListPage')
+        for post_list_page in post_list_page_model.objects.all():
+            cls.update_for(post_list_page)
+
+
+class PostCategoryCount(PostCountBase):
+    """Number of live posts in the category under the post list page."""
+
+    post_category = models.ForeignKey(
+        'waggylabs.PostCategory',
+        on_delete=models.CASCADE,
+        related_name='counts',
+        verbose_name=_('Category'),
+    )
+
+    class Meta:
+        verbose_name = _('Post category count')
+        verbose_name_plural = _('Post category counts')
+        unique_together = ('post_list_page', 'post_category')
+
+    @classmethod
+    def compute_counts(cls, posts):
+        return [
+            cls(post_category_id=row['post_category'], num_posts=row['num_posts'])
+            for row in PostPagePostCategory.objects.filter(post_page__in=posts)
+                .values('post_category').annotate(num_posts=Count('post_page', distinct=True))
+        ]
+
+
+class PostTagCount(PostCountBase):
+    """Number of live posts with the tag under the post list page."""
+
+    tag = models.ForeignKey(
+        Tag,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_('Tag'),
+    )
+
+    class Meta:
+        verbose_name = _('Post tag count')
+        verbose_name_plural = _('Post tag counts')
+        unique_together = ('post_list_page', 'tag')
+
+    @classmethod
+    def compute_counts(cls, posts):
+        return [
+            cls(tag_id=row['tag'], num_posts=row['num_posts'])
+            for row in PostPageTag.objects.filter(content_object__in=posts)
+                .values('tag').annotate(num_posts=Count('content_object', distinct=True))
+        ]
+
+
+class PostArchiveCount(PostCountBase):
+    """Number of live posts under the post list page published during
+    the day, month or year starting at the date (in the site time zone)."""
+
+    PERIODS = ('day', 'month', 'year')
+
+    period = models.CharField(
+        max_length=5,
+        choices=[
+            ('day', _('Day')),
+            ('month', _('Month')),
+            ('year', _('Year')),
+        ],
+        verbose_name=_('Period'),
+    )
+    date = models.DateField(
+        verbose_name=_('Date'),
+    )
+
+    class Meta:
+        verbose_name = _('Post archive count')
+        verbose_name_plural = _('Post archive counts')
+        unique_together = ('post_list_page', 'period', 'date')
+
+    @classmethod
+    def compute_counts(cls, posts):
+        # dates are truncated in the site time zone rather than the active
+        # one, which is the editor's time zone when posts are published
+        site_timezone = timezone.get_default_timezone()
+        counts = []
+        for period in cls.PERIODS:
+            counts = counts + [
+                cls(period=period, date=row['date'], num_posts=row['num_posts'])
+                for row in posts.order_by()
+                    .annotate(date=Trunc('first_published_at', period,
+                                         output_field=models.DateField(), tzinfo=site_timezone))
+                    .values('date').annotate(num_posts=Count('pk'))
+            ]
+        return counts
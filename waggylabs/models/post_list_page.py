@@ -1,24 +1,26 @@
-from datetime import date, datetime
-
 from django.contrib.auth.models import User
+from django.db.models import Count
 from django.http import Http404
 from django.utils.dateformat import DateFormat
 from django.utils.formats import date_format
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.admin.panels import FieldPanel
-from wagtail.contrib.routable_page.models import RoutablePageMixin, re_path
+from wagtail.contrib.routable_page.models import RoutablePageMixin, path, re_path
 from wagtail.fields import StreamField
-from wagtail.search import index
+from wagtail.search.utils import parse_query_string
 
 from wagtailmenus.models import MenuPageMixin
 from wagtailmenus.panels import menupage_panel
 
 from waggylabs.models.base_page import BasePage
-from waggylabs.models.post_category import PostCategory
+from waggylabs.models.post_category import PostCategory, PostPagePostCategory
 from waggylabs.blocks.post_list_body import PostListBodyBlock
 from waggylabs.models.post_page import PostPage
-from waggylabs.models.post_tags import TagProxy
+from waggylabs.models.post_tags import PostPageTag, TagProxy
+from waggylabs.search import SEARCH_FACET_RESULTS, log_query
+from waggylabs.utils import get_date_range
 
 
 class PostListPage(RoutablePageMixin, BasePage, MenuPageMixin):
@@ -44,10 +46,7 @@ class PostListPage(RoutablePageMixin, BasePage, MenuPageMixin):
     
     # Search index configuration
 
-    search_fields = BasePage.search_fields + [
-        index.SearchField('body', partial_match=True, boost=2),
-        index.AutocompleteField('body', boost=2),
-    ]
+    search_fields = BasePage.search_fields + BasePage.body_search_fields
     
     # Editor panels configuration
     
@@ -78,6 +77,8 @@ class PostListPage(RoutablePageMixin, BasePage, MenuPageMixin):
         self.posts = PostPage.objects.live().filter(pin_in_list=False)
         self.filter_header = None
         self.filter_term = None
+        self.search_query = None
+        self.search_facets = None
         
     def get_context(self, request, *args, **kwargs):
         context = super().get_context(request, *args, **kwargs)
@@ -86,14 +87,41 @@ class PostListPage(RoutablePageMixin, BasePage, MenuPageMixin):
             'posts': self.posts,
             'filter_header': self.filter_header,
             'filter_term': self.filter_term,
+            'search_query': self.search_query,
+            'search_facets': self.search_facets,
         })
         return context
+    
+    @path('')
+    def index_route(self, request, *args, **kwargs):
+        """Serves the post list page itself through BasePage.serve
+        in order to count hits and use the page cache as for other routes."""
+        return self.serve(request, *args, **kwargs)
         
     @re_path(r'^(\d{4})/(\d{2})/(\d{2})/(.+)/$')
     @re_path(r'^(\d{4})/(jan?|feb?|mar?|apr?|may?|jun?|jul?|aug?|sep?|oct?|nov?|dec?)/(\d{2})/(.+)/$')
     def post_by_slug(self, request, year, month, date, slug, *args, **kwargs):
-        """This path serves rendering of PostPage with the slug in the url."""
-        post = PostPage.objects.live().filter(slug=slug).first()
+        """This path serves rendering of PostPage with the slug in the url.
+        The post is looked up among the posts of this page by the slug
+        and the date of the first publication (in UTC as in
+        PostPage.get_url_parts). If the date does not match, e.g. for old
+        urls, the post with the slug is served, provided that the slug is
+        unique among the posts of this page."""
+        posts = PostPage.objects.live().descendant_of(self).filter(slug=slug)
+        post = None
+        try:
+            (start, end) = get_date_range(year, month, date)
+        except ValueError:
+            pass
+        else:
+            post = posts.filter(
+                first_published_at__gte=start,
+                first_published_at__lt=end,
+            ).first()
+        if post is None:
+            candidates = list(posts[:2])
+            if len(candidates) == 1:
+                post = candidates[0]
         if post:
             return post.serve(request, *args, **kwargs)
         raise Http404
@@ -104,30 +132,27 @@ class PostListPage(RoutablePageMixin, BasePage, MenuPageMixin):
     @re_path(r'^(\d{4})/(\d{2})/(\d{2})/$')
     @re_path(r'^(\d{4})/(jan?|feb?|mar?|apr?|may?|jun?|jul?|aug?|sep?|oct?|nov?|dec?)/(\d{2})/$')
     def posts_by_date(self, request, year, month=None, day=None, *args, **kwargs):
-        """The PostPages are listed by date. No pinned posts after date select."""
+        """The PostPages are listed by date. No pinned posts after date select.
+        The posts are filtered by the half-open range of the first publication
+        date in the site time zone, so that the index on first_published_at
+        is used."""
+        try:
+            (start, end) = get_date_range(year, month, day, timezone.get_current_timezone())
+        except ValueError:
+            # the year, or month or date is wrong, return 404
+            raise Http404(_('Wrong date.'))
         self.pinned_posts = None
-        self.posts = PostPage.objects.live().filter(first_published_at__year=year)
+        self.posts = PostPage.objects.live().filter(
+            first_published_at__gte=start,
+            first_published_at__lt=end,
+        ).order_by('-first_published_at')
         self.filter_header = _('Filtered by appeared at:')
-        self.filter_term = year
-        if month:
-            try:
-                month = datetime.strptime(month, '%b').month
-            except ValueError:
-                month = int(month)
-                
-            self.posts = self.posts.filter(first_published_at__month=month)
-            try:
-                df = DateFormat(date(int(year), int(month), 1))
-            except ValueError:
-                # the year, or month or date is wrong, return 404
-                raise Http404(_('Wrong date.'))
-            self.filter_term = df.format('F Y')
-
         if day:
-            self.posts = self.posts.filter(first_published_at__day=day)
-            self.filter_term = date_format(date(int(year), int(month), int(day)))
-
-        self.posts = self.posts.order_by('-first_published_at')
+            self.filter_term = date_format(start.date())
+        elif month:
+            self.filter_term = DateFormat(start.date()).format('F Y')
+        else:
+            self.filter_term = year
         return self.serve(request, *args, **kwargs)
     
     @re_path(r'^category/(?P<category>[-\w]+)/$')
@@ -164,16 +189,86 @@ class PostListPage(RoutablePageMixin, BasePage, MenuPageMixin):
 
         return self.serve(request, *args, **kwargs)
 
-    # @re_path(r'^search/$')
-    # def post_search(self, request, *args, **kwargs):
-    #     """Handles the search queries for post pages."""
-    #     search_query = request.GET.get('q', None)
-    #     if search_query:
-    #         self.posts = PostPage.objects.live().search(search_query)
-    #         self.search_header = _('Search results for:')
-    #         self.search_term = search_query
-
-    #         # Log the query so Wagtail can suggest promoted results
-    #         Query.get(search_query).add_hit()
-        
-    #     return self.serve(request, *args, **kwargs)
\ No newline at end of file
+    @re_path(r'^search/$')
+    def post_search(self, request, *args, **kwargs):
+        """Searches the posts of this page. The posts can be filtered by
+        category, tag and date (year, month and day) given in the query
+        string. Filters are applied to the searched queryset, so the search
+        results are paginated by the search backend in relevance order.
+        The numbers of the found posts per category and tag are computed
+        by two aggregate queries over the found posts, which are at most
+        SEARCH_FACET_RESULTS most relevant results for the query."""
+        query_string = request.GET.get('query', '')
+        filters, query = parse_query_string(query_string, operator='or')
+
+        posts = PostPage.objects.live().descendant_of(self)
+        # related fields cannot be filtered in the search backend,
+        # so categories and tags are filtered by primary keys
+        category_slug = request.GET.get('category')
+        if category_slug:
+            posts = posts.filter(pk__in=PostPagePostCategory.objects.filter(
+                post_category__slug=category_slug).values('post_page'))
+        tag_slug = request.GET.get('tag')
+        if tag_slug:
+            posts = posts.filter(pk__in=PostPageTag.objects.filter(
+                tag__slug=tag_slug).values('content_object'))
+        if request.GET.get('year'):
+            try:
+                (start, end) = get_date_range(
+                    request.GET['year'],
+                    request.GET.get('month') or None,
+                    request.GET.get('day') or None,
+                    timezone.get_current_timezone(),
+                )
+            except ValueError:
+                raise Http404(_('Wrong date.'))
+            posts = posts.filter(first_published_at__gte=start, first_published_at__lt=end)
+
+        if query:
+            found = [post.pk for post in posts.only('id').search(query)[:SEARCH_FACET_RESULTS]]
+            posts = posts.search(query)
+            # Log the query so Wagtail can suggest promoted results
+            log_query(query_string)
+        else:
+            found = posts.order_by().values('pk')
+            posts = posts.order_by('-first_published_at')
+
+        self.search_facets = {
+            'categories': [
+                dict(category, url=self.facet_url(request, 'category', category['slug']),
+                     active=category['slug'] == category_slug)
+                for category in PostCategory.objects.filter(post_pages__post_page__in=found)
+                    .values('slug', 'name')
+                    .annotate(num_posts=Count('post_pages__post_page', distinct=True))
+                    .order_by('-num_posts', 'slug')
+            ],
+            'tags': [
+                dict(tag, url=self.facet_url(request, 'tag', tag['slug']),
+                     active=tag['slug'] == tag_slug)
+                for tag in TagProxy.objects.filter(waggylabs_postpagetag_items__content_object__in=found)
+                    .values('slug', 'name')
+                    .annotate(num_posts=Count('waggylabs_postpagetag_items__content_object', distinct=True))
+                    .order_by('-num_posts', 'slug')
+            ],
+        }
+        self.pinned_posts = None
+        self.posts = posts
+        self.search_query = query_string
+        self.filter_header = _('Search results for:')
+        self.filter_term = query_string
+
+        return self.serve(request, *args, **kwargs)
+
+    @staticmethod
+    def facet_url(request, name, value):
+        """Returns query string of the current search request with the
+        facet (category or tag) set to the value, or removed if the facet
+        already has the value. Pagination is reset."""
+        query = request.GET.copy()
+        for key in ('page', 'cursor'):
+            query.pop(key, None)
+        if query.get(name) == value:
+            query.pop(name)
+        else:
+            query[name] = value
+        return '?' + query.urlencode()
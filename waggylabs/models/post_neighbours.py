@@ -0,0 +1,81 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class PostPageNeighbours(models.Model):
+    """Precomputed previous and next posts of a live post, which are
+    shown in the post navigation. Previous and next posts are either the
+    neighbours in the post series or chronologically published neighbours
+    among all the live posts. Rows are updated when posts are published,
+    unpublished or moved (see waggylabs.signals) and can be rebuilt with
+    the rebuild_post_indexes management command."""
+
+    post = models.OneToOneField(
+        'waggylabs.PostPage',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='neighbours',
+        verbose_name=_('Post'),
+    )
+    previous_post = models.ForeignKey(
+        'waggylabs.PostPage',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=_('Previous post'),
+    )
+    next_post = models.ForeignKey(
+        'waggylabs.PostPage',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=_('Next post'),
+    )
+
+    class Meta:
+        verbose_name = _('Post neighbours')
+        verbose_name_plural = _('Post neighbours')
+
+    @classmethod
+    def update_for(cls, posts):
+        """Recomputes neighbours of the given posts. Rows of the posts
+        that are not live are deleted."""
+        for post in posts:
+            if post.live:
+                cls.objects.update_or_create(post=post, defaults=post.compute_sibling_posts())
+            else:
+                cls.objects.filter(post=post).delete()
+
+    @classmethod
+    def affected_by(cls, post):
+        """Returns primary keys of the post and of all the posts, whose
+        neighbours may change after the post has been published,
+        unpublished, moved or deleted: posts that refer to the post,
+        its chronological neighbours and the posts of its series."""
+        post_page_model = post.__class__
+        affected = {post.pk}
+        affected.update(post_page_model.objects.filter(
+            models.Q(neighbours__previous_post=post) | models.Q(neighbours__next_post=post)
+        ).values_list('pk', flat=True))
+        affected.update(other.pk for other in post.compute_chronological_siblings().values()
+                        if other is not None)
+        affected.update(other.pk for other in post.post_series())
+        return affected
+
+    @classmethod
+    def update_around(cls, post):
+        """Recomputes neighbours of the post and of all the posts affected
+        by its change, see affected_by."""
+        cls.update_for(post.__class__.objects.filter(pk__in=cls.affected_by(post)))
+
+    @classmethod
+    def rebuild(cls):
+        """Recomputes neighbours of all the live posts."""
+        post_page_model = cls._meta.get_field('post').related_model
+        cls.objects.all().delete()
+        cls.objects.bulk_create([
+            cls(post=post, **post.compute_sibling_posts())
+            for post in post_page_model.objects.live()
+        ])
@@ -1,5 +1,9 @@
+import threading
+
+from django.apps import apps
 from django.conf import settings
-from django.db import models
+from django.db import DEFAULT_DB_ALIAS, models
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from modelcluster.fields import ParentalManyToManyField
@@ -10,11 +14,89 @@ from wagtail.fields import StreamField
 from wagtail.search import index
 
 from waggylabs.blocks.post_body import PostBodyBlock
+from waggylabs.cache import cache_is_shared, get_content_generation
 from waggylabs.models.base_page import BasePage
 
 
 WAGGYLABS_BASE_URL = getattr(settings, 'WAGGYLABS_BASE_URL', '')
 
+# Map of tree path -> database row of PostListPage built once per process
+# for the current content generation, see get_post_list_page. The map is
+# used only if the cache backend is shared between processes, otherwise
+# other processes do not see the changes of the content generation
+POST_LIST_PAGE_MAP = cache_is_shared()
+_post_list_pages = {'generation': None, 'fields': [], 'rows': {}}
+_post_list_pages_lock = threading.Lock()
+
+
+def _build_post_list_pages(generation):
+    """Loads the rows of all PostListPages into the map with a single
+    query. Stream fields (body and sidebar) are not loaded, they are
+    not needed to find the page and build URLs of the posts."""
+    post_list_page_model = apps.get_model('waggylabs', 'PostListPage')
+    fields = [
+        field.attname for field in post_list_page_model._meta.concrete_fields
+        if not isinstance(field, StreamField)
+    ]
+    path_index = fields.index('path')
+    rows = {row[path_index]: row for row in post_list_page_model.objects.values_list(*fields)}
+    with _post_list_pages_lock:
+        _post_list_pages['generation'] = generation
+        _post_list_pages['fields'] = fields
+        _post_list_pages['rows'] = rows
+    return (fields, rows)
+
+
+def get_post_list_page(path):
+    """Returns PostListPage that is the closest ancestor of the page with
+    the given tree path or None. The map of the PostListPages is rebuilt when
+    the content generation changes (pages are published, unpublished or
+    moved) or when the path has no PostListPage ancestor in the map, e.g.
+    the PostListPage has just been created. A new instance is created from
+    the cached row, so that pages are not shared between requests, its
+    stream fields are loaded from the database when accessed. Without
+    the shared cache backend the page is queried every time."""
+    if not path:
+        return None
+    if not POST_LIST_PAGE_MAP:
+        return _query_post_list_page(path)
+    generation = get_content_generation()
+    with _post_list_pages_lock:
+        (cached, fields, rows) = (
+            _post_list_pages['generation'] == generation,
+            _post_list_pages['fields'],
+            _post_list_pages['rows'],
+        )
+    if cached:
+        page = _find_post_list_page(fields, rows, path)
+        if page is not None:
+            return page
+    return _find_post_list_page(*_build_post_list_pages(generation), path)
+
+
+def _query_post_list_page(path):
+    """Returns the closest PostListPage ancestor of the page with
+    the given tree path loaded with a single query without stream
+    fields or None."""
+    steplen = BasePage.steplen
+    post_list_page_model = apps.get_model('waggylabs', 'PostListPage')
+    return post_list_page_model.objects.filter(
+        path__in=[path[:depth * steplen] for depth in range(1, len(path) // steplen)]
+    ).defer_streamfields().order_by('-depth').first()
+
+
+def _find_post_list_page(fields, rows, path):
+    """Finds the PostListPage with the longest path that is the prefix
+    of the given path."""
+    steplen = BasePage.steplen
+    for depth in range(len(path) // steplen - 1, 0, -1):
+        row = rows.get(path[:depth * steplen])
+        if row is not None:
+            post_list_page_model = apps.get_model('waggylabs', 'PostListPage')
+            return post_list_page_model.from_db(DEFAULT_DB_ALIAS, fields, row)
+    return None
+
+
 class PostPage(BasePage):
     """Post page keeps posts content, such as blog posts or
     news posts. It has series functionality to combine posts
@@ -52,9 +134,7 @@ class PostPage(BasePage):
     
     # Search index configuration
 
-    search_fields = BasePage.search_fields + [
-        index.SearchField('body', partial_match=True, boost=2),
-        index.AutocompleteField('body', boost=2),
+    search_fields = BasePage.search_fields + BasePage.body_search_fields + [
         index.FilterField('pin_in_list'),
         index.FilterField('categories'),
         index.FilterField('tags'),
@@ -96,16 +176,13 @@ class PostPage(BasePage):
             return False
         return super().can_exist_under(parent)
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.post_list_page = None
-        ancestors = self.get_ancestors(inclusive=False)
-        for parent in ancestors:
-            # comparing as string is necessary to avoid circular imports
-            if parent.specific_class.__name__ == 'PostListPage':
-                self.post_list_page = parent.specific
-                break
-        
+    @cached_property
+    def post_list_page(self):
+        """PostListPage of the post, i.e. the closest PostListPage ancestor.
+        Looked up in the per process map (with the shared cache backend),
+        so that instantiating posts in lists, search results, etc. does not
+        cost queries."""
+        return get_post_list_page(self.path)
     
     def can_move_to(self, parent):
         """Same as PostPage.can_creat_at(parent) classmethod."""
@@ -153,33 +230,43 @@ class PostPage(BasePage):
         return []
     
     def sibling_posts(self):
-        """Returns previous and next posts for the current post.
+        """Returns previous and next posts for the current post from
+        the precomputed PostPageNeighbours. If the neighbours have not been
+        computed yet, they are computed and stored for the live post."""
+        neighbours_model = apps.get_model('waggylabs', 'PostPageNeighbours')
+        neighbours = neighbours_model.objects.select_related(
+            'previous_post', 'next_post'
+        ).filter(post=self).first()
+        if neighbours is not None:
+            return {
+                'previous_post': neighbours.previous_post,
+                'next_post': neighbours.next_post,
+            }
+        siblings = self.compute_sibling_posts()
+        if self.live and self.pk is not None:
+            neighbours_model.objects.update_or_create(post=self, defaults=siblings)
+        return siblings
+    
+    def compute_sibling_posts(self):
+        """Computes previous and next posts for the current post.
         Previous means either previously (chronologically) published or 
         previous post from the series. Next means either (chronologically) 
         published next or next post from the series."""
-        series = self.post_series()
-        if series:
-            series_len = series.count()
-            for idx, post in enumerate(series):
-                if self.pk == post.pk:
-                    if idx == 0:
-                        return {
-                            'previous_post': PostPage.objects.live().filter(
-                                    first_published_at__lt=self.first_published_at
-                                ).order_by('-first_published_at').first(),
-                            'next_post': series[idx + 1],
-                        }
-                    if idx == series_len - 1:
-                        return {
-                            'previous_post': series[idx - 1],
-                            'next_post': PostPage.objects.live().filter(
-                                    first_published_at__gt=self.first_published_at
-                                ).order_by('first_published_at').first(),
-                        }
-                    return {
-                        'previous_post': series[idx - 1],
-                        'next_post': series[idx + 1],
-                    }
+        series = list(self.post_series())
+        for idx, post in enumerate(series):
+            if self.pk == post.pk:
+                siblings = self.compute_chronological_siblings()
+                if idx > 0:
+                    siblings['previous_post'] = series[idx - 1].specific
+                if idx < len(series) - 1:
+                    siblings['next_post'] = series[idx + 1].specific
+                return siblings
+        return self.compute_chronological_siblings()
+    
+    def compute_chronological_siblings(self):
+        """Returns previously and next published live posts."""
+        if self.first_published_at is None:
+            return {'previous_post': None, 'next_post': None}
         return {
             'previous_post': PostPage.objects.live().filter(
                     first_published_at__lt=self.first_published_at
@@ -0,0 +1,108 @@
+import logging
+
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from wagtail.search.backends import get_search_backends_with_name
+from wagtail.search.index import class_is_indexed
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchIndexTask(models.Model):
+    """Pending update of the search index entry of the saved object.
+    Tasks are added instead of updating the search index on every save
+    when WAGGYLABS_SEARCH_INDEX_QUEUED=True (see waggylabs.signals) and
+    processed in batches by the search_index_worker management command.
+    There is at most one task per object, so repeated saves of the object
+    are indexed only once."""
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_('Content type'),
+    )
+    object_id = models.CharField(
+        max_length=255,
+        verbose_name=_('Object id'),
+    )
+    enqueued_at = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+        verbose_name=_('Enqueued at'),
+    )
+
+    class Meta:
+        verbose_name = _('Search index task')
+        verbose_name_plural = _('Search index tasks')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content_type', 'object_id'],
+                name='waggylabs_unique_search_index_task',
+            ),
+        ]
+
+    @classmethod
+    def enqueue(cls, objects):
+        """Adds tasks to update the search index entries of the objects.
+        Objects that already have pending tasks are skipped."""
+        cls.objects.bulk_create(
+            [cls(content_type=ContentType.objects.get_for_model(obj), object_id=str(obj.pk))
+             for obj in objects],
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def claim(cls, batch_size, enqueued_before):
+        """Removes up to batch_size oldest tasks enqueued not later than
+        the given time and returns them as (content type id, object id)
+        pairs. Rows locked by other workers are skipped where the database
+        supports it."""
+        with transaction.atomic():
+            tasks = list(
+                cls.objects.select_for_update(skip_locked=True)
+                .filter(enqueued_at__lte=enqueued_before)
+                .order_by('enqueued_at')
+                .values_list('pk', 'content_type_id', 'object_id')[:batch_size]
+            )
+            cls.objects.filter(pk__in=[pk for (pk, __, __) in tasks]).delete()
+        return [(content_type_id, object_id) for (__, content_type_id, object_id) in tasks]
+
+    @classmethod
+    def process(cls, batch_size=100):
+        """Updates the search index entries of the objects with pending
+        tasks in batches, one bulk update of each search backend per model.
+        Objects of the failed updates are enqueued again and processed
+        on the next call. Returns the number of the processed tasks."""
+        started = timezone.now()
+        processed = 0
+        tasks = cls.claim(batch_size, started)
+        while tasks:
+            object_ids = defaultdict(list)
+            for (content_type_id, object_id) in tasks:
+                object_ids[content_type_id].append(object_id)
+            for (content_type_id, ids) in object_ids.items():
+                model = ContentType.objects.get_for_id(content_type_id).model_class()
+                if model is None or not class_is_indexed(model):
+                    continue
+                # objects that are not indexed anymore are removed
+                # from the index when deleted (see waggylabs.signals)
+                objects = list(model.get_indexed_objects().filter(pk__in=ids))
+                if not objects:
+                    continue
+                try:
+                    for (backend_name, backend) in get_search_backends_with_name(with_auto_update=True):
+                        backend.add_bulk(model, objects)
+                except Exception:
+                    logger.exception('Exception raised while updating search index of %d %s objects',
+                                     len(objects), model._meta.label)
+                    cls.enqueue(objects)
+            processed = processed + len(tasks)
+            tasks = cls.claim(batch_size, started)
+        return processed
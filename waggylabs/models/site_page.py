@@ -2,7 +2,6 @@ from django.utils.translation import gettext_lazy as _
 
 from wagtail.admin.panels import FieldPanel
 from wagtail.fields import StreamField
-from wagtail.search import index
 
 from wagtailmenus.models import MenuPageMixin
 from wagtailmenus.panels import menupage_panel
@@ -33,10 +32,7 @@ class SitePage(BasePage, MenuPageMixin):
 
     # Search index configuration
 
-    search_fields = BasePage.search_fields + [
-        index.SearchField('body', partial_match=True, boost=2),
-        index.AutocompleteField('body', boost=2),
-    ]
+    search_fields = BasePage.search_fields + BasePage.body_search_fields
 
     # Editor panels configuration
     
@@ -0,0 +1,240 @@
+import hashlib
+
+from collections import Counter
+
+from django.apps import apps
+from django.conf import settings
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import transaction
+from django.utils import timezone
+
+from wagtail.contrib.search_promotions.models import Query, QueryDailyHits
+from wagtail.models import Page, Site
+from wagtail.search.backends import get_search_backend
+from wagtail.search.query import SearchQuery
+from wagtail.search.utils import normalise_query_string
+
+from waggylabs.cache import CacheBuffer, cache_is_shared, get_cache, get_content_generation
+from waggylabs.utils import get_specific_pages
+
+
+# Search results are cached until the published content changes,
+# by default only if the cache backend is shared between processes
+SEARCH_CACHE = getattr(settings, 'WAGGYLABS_SEARCH_CACHE', cache_is_shared())
+SEARCH_CACHE_TIMEOUT = getattr(settings, 'WAGGYLABS_SEARCH_CACHE_TIMEOUT', 60 * 60)
+
+# If True, hits of the search queries are appended to the buffer in cache
+# and saved to the database in batches by the flush_search_queries
+# management command, only if the cache backend is shared between
+# processes like for page hits (see waggylabs.hits)
+SEARCH_QUERIES_BUFFERED = getattr(settings, 'WAGGYLABS_SEARCH_QUERIES_BUFFERED', False) and cache_is_shared()
+
+QUERY_BUFFER = CacheBuffer('search-queries')
+
+# If True, search index entries of the saved pages are updated by
+# the search_index_worker management command instead of on every save
+SEARCH_INDEX_QUEUED = getattr(settings, 'WAGGYLABS_SEARCH_INDEX_QUEUED', False)
+
+# Numbers of posts per category and tag of the post search are counted
+# over at most this number of the most relevant results
+SEARCH_FACET_RESULTS = getattr(settings, 'WAGGYLABS_SEARCH_FACET_RESULTS', 1000)
+
+# Number of pages returned by the autocomplete view and maximum length
+# of the query (prefix) which results are cached
+AUTOCOMPLETE_RESULTS = getattr(settings, 'WAGGYLABS_AUTOCOMPLETE_RESULTS', 10)
+AUTOCOMPLETE_CACHE_PREFIX_LENGTH = getattr(settings, 'WAGGYLABS_AUTOCOMPLETE_CACHE_PREFIX_LENGTH', 3)
+
+
+def normalize_query(query):
+    """Returns string representation of the parsed search query
+    (wagtail.search.query.SearchQuery), which is the same for the
+    queries that differ only in letter case and whitespace."""
+    if isinstance(query, SearchQuery):
+        return '{}({})'.format(
+            query.__class__.__name__,
+            ','.join(
+                '{}={}'.format(name, normalize_query(value))
+                for (name, value) in sorted(vars(query).items())
+            ),
+        )
+    if isinstance(query, (list, tuple)):
+        return '[' + ','.join(normalize_query(value) for value in query) + ']'
+    if isinstance(query, str):
+        return repr(' '.join(query.lower().split()))
+    return repr(query)
+
+
+def search_cache_key(query, site, page_number, per_page):
+    """Creates cache key for the page of search results. The key includes
+    the normalized query, site, page number, number of results per page
+    and content generation."""
+    query = hashlib.md5(normalize_query(query).encode('utf-8')).hexdigest()
+    return 'waggylabs:search:{}:{}:{}:{}:{}'.format(
+        site.pk if site else 0,
+        get_content_generation(),
+        per_page,
+        page_number,
+        query,
+    )
+
+
+def search_pages(query, page_number, per_page):
+    """Searches live pages and returns dictionary with the total number
+    of results, the number of the returned page of results and the list
+    of (primary key, content type id, score) of the results on the page.
+    Invalid page numbers give the first page, too large page numbers
+    give the last page."""
+    if query:
+        search_results = Page.objects.live().search(query).annotate_score('search_score')
+    else:
+        search_results = Page.objects.none()
+    # search results are sliced lazily, so that the search
+    # backend returns only the results of the current page
+    paginator = Paginator(search_results, per_page)
+    try:
+        page = paginator.page(page_number)
+    except PageNotAnInteger:
+        page = paginator.page(1)
+    except EmptyPage:
+        page = paginator.page(paginator.num_pages)
+    return {
+        'count': paginator.count,
+        'number': page.number,
+        'results': [
+            (result.pk, result.content_type_id, getattr(result, 'search_score', None))
+            for result in page.object_list
+        ],
+    }
+
+
+def get_search_results_page(query, site, page_number, per_page):
+    """Returns Django paginator page of the specific live pages matching
+    the parsed search query. Primary keys and scores of the results are
+    cached, so repeated queries need only one query per page type to
+    fetch the pages. Each page has search_score attribute."""
+    try:
+        page_number = int(page_number)
+    except (TypeError, ValueError):
+        page_number = 1
+    key = search_cache_key(query, site, page_number, per_page)
+    cached = get_cache().get(key) if SEARCH_CACHE else None
+    if cached is None:
+        cached = search_pages(query, page_number, per_page)
+        if SEARCH_CACHE:
+            get_cache().set(key, cached, timeout=SEARCH_CACHE_TIMEOUT)
+
+    # only the number of results is needed for the paginator
+    paginator = Paginator(range(cached['count']), per_page)
+    page = paginator.page(cached['number'])
+    scores = {pk: score for (pk, __, score) in cached['results']}
+    page.object_list = get_specific_pages(
+        [(pk, content_type_id) for (pk, content_type_id, __) in cached['results']]
+    )
+    for result in page.object_list:
+        result.search_score = scores[result.pk]
+    return page
+
+
+
+def autocomplete_pages(query_string, request, limit=AUTOCOMPLETE_RESULTS):
+    """Returns list of dictionaries with the titles and urls of the live
+    pages which autocomplete fields (e.g. title) start with the query
+    string. Specific fields of the pages are not fetched, since only
+    the title and url are needed. Results for short prefixes, which are
+    typed most often, are cached until the published content changes."""
+    query_string = ' '.join(query_string.lower().split())
+    if not query_string:
+        return []
+    key = None
+    if SEARCH_CACHE and len(query_string) <= AUTOCOMPLETE_CACHE_PREFIX_LENGTH:
+        site = Site.find_for_request(request)
+        key = 'waggylabs:autocomplete:{}:{}:{}:{}'.format(
+            site.pk if site else 0,
+            get_content_generation(),
+            limit,
+            hashlib.md5(query_string.encode('utf-8')).hexdigest(),
+        )
+        results = get_cache().get(key)
+        if results is not None:
+            return results
+    results = [
+        {
+            'title': page.title,
+            'url': page.get_url(request),
+        }
+        for page in Page.objects.live().specific(defer=True).autocomplete(query_string)[:limit]
+    ]
+    if key is not None:
+        get_cache().set(key, results, timeout=SEARCH_CACHE_TIMEOUT)
+    return results
+
+
+def log_query(query_string):
+    """Counts the hit of the search query, so Wagtail can suggest
+    promoted results, either immediately or by adding it to the
+    query buffer."""
+    if SEARCH_QUERIES_BUFFERED:
+        QUERY_BUFFER.append((normalise_query_string(query_string), timezone.now().date()))
+    else:
+        Query.get(query_string).add_hit()
+
+
+def flush_queries(batch_size=1000):
+    """Saves buffered hits of the search queries to the database in
+    batches. Hits are removed from the buffer only after they are saved,
+    so the batch that fails to be saved stays in the buffer. Returns
+    the number of the saved hits."""
+    saved = 0
+    while True:
+        with QUERY_BUFFER.batch(batch_size) as hits:
+            if not hits:
+                return saved
+            saved = saved + save_query_hits(hits)
+
+
+def save_query_hits(hits):
+    """Saves the list of (normalized query string, date) hits with bulk
+    queries: missing queries and daily hits are created, existing daily
+    hits are increased by the number of hits. Returns the number of
+    the saved hits."""
+    num_hits = Counter(hits)
+    query_strings = {query_string for (query_string, __) in num_hits}
+    with transaction.atomic():
+        Query.objects.bulk_create(
+            [Query(query_string=query_string) for query_string in query_strings],
+            ignore_conflicts=True,
+        )
+        queries = dict(Query.objects.filter(query_string__in=query_strings)
+                       .values_list('query_string', 'pk'))
+        num_hits = {
+            (queries[query_string], date): count
+            for ((query_string, date), count) in num_hits.items()
+        }
+        daily_hits = QueryDailyHits.objects.select_for_update().filter(
+            query__in=queries.values(),
+            date__in={date for (__, date) in num_hits},
+        )
+        existing = []
+        for daily in daily_hits:
+            if (daily.query_id, daily.date) in num_hits:
+                daily.hits = daily.hits + num_hits.pop((daily.query_id, daily.date))
+                existing.append(daily)
+        QueryDailyHits.objects.bulk_update(existing, ['hits'])
+        QueryDailyHits.objects.bulk_create([
+            QueryDailyHits(query_id=query_id, date=date, hits=count)
+            for ((query_id, date), count) in num_hits.items()
+        ])
+    return len(hits)
+
+
+def reindex_objects(backend_name, model_label, pks):
+    """Adds the indexed objects of the model with the given primary keys
+    to the search index of the backend. Used by the rebuild_search_index
+    management command in the worker processes, so arguments are plain
+    values. Returns the number of the indexed objects."""
+    model = apps.get_model(model_label)
+    backend = get_search_backend(backend_name)
+    objects = list(model.get_indexed_objects().filter(pk__in=pks))
+    if objects:
+        backend.add_bulk(model, objects)
+    return len(objects)
@@ -0,0 +1,124 @@
+from django.core.signals import request_finished, request_started
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from wagtail.search import index
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from waggylabs.cache import bump_content_generation, request_content_generation
+from waggylabs.models import (
+    BasePage, PostArchiveCount, PostCategoryCount, PostListPage, PostPage, PostPageNeighbours,
+    PostTagCount, SearchIndexTask, WaggyLabsSettings
+)
+from waggylabs.search import SEARCH_INDEX_QUEUED
+
+
+@receiver(request_started)
+def request_started_handler(sender, **kwargs):
+    """Content generation is read from the cache once per request."""
+    request_content_generation(True)
+
+
+@receiver(request_finished)
+def request_finished_handler(sender, **kwargs):
+    request_content_generation(False)
+
+
+@receiver(page_published)
+def page_text_changed(sender, instance, **kwargs):
+    """Extracts plain text, number of words, reading time and excerpt
+    of the published page body."""
+    instance = instance.specific
+    if isinstance(instance, BasePage):
+        instance.update_text_fields()
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def page_tree_changed(sender, instance, **kwargs):
+    """Published content changed, so the cached content
+    (e.g. rendered pages) is not valid anymore."""
+    bump_content_generation()
+
+
+@receiver(post_save, sender=WaggyLabsSettings)
+def site_settings_changed(sender, instance, **kwargs):
+    """Site settings define menus, footer, etc. of all the pages."""
+    bump_content_generation()
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def post_tree_changed(sender, instance, signal, **kwargs):
+    """Updates previous and next posts around the changed post and
+    the post counts of its post list page."""
+    instance = instance.specific
+    if isinstance(instance, PostPage):
+        if signal is page_unpublished and \
+            PostPage.objects.filter(pk=instance.pk, live=True).exists():
+            # the post is unpublished without saving before it is deleted,
+            # neighbours and counts are updated by post_deleted
+            return
+        PostPageNeighbours.update_around(instance)
+        if signal is post_page_move:
+            # the post may have moved between post list pages
+            PostCategoryCount.rebuild()
+            PostTagCount.rebuild()
+            PostArchiveCount.rebuild()
+        elif instance.post_list_page is not None:
+            PostCategoryCount.update_for(instance.post_list_page)
+            PostTagCount.update_for(instance.post_list_page)
+            PostArchiveCount.update_for(instance.post_list_page)
+
+
+@receiver(pre_delete, sender=PostPage)
+def post_deleting(sender, instance, **kwargs):
+    """Wagtail sends page_unpublished for the deleted live post before its
+    row is deleted, so post_tree_changed still finds the post live. Posts
+    around the post and its post list page are found while it still exists
+    and updated after it is deleted (see post_deleted)."""
+    instance._affected_neighbours = PostPageNeighbours.affected_by(instance)
+    instance._post_list_page = instance.post_list_page
+
+
+@receiver(post_delete, sender=PostPage)
+def post_deleted(sender, instance, **kwargs):
+    """Recomputes neighbours of the posts around the deleted post and
+    the post counts of its post list page. Counts are recomputed when
+    the deletion is committed, since the post list page may be deleted
+    together with the post."""
+    affected = getattr(instance, '_affected_neighbours', set()) - {instance.pk}
+    if affected:
+        PostPageNeighbours.update_for(PostPage.objects.filter(pk__in=affected))
+    post_list_page = getattr(instance, '_post_list_page', None)
+    if post_list_page is not None:
+        transaction.on_commit(lambda: update_post_counts(post_list_page.pk))
+
+
+def update_post_counts(post_list_page_pk):
+    """Recomputes the post counts of the post list page if it exists."""
+    post_list_page = PostListPage.objects.filter(pk=post_list_page_pk).first()
+    if post_list_page is not None:
+        PostCategoryCount.update_for(post_list_page)
+        PostTagCount.update_for(post_list_page)
+        PostArchiveCount.update_for(post_list_page)
+
+
+@receiver(post_save)
+def search_index_queued(sender, instance, raw=False, **kwargs):
+    """Adds the task to update the search index entry of the saved page
+    (WAGGYLABS_SEARCH_INDEX_QUEUED=True). Repeated saves before the task
+    is processed add no more tasks."""
+    if SEARCH_INDEX_QUEUED and not raw and isinstance(instance, BasePage):
+        SearchIndexTask.enqueue([instance])
+
+
+@receiver(post_delete)
+def search_index_deleted(sender, instance, **kwargs):
+    """Removes the deleted page from the search index immediately, since
+    automatic search index updates are disabled for queued updates."""
+    if SEARCH_INDEX_QUEUED and isinstance(instance, BasePage):
+        index.remove_object(instance)
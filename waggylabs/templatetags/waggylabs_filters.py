@@ -5,9 +5,8 @@ from django.template.defaultfilters import stringfilter
 
 from urllib.parse import urlparse
 
-from wagtailmarkdown.utils import render_markdown
-
 from waggylabs.utils import pk_to_markdown
+from waggylabs.utils.markdown import render_markdown
 from waggylabs.widgets import BOOTSTRAP_ICONS
 
 
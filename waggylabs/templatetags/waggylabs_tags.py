@@ -1,11 +1,10 @@
-import re
 import uuid
 
-from bs4 import BeautifulSoup
 from django import template
-from django.utils.html import escape
 from django.utils.safestring import mark_safe
 
+from waggylabs.utils.highlight import highlight, highlight_snippets
+
 register = template.Library()
 
 @register.simple_tag(takes_context=False)
@@ -85,48 +84,15 @@ def sidebar_class(site_settings, page):
 def search_results_title(page, tokens):
     """Highlights parts of the title that match with tokens
     to highlight search results."""
-    title = escape(page.title)
-    for token in tokens:
-        title = re.sub(
-            token,
-            lambda m: '<mark>' + m.group(0) + '</mark>',
-            title,
-            flags=re.IGNORECASE
-        )
-    return mark_safe(title)
+    return highlight(page.title, tokens)
 
 
 @register.simple_tag(takes_context=False)
 def search_results_body(page, tokens):
     """Highlights parts of the body that match with tokens
     to highlight search results."""
-    body_rendered = page.body.stream_block.render_basic(page.body, context={'page': page})
-    bs = BeautifulSoup(body_rendered, features='html.parser')
-    body_text = bs.get_text()
-    text_chunks = []
-    for token in tokens:
-        for match in re.finditer(token, body_text, flags=re.IGNORECASE):
-            text_chunk = '<p>'
-            (start, end) = match.span(0)
-            
-            if start - 200 < 0:
-                start = 0
-            else:
-                text_chunk = '<p>...'
-                
-            text_chunk = text_chunk + \
-                body_text[start:end + 200 + 11].replace(
-                    match.group(0),
-                    '<mark>' + match.group(0) + '</mark>'
-                )
-                
-            if end + 200 > len(body_text):
-                text_chunk = text_chunk + '</p>'
-            else:
-                text_chunk = text_chunk + '...</p>'
-
-            text_chunks.append(text_chunk)
-        
-    if text_chunks:
-        return mark_safe(''.join(text_chunks))
-    return body_text[0:200] + '...'
+    # plain text is extracted from the body when the page is published
+    snippets = highlight_snippets(getattr(page, 'plain_text', ''), tokens)
+    if snippets:
+        return mark_safe(''.join('<p>' + snippet + '</p>' for snippet in snippets))
+    return getattr(page, 'excerpt', '')
@@ -1,3 +1,41 @@
-from django.test import TestCase
+import markdown
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from waggylabs.extensions.markdown import WaggyLabsMarkdownExtenstion
+
+
+class MathPreprocessorTests(SimpleTestCase):
+    """Math is found in the text, but not in code, HTML tags and URLs."""
+
+    def render(self, text):
+        return markdown.markdown(text, extensions=['extra', WaggyLabsMarkdownExtenstion()])
+
+    def test_math(self):
+        self.assertEqual(self.render('a $x$ b'), '<p>a <span>\\(x\\)</span> b</p>')
+
+    def test_indented_code(self):
+        self.assertEqual(
+            self.render('para\n\n    indented code $x$ and \\\\(y\\\\)\n\nafter $z$'),
+            '<p>para</p>\n<pre><code>indented code $x$ and \\\\(y\\\\)\n</code></pre>\n'
+            '<p>after <span>\\(z\\)</span></p>',
+        )
+
+    def test_indented_list_item(self):
+        self.assertEqual(
+            self.render('- item $a$\n\n    continued $b$'),
+            '<ul>\n<li>\n<p>item <span>\\(a\\)</span></p>\n'
+            '<p>continued <span>\\(b\\)</span></p>\n</li>\n</ul>',
+        )
+
+    def test_link_url(self):
+        self.assertEqual(
+            self.render('[link](http://example.com/a$b$c) and $x$'),
+            '<p><a href="http://example.com/a$b$c">link</a> and <span>\\(x\\)</span></p>',
+        )
+
+    def test_inline_html(self):
+        self.assertEqual(
+            self.render('raw <a href="/x$1$y">a</a> and $x$'),
+            '<p>raw <a href="/x$1$y">a</a> and <span>\\(x\\)</span></p>',
+        )
@@ -22,6 +22,7 @@ urlpatterns = [
     path(WAGTAIL_ADMIN_BASE_URL, include(wagtailadmin_urls)),
     path(WAGTAIL_DOCUMENTS_BASE_URL, include(wagtaildocs_urls)),
     path(SEARCH_URL, waggylabs_views.search, name="search"),
+    path(SEARCH_URL + 'autocomplete/', waggylabs_views.autocomplete, name="search_autocomplete"),
     # according to django-simple-captcha docs
     path(CAPTCHA_BASE_URL, include('captcha.urls')),
     path('robots.txt', waggylabs_views.RobotsView.as_view()),
@@ -1 +1 @@
-from .utils import pk_to_markdown, get_tokens_from_query
\ No newline at end of file
+from .utils import pk_to_markdown, get_tokens_from_query, get_date_range, get_specific_pages, markdown_to_text
@@ -0,0 +1,92 @@
+import re
+
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+
+SNIPPET_CONTEXT = getattr(settings, 'WAGGYLABS_SEARCH_SNIPPET_CONTEXT', 200)
+MAX_SNIPPETS = getattr(settings, 'WAGGYLABS_SEARCH_MAX_SNIPPETS', 3)
+MAX_HIGHLIGHT_LENGTH = getattr(settings, 'WAGGYLABS_SEARCH_MAX_HIGHLIGHT_LENGTH', 100000)
+
+
+@lru_cache(maxsize=128)
+def _tokens_regex(tokens):
+    tokens = sorted({token for token in tokens if token}, key=len, reverse=True)
+    if not tokens:
+        return None
+    # longer tokens go first, so that the longest match wins
+    return re.compile('|'.join(re.escape(token) for token in tokens), re.IGNORECASE)
+
+
+def tokens_regex(tokens):
+    """Returns compiled regular expression that matches any of the tokens
+    (case insensitive, regex metacharacters are escaped) or None
+    if there are no tokens."""
+    return _tokens_regex(tuple(tokens))
+
+
+def mark_spans(text, spans, start=0, end=None):
+    """Returns escaped text[start:end] with the (start, end) spans
+    wrapped into <mark> tags. Spans must be sorted and not overlapping."""
+    end = len(text) if end is None else end
+    parts = []
+    position = start
+    for (span_start, span_end) in spans:
+        parts.append(escape(text[position:span_start]))
+        parts.append('<mark>' + escape(text[span_start:span_end]) + '</mark>')
+        position = span_end
+    parts.append(escape(text[position:end]))
+    return ''.join(parts)
+
+
+def highlight(text, tokens):
+    """Returns escaped text with all the matches of the tokens
+    wrapped into <mark> tags."""
+    regex = tokens_regex(tokens)
+    if regex is None:
+        return escape(text)
+    spans = [match.span() for match in regex.finditer(text) if match.end() > match.start()]
+    return mark_safe(mark_spans(text, spans))
+
+
+def highlight_snippets(text, tokens, context=SNIPPET_CONTEXT,
+                       max_snippets=MAX_SNIPPETS, max_length=MAX_HIGHLIGHT_LENGTH):
+    """Returns list of the escaped snippets of the text around the matches
+    of the tokens, with the matches wrapped into <mark> tags. All tokens
+    are matched in one pass over the first max_length characters of the
+    text. Snippets of close matches are merged, but a snippet is never
+    longer than four contexts plus the match, and scanning stops after
+    max_snippets snippets."""
+    regex = tokens_regex(tokens)
+    if regex is None:
+        return []
+    length = min(len(text), max_length)
+    snippets = []  # [start, end, spans]
+    for match in regex.finditer(text, 0, length):
+        (start, end) = match.span()
+        if start == end:
+            continue
+        if snippets and start - context <= snippets[-1][1] and \
+            end + context - snippets[-1][0] <= 4 * context + end - start:
+            snippets[-1][1] = min(end + context, length)
+            snippets[-1][2].append((start, end))
+            continue
+        if snippets and snippets[-1][1] > start:
+            # the previous snippet is too long to include the match
+            snippets[-1][1] = start
+        if len(snippets) == max_snippets:
+            break
+        snippet_start = max(start - context, snippets[-1][1] if snippets else 0)
+        snippets.append([snippet_start, min(end + context, length), [(start, end)]])
+
+    return [
+        mark_safe(
+            ('...' if start > 0 else '') +
+            mark_spans(text, spans, start, end) +
+            ('...' if end < len(text) else '')
+        )
+        for (start, end, spans) in snippets
+    ]
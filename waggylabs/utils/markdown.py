@@ -0,0 +1,112 @@
+import hashlib
+import markdown
+import nh3
+import re
+import threading
+
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.safestring import mark_safe
+
+from wagtailmarkdown.utils import _get_markdown_kwargs, _get_nh3_kwargs
+
+from waggylabs.cache import LRUCache, cache_is_shared, get_cache, get_content_generation
+
+
+# Rendered Markdown is cached by default only if the cache backend is
+# shared between processes, see waggylabs.cache.cache_is_shared
+MARKDOWN_CACHE = getattr(settings, 'WAGGYLABS_MARKDOWN_CACHE', cache_is_shared())
+MARKDOWN_CACHE_TIMEOUT = getattr(settings, 'WAGGYLABS_MARKDOWN_CACHE_TIMEOUT', 60 * 60 * 24 * 7)
+MARKDOWN_LOCAL_CACHE_SIZE = getattr(settings, 'WAGGYLABS_MARKDOWN_LOCAL_CACHE_SIZE', 1024)
+
+# must be increased when the WaggyLabs Markdown extension renders
+# the same Markdown differently, so that the cached HTML is not used
+MARKDOWN_RENDER_VERSION = 4
+
+# wagtail-markdown links to pages, documents and images, which HTML
+# depends on the database content
+RE_OBJECT_LINK = re.compile(r'<:|(?:page|doc|image|media):')
+
+MARKDOWN_LOCAL_CACHE = LRUCache(MARKDOWN_LOCAL_CACHE_SIZE)
+
+# Markdown parsers of the threads, see get_markdown_parser
+_parsers = threading.local()
+
+
+@lru_cache(maxsize=None)
+def markdown_config_version():
+    """Returns hash of the Markdown settings and the render version,
+    which changes when the rendered HTML may change."""
+    config = '{}:{!r}'.format(MARKDOWN_RENDER_VERSION, getattr(settings, 'WAGTAILMARKDOWN', None))
+    return hashlib.md5(config.encode('utf-8')).hexdigest()[:8]
+
+
+def markdown_cache_key(text):
+    """Creates cache key for the HTML of the Markdown text. The key
+    includes the hash of the text (which has page primary key in labels
+    and references, see pk_to_markdown) and Markdown configuration.
+    Content generation is included only if the text links to pages,
+    documents or images, so that other HTML is shared over changes
+    of the published content."""
+    return 'waggylabs:markdown:{}:{}:{}'.format(
+        markdown_config_version(),
+        get_content_generation() if RE_OBJECT_LINK.search(text) else 0,
+        hashlib.sha1(text.encode('utf-8')).hexdigest(),
+    )
+
+
+def get_markdown_parser():
+    """Returns Python-Markdown parser configured with wagtail-markdown
+    settings (WAGTAILMARKDOWN) for the current thread. The parser with
+    all the extensions is created once per thread and reset before each
+    document, since setting up the extensions costs more than rendering
+    short texts, e.g. captions."""
+    parser = getattr(_parsers, 'parser', None)
+    if parser is None:
+        parser = markdown.Markdown(**_get_markdown_kwargs())
+        _parsers.parser = parser
+    return parser
+
+
+@lru_cache(maxsize=None)
+def get_sanitizer_kwargs():
+    """Returns nh3 arguments of wagtail-markdown settings."""
+    return _get_nh3_kwargs()
+
+
+def render_markdown_html(text):
+    """Returns HTML of the Markdown text rendered and sanitized in the same
+    way as wagtail-markdown does, using the parser of the current thread."""
+    converting = getattr(_parsers, 'converting', False)
+    if converting:
+        # Markdown rendered during rendering of other Markdown (e.g. by
+        # a linker) cannot use the thread parser, which is in use
+        parser = markdown.Markdown(**_get_markdown_kwargs())
+    else:
+        parser = get_markdown_parser()
+    _parsers.converting = True
+    try:
+        html = parser.reset().convert(str(text))
+    finally:
+        _parsers.converting = converting
+    return mark_safe(nh3.clean(html, **get_sanitizer_kwargs()))
+
+
+def render_markdown(text, context=None):
+    """Returns HTML of the Markdown text rendered and sanitized as
+    by wagtail-markdown. Rendered HTML is kept in the in-process LRU cache
+    and in the Django cache, so the same text (e.g. caption or table
+    cell) is rendered once per content change."""
+    text = str(text)
+    if not MARKDOWN_CACHE:
+        return render_markdown_html(text)
+    key = markdown_cache_key(text)
+    html = MARKDOWN_LOCAL_CACHE.get(key)
+    if html is None:
+        html = get_cache().get(key)
+        if html is None:
+            html = str(render_markdown_html(text))
+            get_cache().set(key, html, timeout=MARKDOWN_CACHE_TIMEOUT)
+        MARKDOWN_LOCAL_CACHE.set(key, html)
+    return mark_safe(html)
@@ -0,0 +1,97 @@
+import base64
+import json
+
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+
+
+def encode_cursor(value, pk, direction='next'):
+    """Encodes the position in the ordered list, i.e. the value of the
+    ordering field and primary key of the item, into the url-safe string."""
+    if isinstance(value, datetime):
+        value = {'datetime': value.isoformat()}
+    data = json.dumps([value, pk, direction], separators=(',', ':'))
+    return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decodes the cursor created by encode_cursor. Returns tuple
+    (value, pk, direction) or None if the cursor is not valid, e.g. it
+    is changed by hand and has values of other types."""
+    if not cursor:
+        return None
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        data = json.loads(data.decode('utf-8'))
+        if not isinstance(data, list) or len(data) != 3:
+            return None
+        (value, pk, direction) = data
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value['datetime'])
+    except (ValueError, TypeError, KeyError):
+        return None
+    if not isinstance(value, (str, int, float, datetime)) or isinstance(value, bool):
+        return None
+    if not isinstance(pk, int) or isinstance(pk, bool):
+        return None
+    if direction not in ('next', 'previous'):
+        return None
+    return (value, pk, direction)
+
+
+def keyset_page(queryset, order_by, per_page, cursor=None):
+    """Returns the page of the queryset that starts after (or ends before)
+    the position encoded in the cursor. The queryset is ordered by the
+    order_by field (e.g. '-created_at') and the primary key, and
+    filtered by these values instead of OFFSET, so every page is a range
+    scan of the same cost and no COUNT query is needed.
+
+    Returns dictionary with the list of items and the cursors of the
+    previous and next pages (None if there is no such page)."""
+    field = order_by.lstrip('-')
+    descending = order_by.startswith('-')
+    position = decode_cursor(cursor)
+    if position:
+        try:
+            value = queryset.model._meta.get_field(field).to_python(position[0])
+        except (ValidationError, FieldDoesNotExist):
+            # the cursor value does not fit the ordering field,
+            # so the first page is shown
+            position = None
+        else:
+            position = (value,) + position[1:]
+    direction = position[2] if position else 'next'
+    # previous page is fetched in the reversed order and reversed back
+    reverse = descending != (direction == 'previous')
+    if reverse:
+        queryset = queryset.order_by('-' + field, '-pk')
+    else:
+        queryset = queryset.order_by(field, 'pk')
+    if position:
+        (value, pk, __) = position
+        lookup = 'lt' if reverse else 'gt'
+        queryset = queryset.filter(
+            Q(**{field + '__' + lookup: value}) |
+            Q(**{field: value, 'pk__' + lookup: pk})
+        )
+
+    items = list(queryset[:per_page + 1])
+    has_more = len(items) > per_page
+    items = items[:per_page]
+    if direction == 'previous':
+        items.reverse()
+        has_previous, has_next = has_more, True
+    else:
+        has_previous, has_next = position is not None, has_more
+
+    return {
+        'items': items,
+        'previous_cursor': encode_cursor(
+            getattr(items[0], field), items[0].pk, 'previous'
+        ) if has_previous and items else None,
+        'next_cursor': encode_cursor(
+            getattr(items[-1], field), items[-1].pk, 'next'
+        ) if has_next and items else None,
+    }
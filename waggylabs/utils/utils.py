@@ -1,32 +1,58 @@
 import re
 
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+
+from wagtail.models import Page
 from wagtail.search.query import PlainText
 
 
-RE_LABEL = re.compile(r'\\label\{(.+?)\}', re.IGNORECASE)
-RE_REF = re.compile(r'\\ref\{(.+?)\}', re.IGNORECASE)
-RE_EQREF = re.compile(r'\\eqref\{(.+?)\}', re.IGNORECASE)
-RE_CITE = re.compile(r'\\cite\{(.+?)\}', re.IGNORECASE)
-RE_ALL = re.compile(
-    r'(\\label\{(?P<label>.+?)\}|\\ref\{(?P<ref>.+?)\}|\\eqref\{(?P<eqref>.+?)\}|\\cite\{(?P<cite>.+?)\})',
-    re.IGNORECASE
-)
+RE_ALL = re.compile(r'(\\(?:label|ref|eqref|cite)\{)(.+?)\}', re.IGNORECASE)
 def pk_to_markdown(value, pk):
     """Modifies all label, ref, eqref, cite with page primary key
     to avoid collisions when multiple parts from different pages are rendered
-    on one page (e.g. when pages are renedered in list)."""
-    pk = str(pk)
-    for regex in [RE_LABEL, RE_REF, RE_EQREF, RE_CITE]:
-        value = regex.sub(
-            lambda m: (
-                m.group(0).replace(
-                    m.group(1),
-                    ','.join([ref + '-' + pk for ref in m.group(1).split(',')])
-                )
-            ),
-            value
-        )
-    return value
+    on one page (e.g. when pages are renedered in list). All commands
+    are rewritten in one pass, results are memoized per (text, pk)."""
+    return _pk_to_markdown(value, str(pk))
+
+
+@lru_cache(maxsize=256)
+def _pk_to_markdown(value, pk):
+    suffix = '-' + pk
+    # split gives [text, command, keys, text, command, keys, ..., text],
+    # so keys are rewritten without calling Python function per match
+    parts = RE_ALL.split(value)
+    parts[2::3] = [keys.replace(',', suffix + ',') + suffix + '}' for keys in parts[2::3]]
+    return ''.join(parts)
+
+
+
+RE_MARKDOWN_MATH = re.compile(
+    r'\$+[^$\n]+?\$+|\$\$.*?\$\$|\\\[.*?\\\]|\\begin\{(.+?)\}.*?\\end\{\1\}|\\\(.*?\\\)',
+    re.DOTALL
+)
+RE_MARKDOWN_COMMAND = re.compile(r'\\(label|ref|eqref|cite)\{.*?\}')
+RE_MARKDOWN_LINK = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+RE_MARKDOWN_TAG = re.compile(r'<[^>]*>')
+RE_MARKDOWN_EMOJI = re.compile(r':[-+\w]+:')
+RE_MARKDOWN_SYNTAX = re.compile(r'[*_~`#>|\\]+|^\s*(?:[-+]|\d+\.)\s+', re.MULTILINE)
+def markdown_to_text(value):
+    """Returns the words of Markdown text as the reader sees them, i.e.
+    without math, references, link urls, html tags and Markdown syntax.
+    It is much faster than rendering Markdown and is used to extract
+    text for the search index. Math is matched in the same way as in
+    waggylabs.extensions.markdown, escaped \\$ is a dollar sign."""
+    value = value.replace('\\$', '\x00')
+    value = RE_MARKDOWN_MATH.sub(' ', value)
+    value = RE_MARKDOWN_COMMAND.sub(' ', value)
+    value = RE_MARKDOWN_LINK.sub(r'\1', value)
+    value = RE_MARKDOWN_TAG.sub(' ', value)
+    value = RE_MARKDOWN_EMOJI.sub(' ', value)
+    value = RE_MARKDOWN_SYNTAX.sub(' ', value)
+    return ' '.join(value.replace('\x00', '$').split())
 
 
 def get_tokens_from_query(query):
@@ -48,4 +74,46 @@ def get_tokens_from_query(query):
             # any other case, only full string matches the query
             tokens = tokens + [query.query_string]
             
-    return tokens
\ No newline at end of file
+    return tokens
+
+
+def get_date_range(year, month=None, day=None, tzinfo=None):
+    """Returns half-open range [start, end) of aware datetimes covering
+    the year, the month of the year or the day of the month in the given
+    time zone (UTC by default). Month can be the number or the abbreviated
+    name (jan, feb, etc.). Filtering by such range instead of __year,
+    __month, __day lookups lets the database use the index on the datetime
+    field. Raises ValueError for the wrong date."""
+    tzinfo = tzinfo or dt_timezone.utc
+    year = int(year)
+    if month is None:
+        start = datetime(year, 1, 1)
+        end = datetime(year + 1, 1, 1)
+    else:
+        if not str(month).isdigit():
+            month = datetime.strptime(str(month), '%b').month
+        month = int(month)
+        if day is None:
+            start = datetime(year, month, 1)
+            end = datetime(year + month // 12, month % 12 + 1, 1)
+        else:
+            start = datetime(year, month, int(day))
+            end = start + timedelta(days=1)
+    return timezone.make_aware(start, tzinfo), timezone.make_aware(end, tzinfo)
+
+
+def get_specific_pages(pages):
+    """Returns the list of specific pages for the list of (primary key,
+    content type id) pairs in the same order. The pages are fetched in one
+    query per page type without querying the base Page model first."""
+    pks_by_type = {}
+    for (pk, content_type_id) in pages:
+        pks_by_type.setdefault(content_type_id, []).append(pk)
+    specific_pages = {}
+    for (content_type_id, pks) in pks_by_type.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is None:
+            # the page type has been removed from the project
+            model = Page
+        specific_pages.update(model.objects.filter(pk__in=pks).in_bulk())
+    return [specific_pages[pk] for (pk, __) in pages if pk in specific_pages]
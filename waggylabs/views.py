@@ -1,47 +1,39 @@
 from django.conf import settings
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.http import JsonResponse
 from django.shortcuts import render
 from django.views.generic import TemplateView
 
-from wagtail.models import Page, Site
-from wagtail.contrib.search_promotions.models import Query
+from wagtail.models import Site
 from wagtail.search.utils import parse_query_string
 
 from waggylabs.models import WaggyLabsSettings
+from waggylabs.search import autocomplete_pages, get_search_results_page, log_query
 from waggylabs.utils import get_tokens_from_query
 
 
 def search(request):
     # Get search query
-    query_string = request.GET.get('query', None)
+    query_string = request.GET.get('query', '')
     
     # Parse search query
     filters, query = parse_query_string(query_string, operator='or')
     
     
     if query:
-        search_results = Page.objects.live().specific().search(query)
-
         # Log the query so Wagtail can suggest promoted results
-        Query.get(query_string).add_hit()
-    else:
-        search_results = Page.objects.none()
-        
-    search_results = list(search_results)
+        log_query(query_string)
         
     # Pagination
     # Because search_results is not a Queryset object
-    # django-el-pagination is of no use
-    page = request.GET.get('page', None)
+    # django-el-pagination is of no use. Pages of search results
+    # are cached until the published content changes
     settings_wl = WaggyLabsSettings.for_request(request=request)
-    # request.get
-    paginator = Paginator(search_results, settings_wl.search_results_per_page)
-    try:
-        search_results = paginator.page(page)
-    except PageNotAnInteger:
-        search_results = paginator.page(1)
-    except EmptyPage:
-        search_results = paginator.page(paginator.num_pages)
+    search_results = get_search_results_page(
+        query,
+        Site.find_for_request(request),
+        request.GET.get('page', None),
+        settings_wl.search_results_per_page,
+    )
 
     # Render template
     return render(request, 'waggylabs/search/search.html', {
@@ -52,6 +44,14 @@ def search(request):
     })
 
 
+
+def autocomplete(request):
+    """Returns JSON with the titles and urls of the pages
+    for the type-ahead in the search box."""
+    return JsonResponse({
+        'results': autocomplete_pages(request.GET.get('query', ''), request),
+    })
+
 WAGTAIL_ADMIN_BASE_URL =  getattr(settings, 'WAGGYLABS_WAGTAIL_ADMIN_BASE_URL', 'admin/')
 class RobotsView(TemplateView):
     content_type = 'text/plain'
@@ -320,6 +320,55 @@ WAGGYLABS_MENU_ALLOW_REPEATING_PARENTS = True
 
 # Search configuration
 WAGGYLABS_SEARCH_RESULTS_PAGE_SIZE = 10
+# Plain text of the page body is extracted when the page is published
+# to compute reading time and excerpt of the given length
+WAGGYLABS_WORDS_PER_MINUTE = 200
+WAGGYLABS_EXCERPT_LENGTH = 200
+# Search results show up to the given number of snippets of the page
+# text around the matches, scanning only the beginning of long texts
+WAGGYLABS_SEARCH_SNIPPET_CONTEXT = 200
+WAGGYLABS_SEARCH_MAX_SNIPPETS = 3
+WAGGYLABS_SEARCH_MAX_HIGHLIGHT_LENGTH = 100000
+# Autocomplete view returns the given number of pages, results for
+# short queries are cached
+WAGGYLABS_AUTOCOMPLETE_RESULTS = 10
+WAGGYLABS_AUTOCOMPLETE_CACHE_PREFIX_LENGTH = 3
+# Post search counts posts per category and tag over the given number
+# of the most relevant results
+WAGGYLABS_SEARCH_FACET_RESULTS = 1000
+
+# Caching configuration
+# Django cache backend for the WaggyLabs caches and buffers
+WAGGYLABS_CACHE_ALIAS = "default"
+# Full-page output cache for anonymous visitors. Cached pages are
+# invalidated when any page is published, unpublished or moved.
+WAGGYLABS_PAGE_CACHE = bool(int(os.environ.get("WAGGYLABS_PAGE_CACHE", default=0)))
+WAGGYLABS_PAGE_CACHE_TIMEOUT = 60 * 60 * 24
+# Page hits are kept in cache and saved to the database by
+# the flush_hits management command (only with a shared cache backend)
+WAGGYLABS_HIT_COUNT_BUFFERED = bool(int(os.environ.get("WAGGYLABS_HIT_COUNT_BUFFERED", default=0)))
+# Anonymous visitors are identified by the keyed hash of IP and user
+# agent instead of the session, so no session is created for them
+WAGGYLABS_HIT_COUNT_SESSIONLESS = bool(int(os.environ.get("WAGGYLABS_HIT_COUNT_SESSIONLESS", default=0)))
+# Search results are cached for the normalized query and invalidated
+# when any page is published, unpublished or moved. Enable it only with
+# a cache backend shared between processes (CACHES is not set here,
+# so each process has its own local memory cache)
+WAGGYLABS_SEARCH_CACHE = bool(int(os.environ.get("WAGGYLABS_SEARCH_CACHE", default=0)))
+WAGGYLABS_SEARCH_CACHE_TIMEOUT = 60 * 60
+# Rendered Markdown HTML is cached by the hash of the Markdown text
+# in the process memory and in the cache backend. Enable it only with
+# a cache backend shared between processes, see WAGGYLABS_SEARCH_CACHE
+WAGGYLABS_MARKDOWN_CACHE = bool(int(os.environ.get("WAGGYLABS_MARKDOWN_CACHE", default=0)))
+WAGGYLABS_MARKDOWN_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+WAGGYLABS_MARKDOWN_LOCAL_CACHE_SIZE = 1024
+# Search query hits are kept in cache and saved to the database by
+# the flush_search_queries management command (only with a shared cache
+# backend)
+WAGGYLABS_SEARCH_QUERIES_BUFFERED = bool(int(os.environ.get("WAGGYLABS_SEARCH_QUERIES_BUFFERED", default=0)))
+# Search index entries of the saved pages are updated by
+# the search_index_worker management command
+WAGGYLABS_SEARCH_INDEX_QUEUED = bool(int(os.environ.get("WAGGYLABS_SEARCH_INDEX_QUEUED", default=0)))
 
 # Blocks configuration
 WAGGYLABS_CARD_GRID_COLUMNS = 3